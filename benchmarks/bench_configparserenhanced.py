@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- mode: python; py-indent-offset: 4; py-continuation-offset: 4 -*-
+"""
+Benchmarks for the core ConfigParserEnhanced parser.
+
+Synthetic ``.ini`` files are generated for each scenario in ``synthetic_ini.py``
+and these operations are timed on them:
+
+- ``configparser (baseline)``: Loading the file with a vanilla ``ConfigParser``
+  and reading every option.
+- ``configparserdata``: Loading the file into ``configparserdata``.
+- ``parse_section``: Parsing the most expensive section of the scenario.
+- ``parse_all_sections``: Parsing every section.
+- ``unroll_to_str``: Writing out all of the parsed sections.
+- ``assert_file_all_sections_handled``: Checking every section for unhandled options.
+
+Each operation is run ``--repeat`` times on a fresh parser and the best time is
+reported along with the throughput (options processed per second, where an option
+that is reached through several ``use`` paths counts each time it is processed)
+and the peak memory allocated by the operation (measured by :py:mod:`tracemalloc`
+in a separate run).
+
+Usage:
+
+.. code-block:: bash
+
+    python3 benchmarks/bench_configparserenhanced.py
+    python3 benchmarks/bench_configparserenhanced.py --scenario deep --scenario fanin --scale 4
+    python3 benchmarks/bench_configparserenhanced.py --json bench.json
+"""
+from __future__ import print_function
+
+import argparse
+import configparser
+import contextlib
+import io
+import json
+import math
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(1, str(Path(__file__).resolve().parent))
+sys.path.insert(1, str(Path(__file__).resolve().parent.parent / "src"))
+
+from configparserenhanced import ConfigParserEnhanced
+import synthetic_ini
+
+# ===========================================================
+#   H E L P E R   F U N C T I O N S   A N D   C L A S S E S
+# ===========================================================
+
+
+
+class BenchmarkParser(ConfigParserEnhanced):
+    """Parser used by the benchmarks, which handles the ``envvar-set`` operation."""
+
+    @ConfigParserEnhanced.operation_handler
+    def handler_envvar_set(self, section_name, handler_parameters) -> int:
+        envvars = handler_parameters.data_shared.setdefault("envvars", [])
+        envvars.append((handler_parameters.params[0], handler_parameters.value))
+        return 0
+
+
+
+def new_parser(filename, load=True) -> BenchmarkParser:
+    """Create a benchmark parser, optionally loading the ``.ini`` file."""
+    parser = BenchmarkParser(filename)
+    parser.exception_control_level = 0
+    if load:
+        parser.configparserdata
+    return parser
+
+
+def vanilla_load(filename) -> int:
+    """Load a file with a vanilla ``ConfigParser`` and read every option."""
+    parser = configparser.ConfigParser(allow_no_value=True, default_section="BENCHMARK-NO-DEFAULT")
+    parser.optionxform = str
+    parser.read(filename)
+
+    output = 0
+    for section in parser.sections():
+        for _ in parser.items(section, raw=True):
+            output += 1
+    return output
+
+
+def options_processed(filename, sections) -> int:
+    """Count the options processed by parsing ``sections`` as root sections.
+
+    The ``use`` links are followed in ``configparserdata`` the same way the parser
+    walks them: the ``DEFAULT`` section is processed first, every visit of a section
+    (including repeated visits through ``use``) counts all of the section's options
+    and a ``use`` of a section that is already being processed is skipped. Only
+    ``configparserdata`` is used so that the count is the same for every release of
+    the parser being benchmarked.
+    """
+    parser = new_parser(filename)
+    configparserdata = parser.configparserdata
+
+    def walk(section, processed_sections) -> int:
+        options = configparserdata[section]
+        output = len(options)
+        processed_sections.add(section)
+        for key in options:
+            tokens = key.split()
+            if len(tokens) > 1 and tokens[0] == "use" and tokens[1] not in processed_sections:
+                output += walk(tokens[1], processed_sections)
+        processed_sections.remove(section)
+        return output
+
+    output = 0
+    for section in sections:
+        if configparserdata.has_section(parser.default_section_name):
+            output += walk(parser.default_section_name, set())
+        output += walk(section, set())
+    return output
+
+
+def measure(setup, run, repeat) -> tuple:
+    """Time an operation and measure its peak memory use.
+
+    Args:
+        setup (Callable): Creates the state passed to ``run``. Not timed.
+        run (Callable): The operation to measure.
+        repeat (int): The number of times to time the operation.
+
+    Returns:
+        tuple: ``(best_seconds, peak_bytes)``
+    """
+    best = math.inf
+    for _ in range(repeat):
+        state = setup()
+        time_start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - time_start)
+
+    state = setup()
+    tracemalloc.start()
+    try:
+        run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak
+
+
+def assert_all_handled(parser):
+    # Unhandled options are printed, which we don't want mixed into the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.assert_file_all_sections_handled()
+
+
+def parse_all(filename) -> BenchmarkParser:
+    parser = new_parser(filename)
+    parser.parse_all_sections()
+    return parser
+
+
+def benchmark_scenario(scenario, scale, repeat, workdir) -> list:
+    """Run the benchmarks for a scenario.
+
+    Returns:
+        list: A list of result ``dict`` objects, one per operation.
+    """
+    filename = os.path.join(workdir, f"bench-{scenario}.ini")
+    target_section = synthetic_ini.write(filename, scenario, scale)
+
+    options_file = vanilla_load(filename)
+    sections_all = new_parser(filename).configparserdata.sections()
+
+    operations = [
+        ("configparser (baseline)", lambda: filename, vanilla_load, options_file),
+        (
+            "configparserdata", lambda: new_parser(filename, load=False), lambda p: p.configparserdata,
+            options_file
+        ),
+        (
+            f"parse_section({target_section})", lambda: new_parser(filename),
+            lambda p: p.parse_section(target_section),
+            options_processed(filename, [target_section])
+        ),
+        (
+            "parse_all_sections", lambda: new_parser(filename), lambda p: p.parse_all_sections(),
+            options_processed(filename, sections_all)
+        ),
+        ("unroll_to_str", lambda: parse_all(filename), lambda p: p.unroll_to_str(), options_file),
+        (
+            "assert_file_all_sections_handled", lambda: new_parser(filename), assert_all_handled,
+            options_processed(filename, sections_all)
+        ),
+    ]
+
+    output = []
+    for name, setup, run, options in operations:
+        seconds, peak = measure(setup, run, repeat)
+        output.append(
+            {
+                "scenario": scenario,
+                "operation": name,
+                "seconds": seconds,
+                "options": options,
+                "options_per_second": options / seconds if seconds > 0 else math.inf,
+                "peak_bytes": peak,
+            }
+        )
+    return output
+
+
+def format_report(results) -> str:
+    """Format the benchmark results as a table."""
+    header = ("scenario", "operation", "best ms", "options", "options/s", "peak KiB")
+    rows = [
+        (
+            x["scenario"],
+            x["operation"],
+            f"{x['seconds'] * 1000.0:.3f}",
+            f"{x['options']}",
+            f"{x['options_per_second']:,.0f}",
+            f"{x['peak_bytes'] / 1024.0:,.1f}",
+        ) for x in results
+    ]
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+
+    def format_row(row):
+        # Left-align the names and right-align the numbers.
+        cells = [x.ljust(w) if i < 2 else x.rjust(w) for i, (x, w) in enumerate(zip(row, widths))]
+        return "  ".join(cells)
+
+    lines = [format_row(header), "  ".join("-" * w for w in widths)]
+    lines += [format_row(row) for row in rows]
+    return "\n".join(lines)
+
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ConfigParserEnhanced parser.")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(synthetic_ini.SCENARIOS.keys()),
+        help="Scenario to run (may be repeated). Default: all scenarios."
+    )
+    parser.add_argument(
+        "--scale", type=int, default=1, help="Size multiplier for the .ini files (default: 1)."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of timed runs per operation (default: 3)."
+    )
+    parser.add_argument("--json", help="Also write the results to this file as JSON.")
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenario if args.scenario else list(synthetic_ini.SCENARIOS.keys())
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for scenario in scenarios:
+            results += benchmark_scenario(scenario, args.scale, args.repeat, workdir)
+
+    print(format_report(results))
+
+    if args.json is not None:
+        with open(args.json, "w") as ofp:
+            json.dump(results, ofp, indent=2)
+
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
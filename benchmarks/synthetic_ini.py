@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- mode: python; py-indent-offset: 4; py-continuation-offset: 4 -*-
+"""
+Generators for synthetic ``.ini`` files used by the ConfigParserEnhanced benchmarks.
+
+Each *scenario* stresses a different part of the parser:
+
+- ``wide``     : A few sections with many plain ``key: value`` options (generic handler).
+- ``deep``     : A long chain of sections where each one ``use``-es the previous one.
+- ``diamond``  : Layers of sections where every section ``use``-es every section in the
+  layer below it, so lower sections are reached through many paths.
+- ``fanin``    : Many leaf sections that all ``use`` the same set of shared hub sections.
+- ``defaults`` : A large ``DEFAULT`` section, which is parsed into every root section.
+- ``quoted``   : Long quoted option keys that must be tokenized with ``shlex``.
+
+Options other than the plain ``key: value`` options in ``wide`` use the
+``envvar-set`` operation, which is handled by the benchmark parser so that
+``assert_file_all_sections_handled()`` has work to do without reporting errors.
+
+Usage:
+
+.. code-block:: bash
+
+    python3 benchmarks/synthetic_ini.py --scenario diamond --scale 2 -o diamond.ini
+"""
+from __future__ import print_function
+
+import argparse
+import sys
+
+# ===============================
+#   S C E N A R I O S
+# ===============================
+
+
+
+def _section(name, options, uses=()):
+    """Generate the text of one section.
+
+    Args:
+        name (str): The section name.
+        options (list): A list of ``(key, value)`` tuples.
+        uses (iterable): Names of sections to ``use`` before the options.
+
+    Returns:
+        list: The lines of the section.
+    """
+    lines = [f"[{name}]"]
+    lines += [f"use {x}" for x in uses]
+    lines += [f"{k}: {v}" for k, v in options]
+    lines.append("")
+    return lines
+
+
+def _envvar_options(prefix, count):
+    """Generate ``count`` options handled by the ``envvar-set`` operation."""
+    return [(f"envvar-set {prefix}_VAR_{i:05d}", f"/opt/{prefix.lower()}/value/{i}") for i in range(count)]
+
+
+def generate_wide(scale=1) -> tuple:
+    """A few sections with many plain ``key: value`` options each."""
+    num_sections = 10
+    num_options = 200 * scale
+    lines = []
+    for s in range(num_sections):
+        options = [(f"key_{s:03d}_{i:05d}", f"value {s} {i}") for i in range(num_options)]
+        lines += _section(f"WIDE-{s:03d}", options)
+    return lines, f"WIDE-{num_sections - 1:03d}"
+
+
+def generate_deep(scale=1) -> tuple:
+    """A chain of sections where each section ``use``-es the previous one."""
+    depth = 50 * scale
+    lines = []
+    for s in range(depth):
+        uses = [f"DEEP-{s - 1:05d}"] if s > 0 else []
+        lines += _section(f"DEEP-{s:05d}", _envvar_options(f"DEEP{s}", 5), uses)
+    return lines, f"DEEP-{depth - 1:05d}"
+
+
+def generate_diamond(scale=1) -> tuple:
+    """Layers of sections where each section ``use``-es all sections in the layer below."""
+    num_layers = 5
+    width = 3 + scale
+    lines = []
+    for layer in range(num_layers):
+        for w in range(width):
+            uses = [f"DIAMOND-{layer - 1}-{x}" for x in range(width)] if layer > 0 else []
+            lines += _section(f"DIAMOND-{layer}-{w}", _envvar_options(f"DIAMOND{layer}{w}", 10), uses)
+    return lines, f"DIAMOND-{num_layers - 1}-0"
+
+
+def generate_fanin(scale=1) -> tuple:
+    """Many leaf sections that all ``use`` the same shared hub sections."""
+    num_hubs = 10
+    num_leaves = 100 * scale
+    lines = []
+    for h in range(num_hubs):
+        lines += _section(f"HUB-{h:03d}", _envvar_options(f"HUB{h}", 20))
+    for leaf in range(num_leaves):
+        uses = [f"HUB-{h:03d}" for h in range(num_hubs)]
+        lines += _section(f"LEAF-{leaf:05d}", _envvar_options(f"LEAF{leaf}", 5), uses)
+    return lines, f"LEAF-{num_leaves - 1:05d}"
+
+
+def generate_defaults(scale=1) -> tuple:
+    """A large ``DEFAULT`` section that gets parsed into every root section."""
+    num_sections = 50 * scale
+    lines = _section("DEFAULT", _envvar_options("DEFAULT", 200))
+    for s in range(num_sections):
+        lines += _section(f"SECTION-{s:05d}", _envvar_options(f"SECTION{s}", 5))
+    return lines, f"SECTION-{num_sections - 1:05d}"
+
+
+def generate_quoted(scale=1) -> tuple:
+    """Sections whose option keys contain long quoted parameters."""
+    num_sections = 50 * scale
+    num_options = 40
+    padding = " ".join(["word"] * 10)
+    lines = []
+    for s in range(num_sections):
+        options = [
+            (f"envvar-set 'QUOTED {s} {i} {padding}' \"uniq {i}\"", f"value {i}") for i in range(num_options)
+        ]
+        lines += _section(f"QUOTED-{s:05d}", options)
+    return lines, f"QUOTED-{num_sections - 1:05d}"
+
+
+SCENARIOS = {
+    "wide": generate_wide,
+    "deep": generate_deep,
+    "diamond": generate_diamond,
+    "fanin": generate_fanin,
+    "defaults": generate_defaults,
+    "quoted": generate_quoted,
+}
+
+
+def generate(scenario, scale=1) -> tuple:
+    """Generate the text of a synthetic ``.ini`` file.
+
+    Args:
+        scenario (str): The name of the scenario (a key of ``SCENARIOS``).
+        scale (int): Multiplies the size of the generated file.
+
+    Returns:
+        tuple: A tuple ``(text, target_section)`` where ``text`` is the contents of the
+            ``.ini`` file and ``target_section`` is the most expensive section to parse.
+
+    Raises:
+        KeyError: If ``scenario`` is not a known scenario.
+    """
+    lines, target_section = SCENARIOS[scenario](scale)
+    return "\n".join(lines), target_section
+
+
+def write(filename, scenario, scale=1) -> str:
+    """Write a synthetic ``.ini`` file.
+
+    Args:
+        filename (str): The file to write.
+        scenario (str): The name of the scenario (a key of ``SCENARIOS``).
+        scale (int): Multiplies the size of the generated file.
+
+    Returns:
+        str: The target section of the scenario (see :py:func:`generate`).
+    """
+    text, target_section = generate(scenario, scale)
+    with open(filename, "w") as ofp:
+        ofp.write(text)
+    return target_section
+
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic .ini file.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS.keys()), required=True)
+    parser.add_argument("--scale", type=int, default=1, help="Size multiplier (default: 1).")
+    parser.add_argument("-o", "--output", required=True, help="The .ini file to write.")
+    args = parser.parse_args(argv)
+
+    target_section = write(args.output, args.scenario, args.scale)
+    print(f"Wrote `{args.output}` (target section: `{target_section}`)")
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
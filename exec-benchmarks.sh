@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+
+# Source the common helpers script
+source scripts/common.bash
+
+printf "${yellow}"
+print_banner "Benchmarks - Started"
+printf "${normal}\n"
+
+# Extra arguments are passed to the benchmark runner, e.g.:
+#   ./exec-benchmarks.sh --scenario deep --scale 4 --json bench.json
+execute_command_checked "python3 benchmarks/bench_configparserenhanced.py $*"
+
+printf "${yellow}"
+print_banner "Benchmarks - Done"
+printf "${normal}\n"
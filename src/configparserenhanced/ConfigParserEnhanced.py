@@ -85,15 +85,29 @@ Todo:
 """
 from __future__ import print_function
 
+import collections
+import concurrent.futures
 import configparser
+import contextlib
+import copy
+import functools
+import hashlib
 import inspect
 import io
+import json
+import locale
+import marshal
+import mmap
 import os
 from pathlib import Path
+import pickle
 from pprint import pprint
 import re
 import shlex
+import stat
 import sys
+import tempfile
+import time
 
 try:
     # @final decorator, requires Python 3.8.x
@@ -105,6 +119,8 @@ from .Debuggable import Debuggable
 from .ExceptionControl import ExceptionControl
 from .HandlerParameters import HandlerParameters
 from .TypedProperty import typed_property
+from .UseGraph import UseGraph
+from .version import __version__
 
 # Check for minimum required Python version
 MIN_PYTHON = (3, 6)
@@ -115,6 +131,98 @@ if sys.version_info < MIN_PYTHON: # pragma: no cover
 #  S U P P O R T   F U N C T I O N S   A N D   C L A S S E S
 # ============================================================
 
+# Maximum number of distinct option keys held by the tokenizer cache.
+OPTION_KEY_CACHE_SIZE = 8192
+
+# Characters that require ``shlex`` to tokenize an option key (quotes and escapes).
+_re_option_key_needs_shlex = re.compile(r"['\"\\]")
+
+# The whitespace characters that ``shlex.split`` splits on.
+_re_option_key_whitespace = re.compile(r"[ \t\r\n]+")
+
+# Tokens matching this can be an *operation*.
+_re_operation_token = re.compile(r"^[\w\-]+$")
+
+
+
+@functools.lru_cache(maxsize=OPTION_KEY_CACHE_SIZE)
+def _tokenize_option_key_cached(option_key: str) -> tuple:
+    """Tokenize an option key and classify its first token.
+
+    Keys that contain no quote or escape characters are split directly on
+    whitespace, which gives the same result as ``shlex.split`` without the
+    overhead of the ``shlex`` lexer. All other keys are handed to ``shlex.split``.
+
+    Results are memoized (bounded by ``OPTION_KEY_CACHE_SIZE``) since the same
+    keys show up in many sections and sections are revisited through ``use``.
+
+    Args:
+        option_key (str): The (stripped) option key.
+
+    Returns:
+        tuple: A tuple ``(tokens, is_operation)`` where ``tokens`` is a ``tuple``
+            of ``str`` and ``is_operation`` is ``True`` if the first token is
+            a candidate *operation* (i.e., only word characters and dashes).
+    """
+    if _re_option_key_needs_shlex.search(option_key) is None:
+        tokens = tuple(x for x in _re_option_key_whitespace.split(option_key) if x != "")
+    else:
+        tokens = tuple(shlex.split(option_key))
+
+    is_operation = len(tokens) > 0 and _re_operation_token.match(tokens[0]) is not None
+    return (tokens, is_operation)
+
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_type_restriction(type_restriction) -> tuple:
+    """Convert a type restriction into a ``tuple`` of types for ``isinstance()``.
+
+    It's pretty common for someone to enter ``(int, None)`` to ``isinstance()``
+    which is wrong, ``None`` isn't a type, so ``None`` is replaced by ``type(None)``.
+    The results are cached since the parser validates the same few type
+    restrictions over and over.
+
+    Args:
+        type_restriction (type, tuple): A type or a tuple of types (and ``None``).
+
+    Returns:
+        tuple: A ``tuple`` of types.
+    """
+    if not isinstance(type_restriction, tuple):
+        type_restriction = (type_restriction, )
+    return tuple(x if x is not None else type(None) for x in type_restriction)
+
+
+
+# Default maximum number of records kept in the ``_loginfo`` trace (see ``loginfo_capacity``).
+LOGINFO_CAPACITY_DEFAULT = 10000
+
+# Maximum number of released ``HandlerParameters`` objects the parser keeps for reuse.
+HANDLER_PARAMETERS_POOL_SIZE = 64
+
+# Maximum number of threads used to read the ``.ini`` files when ``concurrent_load`` is set.
+CONCURRENT_LOAD_MAX_WORKERS = 8
+
+# Valid values of ``parse_engine``.
+PARSE_ENGINES = ("recursive", "iterative")
+
+# Version of the layout of the entries in the on-disk parse cache (see ``cache_dir``).
+# Bump this if the contents of the cache entries change.
+PARSE_CACHE_FORMAT_VERSION = 1
+
+# Snapshot of a loaded ``.ini`` file used to detect changes to it. The contents of
+# the file are not kept (see ``ConfigParserEnhanced._read_inifile``).
+_InifileState = collections.namedtuple("_InifileState", ["mtime_ns", "size", "digest"])
+
+# Compiled option of a section (see ``ConfigParserEnhanced._get_section_plan``). ``op``,
+# ``params``, ``handler_op`` and ``dispatch_entry`` are ``None`` for options whose key
+# can't be an operation. ``handler_op`` and ``dispatch_entry`` are also ``None`` if the
+# handler is looked up by an override of ``_locate_handler_method`` on every visit.
+_SectionPlanEntry = collections.namedtuple(
+    "_SectionPlanEntry", ["key", "value", "op", "params", "handler_op", "dispatch_entry"]
+)
+
 
 
 class AmbiguousHandlerError(Exception):
@@ -129,6 +237,421 @@ class AmbiguousHandlerError(Exception):
 
 
 
+class InMemorySource(object):
+    """A ``.ini`` file whose contents are held in memory instead of on disk.
+
+    The contents are read once when the source is created (streams are read
+    to the end) and never change afterwards. Each source is identified by its
+    :py:attr:`name`, which defaults to a name derived from the SHA-256 hash of
+    the contents so the same text always gets the same name. The name is used
+    in place of a path in error messages and by ``ConfigParser`` as the source
+    of the sections.
+
+    Example:
+
+        .. code-block:: python
+            :linenos:
+
+            parser = ConfigParserEnhanced(InMemorySource("[SECTION]\\nkey: value\\n"))
+            parser = ConfigParserEnhanced(["base.ini", InMemorySource(text, name="generated")])
+
+    Args:
+        content (str,bytes,io.IOBase): The contents of the ``.ini`` file. Text is
+            encoded as UTF-8 (and decoded as UTF-8 by the parser). Bytes are decoded
+            using the parser's ``encoding``.
+        name (str): The name of the source. If ``None`` then the name is
+            ``<in-memory:DIGEST>`` where ``DIGEST`` is the start of the hash of
+            the contents.
+
+    Raises:
+        TypeError: If ``content`` is not a ``str``, ``bytes`` or a stream.
+    """
+
+    def __init__(self, content, name=None):
+        self._encoding = None
+        if isinstance(content, io.IOBase):
+            content = content.read()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+            self._encoding = 'utf-8'
+        if not isinstance(content, (bytes, bytearray)):
+            raise TypeError(
+                "ERROR: InMemorySource content must be a `str`, `bytes` or an `io` stream, "
+                f"not `{type(content).__name__}`."
+            )
+        if name is not None and not isinstance(name, str):
+            raise TypeError("ERROR: InMemorySource name must be a `str`.")
+
+        self._content = bytes(content)
+        self._digest = hashlib.sha256(self._content).hexdigest()
+        self._name = name if name is not None else f"<in-memory:{self._digest[:16]}>"
+
+    @property
+    def content(self) -> bytes:
+        """The contents of the source (``bytes``)."""
+        return self._content
+
+    @property
+    def digest(self) -> str:
+        """The SHA-256 hash (hex digest) of the contents."""
+        return self._digest
+
+    @property
+    def encoding(self) -> str:
+        """The encoding of the contents (``'utf-8'`` if they were given as text, otherwise ``None``)."""
+        return self._encoding
+
+    @property
+    def name(self) -> str:
+        """The name that identifies the source."""
+        return self._name
+
+    def __eq__(self, other):
+        if not isinstance(other, InMemorySource):
+            return NotImplemented
+        return (self._name, self._digest) == (other._name, other._digest)
+
+    def __hash__(self):
+        return hash((self._name, self._digest))
+
+    def __repr__(self):
+        return f"InMemorySource(name={self._name!r}, size={len(self._content)})"
+
+    def __str__(self):
+        return self._name
+
+
+
+# In ``lazy_load`` mode, files at least this large (in bytes) are scanned and hashed
+# through ``mmap`` and their contents are not held in memory.
+LAZY_LOAD_MMAP_THRESHOLD = 1024 * 1024
+
+# Section headers as matched by ``ConfigParser.SECTCRE``, limited to the first column.
+_re_section_header_bytes = re.compile(rb"^\[(.+)\]", re.MULTILINE)
+
+# Location of one section's text in a ``.ini`` file (see ``_LazyConfigParser``).
+_LazySectionChunk = collections.namedtuple(
+    "_LazySectionChunk", ["source_id", "offset", "length", "lineno", "digest"]
+)
+
+
+
+class _LazyConfigParser(configparser.ConfigParser):
+    """A :class:`ConfigParser` that only parses sections when they are needed.
+
+    Each ``.ini`` file is scanned once when it is added to build an index of the
+    byte offset, length and starting line number of every section in it. The text
+    of a section is only parsed the first time something asks for the section's
+    contents, so loading a file and parsing a single section (plus its ``use``
+    closure) does not pay for parsing the rest of the file.
+
+    Sections that show up in more than one file are merged in file order, the same
+    as ``read()``. Errors such as ``DuplicateOptionError`` and ``DuplicateSectionError``
+    (from the same section appearing twice in one file) are raised when the affected
+    section is loaded. Text before the first section header and the ``default_section``
+    are loaded right away since they affect every section.
+
+    Note:
+        Section headers must start in the first column, which is how ``ConfigParser``
+        writes them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_parser_args = (args, kwargs)
+        self._lazy_sources = []
+        self._lazy_index = collections.OrderedDict()
+        self._lazy_pending = set()
+        self._lazy_loaded = []
+        self._lazy_duplicates = {}
+        self._lazy_default_digests = []
+
+    def add_lazy_source(self, source, content=None, encoding='utf-8'):
+        """Index the sections of a ``.ini`` file so they can be loaded later.
+
+        Args:
+            source (str): The path to the ``.ini`` file.
+            content (bytes): The contents of the file. If ``None`` then the file is
+                memory mapped to scan it and sections are read from the file when
+                they are loaded.
+            encoding (str): The encoding of the file. If ``None`` then the locale's
+                preferred encoding is used. The section headers are found in the raw
+                bytes, so the encoding must be ASCII compatible. Default: ``'utf-8'``
+        """
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+
+        source_id = len(self._lazy_sources)
+        self._lazy_sources.append((source, content, encoding))
+
+        with self._lazy_open_source(source_id) as buffer:
+            chunks = self._lazy_scan_source(source_id, buffer)
+
+        sections_in_source = set()
+        for header, chunk in chunks:
+            if header is None or header == self.default_section:
+                self._lazy_default_digests.append(chunk.digest)
+                self._lazy_load_chunk(chunk)
+                continue
+
+            if header in sections_in_source:
+                self._lazy_duplicates.setdefault(header, (source, chunk.lineno + 1))
+            sections_in_source.add(header)
+
+            self._lazy_index.setdefault(header, []).append(chunk)
+            self._lazy_pending.add(header)
+        return
+
+    def changed_sections(self, other) -> set:
+        """Find the sections whose text differs between this parser and ``other``.
+
+        Args:
+            other (_LazyConfigParser): The parser to compare against.
+
+        Returns:
+            set: The names of the sections that were added, removed or changed. If the
+                ``default_section`` changed then all sections are returned.
+        """
+        sections_self = set(self._lazy_index.keys())
+        sections_other = set(other._lazy_index.keys())
+
+        if self._lazy_default_digests != other._lazy_default_digests:
+            return sections_self | sections_other
+
+        output = sections_self ^ sections_other
+        for section in sections_self & sections_other:
+            digests_self = [x.digest for x in self._lazy_index[section]]
+            digests_other = [x.digest for x in other._lazy_index[section]]
+            if digests_self != digests_other:
+                output.add(section)
+        return output
+
+    # -------------------------------------
+    #   C O N F I G P A R S E R   A P I
+    # -------------------------------------
+
+    def sections(self):
+        output = list(self._lazy_index.keys())
+        output += [x for x in self._sections.keys() if x not in self._lazy_index]
+        return output
+
+    def has_section(self, section):
+        return section in self._lazy_index or super().has_section(section)
+
+    def add_section(self, section):
+        self._lazy_load_section(section)
+        return super().add_section(section)
+
+    def remove_section(self, section):
+        existed = section in self._lazy_index
+        self._lazy_index.pop(section, None)
+        self._lazy_pending.discard(section)
+        self._lazy_duplicates.pop(section, None)
+        return super().remove_section(section) or existed
+
+    def options(self, section):
+        self._lazy_load_section(section)
+        return super().options(section)
+
+    def has_option(self, section, option):
+        self._lazy_load_section(section)
+        return super().has_option(section, option)
+
+    def items(self, *args, **kwargs):
+        if len(args) > 0:
+            self._lazy_load_section(args[0])
+        elif "section" in kwargs:
+            self._lazy_load_section(kwargs["section"])
+        else:
+            self._lazy_load_all()
+        return super().items(*args, **kwargs)
+
+    def write(self, *args, **kwargs):
+        self._lazy_load_all()
+        return super().write(*args, **kwargs)
+
+    def _unify_values(self, section, vars):
+        self._lazy_load_section(section)
+        return super()._unify_values(section, vars)
+
+    def __getitem__(self, key):
+        self._lazy_load_section(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._lazy_load_section(key)
+        return super().__setitem__(key, value)
+
+    def __iter__(self):
+        return iter([self.default_section] + self.sections())
+
+    def __len__(self):
+        return len(self.sections()) + 1
+
+    # -------------------------------------
+    #   H E L P E R S   ( P R I V A T E )
+    # -------------------------------------
+
+    @contextlib.contextmanager
+    def _lazy_open_source(self, source_id):
+        """Get a buffer containing the contents of a source file.
+
+        This is the ``content`` that was provided for the source if there was one,
+        otherwise the file is memory mapped.
+        """
+        source, content, _ = self._lazy_sources[source_id]
+        if content is not None:
+            yield content
+            return
+
+        with open(source, 'rb') as ifp:
+            if os.fstat(ifp.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(ifp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def _lazy_scan_source(self, source_id, buffer) -> list:
+        """Scan a buffer for section headers.
+
+        Returns:
+            list: A list of ``(header, _LazySectionChunk)`` tuples in file order. The
+                text before the first header (if any) has a ``header`` of ``None``.
+        """
+        output = []
+        encoding = self._lazy_sources[source_id][2]
+
+        offsets = [(None, 0)]
+        for match in _re_section_header_bytes.finditer(buffer):
+            offsets.append((match.group(1).decode(encoding), match.start()))
+        if len(offsets) > 1 and offsets[1][1] == 0:
+            del offsets[0]
+
+        buffer_size = len(buffer)
+        lineno = 0
+        for i, (header, offset) in enumerate(offsets):
+            end = offsets[i + 1][1] if i + 1 < len(offsets) else buffer_size
+            text = buffer[offset : end]
+            digest = hashlib.sha256(text).hexdigest()
+            output.append((header, _LazySectionChunk(source_id, offset, end - offset, lineno, digest)))
+            lineno += text.count(b"\n")
+
+        return output
+
+    def _lazy_read_chunk(self, chunk) -> bytes:
+        """Get the text of a chunk, checking that it has not changed since it was indexed."""
+        source, content, _ = self._lazy_sources[chunk.source_id]
+        if content is not None:
+            return content[chunk.offset : chunk.offset + chunk.length]
+
+        with open(source, 'rb') as ifp:
+            ifp.seek(chunk.offset)
+            text = ifp.read(chunk.length)
+
+        if hashlib.sha256(text).hexdigest() != chunk.digest:
+            raise IOError(f"ERROR: `{source}` was modified after it was loaded. Call refresh() to reload it.")
+        return text
+
+    def _lazy_load_chunk(self, chunk):
+        """Parse a chunk of text and merge it into this parser.
+
+        Only the text of the chunk is parsed, and the line numbers of parsing errors
+        are moved by the chunk's starting line so they match the file. Sections are
+        parsed with a scratch parser so that ``ConfigParser`` only joins multi-line
+        values for the new section rather than for every section loaded so far.
+        """
+        source, _, encoding = self._lazy_sources[chunk.source_id]
+        text = self._lazy_read_chunk(chunk)
+
+        args, kwargs = self._lazy_parser_args
+        scratch = configparser.ConfigParser(*args, **kwargs)
+        scratch.optionxform = self.optionxform
+
+        try:
+            with io.TextIOWrapper(io.BytesIO(text), encoding=encoding) as ifp:
+                scratch.read_file(ifp, source=source)
+        except (configparser.ParsingError, configparser.DuplicateOptionError,
+                configparser.DuplicateSectionError) as ex:
+            raise self._lazy_move_error_lineno(ex, chunk.lineno) from None
+
+        self._defaults.update(scratch._defaults)
+        for section in scratch._sections.keys():
+            if section not in self._sections:
+                configparser.RawConfigParser.add_section(self, section)
+            self._sections[section].update(scratch._sections[section])
+        return
+
+    @staticmethod
+    def _lazy_move_error_lineno(ex, lineno_offset):
+        """Get a copy of a ``ConfigParser`` error with ``lineno_offset`` added to its line numbers."""
+        if isinstance(ex, configparser.MissingSectionHeaderError):
+            return configparser.MissingSectionHeaderError(ex.source, ex.lineno + lineno_offset, ex.line)
+        if isinstance(ex, configparser.ParsingError):
+            output = configparser.ParsingError(ex.source)
+            for lineno, line in ex.errors:
+                output.append(lineno + lineno_offset, line)
+            return output
+        if ex.lineno is None:
+            return ex
+        if isinstance(ex, configparser.DuplicateOptionError):
+            return configparser.DuplicateOptionError(
+                ex.section, ex.option, ex.source, ex.lineno + lineno_offset
+            )
+        return configparser.DuplicateSectionError(ex.section, ex.source, ex.lineno + lineno_offset)
+
+    def _lazy_load_section(self, section):
+        """Load a section if it hasn't been loaded yet."""
+        if section not in self._lazy_pending:
+            return
+
+        if section in self._lazy_duplicates:
+            source, lineno = self._lazy_duplicates[section]
+            raise configparser.DuplicateSectionError(section, source, lineno)
+
+        for chunk in self._lazy_index[section]:
+            self._lazy_load_chunk(chunk)
+
+        self._lazy_pending.discard(section)
+        self._lazy_loaded.append(section)
+        return
+
+    def _lazy_load_all(self):
+        """Load all sections that haven't been loaded yet."""
+        for section in list(self._lazy_index.keys()):
+            self._lazy_load_section(section)
+        return
+
+
+
+def _parse_sections_worker(parser, sections) -> dict:
+    """Process-pool worker used by :py:meth:`ConfigParserEnhanced.parse_all_sections`.
+
+    Parses each root section in ``sections`` *without* calling ``handler_finalize``.
+    The finalize handler is called later by the owning process once the results
+    have been merged so that any state saved by it ends up in the owner.
+
+    Args:
+        parser (ConfigParserEnhanced): A copy of the parser that owns the sections.
+        sections (list): The root sections to parse.
+
+    Returns:
+        dict: A dictionary of ``{ section: (data, data_shared, closure) }`` where
+            ``data`` is the section's parsed options, ``data_shared`` is the
+            ``data_shared`` from the parse and ``closure`` is the set of sections
+            that were visited.
+    """
+    output = {}
+    for section in sections:
+        data_shared = parser.parse_section(section, finalize=False)
+        output[section] = (
+            parser.configparserenhanceddata.data[section],
+            data_shared,
+            parser.configparserenhanceddata._section_closures[section],
+        )
+    return output
+
+
+
 # ===============================
 #   M A I N   C L A S S
 # ===============================
@@ -141,6 +664,13 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
     Provides an enhanced version of the :class:`ConfigParser` module, which enables some
     extended processing of the information provided in a ``.ini`` file.
 
+    The parser's debugging messages are tagged with these categories, which can be
+    enabled separately through :py:attr:`~configparserenhanced.Debuggable.debug_categories`:
+
+    - ``"parse"``: Start and end of :py:meth:`parse_section`, :py:meth:`refresh` and the parse cache.
+    - ``"section"``: Entering and leaving sections (i.e., the ``use`` traversal) and their options.
+    - ``"handler"``: Handler calls, including their parameters, lookup and return values.
+
     See Also:
         - `ConfigParser reference <https://docs.python.org/3/library/configparser.html>`
     """
@@ -149,11 +679,13 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """Constructor
 
         Args:
-            filename (str,Path,list): The ``.ini`` file or files to be loaded. If a ``str``
-                or ``Path`` is provided then we load only the one file. A ``list`` of strings
-                or ``Path`` s can also be provided, which will be loaded by :class:`ConfigParser`'s
+            filename (str,Path,bytes,io.IOBase,InMemorySource,list): The ``.ini`` file or files
+                to be loaded. If a ``str`` or ``Path`` is provided then we load only the one file.
+                A ``list`` of strings or ``Path`` s can also be provided, which will be loaded by
+                :class:`ConfigParser`'s
                 `read() <https://docs.python.org/3/library/configparser.html#configparser.ConfigParser.read>`_
-                method.
+                method. In-memory sources can be used in place of (or mixed with) files,
+                see :py:attr:`inifilepath`.
         """
         if filename is not None:
             self.inifilepath = filename
@@ -172,6 +704,144 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         "_internal_default_section_name", str, default="CONFIGPARSERENHANCED_COMMON"
     )
 
+    use_section_cache = typed_property("use_section_cache", bool, default=False)
+    """bool: Enables the (opt-in) section result cache.
+
+    When enabled, :class:`ConfigParserEnhancedData` caches the generic options
+    produced by walking each section (including everything it pulls in through
+    ``use`` operations). Later visits to that section, from any root section,
+    replay the cached options in depth-first order instead of walking the
+    section again, so the *last visited wins* semantics are unchanged.
+
+    A section's result is only cached if no ``use`` cycle was hit while walking
+    it and no handler decorated with :py:meth:`section_cache_optout` was called.
+    A cached result is only replayed if none of the sections it covers are
+    currently being processed higher up in the search.
+
+    Warning:
+        Handlers inside a replayed section are **not** called. Handlers with
+        side effects (i.e., that need to see every option) must be decorated
+        with :py:meth:`section_cache_optout`.
+
+    Default: ``False``
+    """
+
+    profile_enabled = typed_property("profile_enabled", bool, default=False)
+    """bool: Enables the (opt-in) section and handler profiler.
+
+    When enabled, the parser records the wall time, self time (wall time minus
+    the time spent in nested sections and handlers) and call count of each root
+    section passed to :py:meth:`parse_section`, each section visited (directly
+    or through ``use``) and each handler. The results accumulate across parses
+    until :py:meth:`profile_reset` is called and are available from
+    :py:meth:`profile_data` and :py:meth:`profile_report`.
+
+    Note:
+        Sections parsed on worker processes by ``parse_all_sections(jobs=N)``
+        are not included.
+
+    Default: ``False``
+    """
+
+    profile_threshold_ms = typed_property("profile_threshold_ms", (int, float, type(None)), default=None)
+    """float: Log sections that take longer than this many milliseconds.
+
+    If set (and :py:attr:`profile_enabled` is ``True``), a message is printed each
+    time a root section or visited section takes at least this long (wall time).
+
+    Default: ``None`` (disabled)
+    """
+
+    loginfo_capacity = typed_property(
+        "loginfo_capacity", int, default=LOGINFO_CAPACITY_DEFAULT, validator=lambda x: x > 0
+    )
+    """int: The maximum number of records kept in the ``_loginfo`` trace.
+
+    When ``debug_level > 0`` the parser records a trace of the sections, options
+    and handlers it processes. The trace is a ring buffer, so once it holds this
+    many records the oldest ones are dropped. Changes take effect at the start of
+    the next :py:meth:`parse_section`.
+
+    Default: ``LOGINFO_CAPACITY_DEFAULT`` (10000)
+    """
+
+    concurrent_load = typed_property("concurrent_load", bool, default=False)
+    """bool: Read the ``.ini`` files concurrently.
+
+    When :py:attr:`inifilepath` has more than one file, the files are read on a
+    pool of up to ``CONCURRENT_LOAD_MAX_WORKERS`` threads. Each file is checked
+    when it is opened rather than by separate ``exists()`` and ``is_file()`` calls,
+    which saves round trips on network file systems. The contents are still
+    loaded into ``configparserdata`` in the order of :py:attr:`inifilepath`, so the
+    result (including which values override others and when a
+    ``DuplicateOptionError`` is raised) is the same as a serial load.
+
+    Default: ``False``
+    """
+
+    parse_cache_version = typed_property("parse_cache_version", (int, str), default=0)
+    """int: The version of this parser's handler logic, used in the on-disk parse cache key.
+
+    Entries in the :py:attr:`cache_dir` cache are already invalidated when the code of
+    a handler of the class changes (see :py:meth:`_get_handler_code_digest`). Subclasses
+    whose results also depend on other code (e.g., helper methods called by handlers
+    or module level data) should bump this class attribute when that code changes
+    so that cache entries made by older versions are not loaded.
+
+    Default: ``0``
+    """
+
+    parse_engine = typed_property(
+        "parse_engine", str, default="recursive", validator=lambda value: value in PARSE_ENGINES
+    )
+    """str: The engine that walks the sections and their ``use`` links.
+
+    - ``"recursive"``: Visits ``use``-d sections through recursive calls, so the
+      depth of ``use`` chains is limited by Python's recursion limit.
+    - ``"iterative"``: Keeps the sections being visited on its own stack, for
+      very deep ``use`` chains.
+
+    Both engines call the handlers in the same order and give the same results.
+    Setting any other value raises a ``ValueError``.
+
+    Default: ``"recursive"``
+    """
+
+    reuse_handler_parameters = typed_property("reuse_handler_parameters", bool, default=False)
+    """bool: Reuse the :class:`~configparserenhanced.HandlerParameters` objects given to handlers.
+
+    When enabled, the parser resets and reuses the ``HandlerParameters`` object of
+    each level of recursion (and of each ``handler_initialize()`` and
+    ``handler_finalize()`` call) once it is done with it, rather than allocating a
+    new one for every section visited (see :py:meth:`_release_handler_parameters`).
+
+    Warning:
+        Only enable this if the handlers do not keep a reference to the
+        ``handler_parameters`` object they are given after they return, since its
+        fields are wiped when it is reused. Keep references to the values
+        (e.g., ``handler_parameters.data_shared``) instead.
+
+    Default: ``False``
+    """
+
+    trusted_mode = typed_property("trusted_mode", bool, default=False)
+    """bool: Skip the parser's internal parameter type checks.
+
+    By default the parser checks the types of the parameters passed between its
+    internal methods every time they are called, which happens several times per
+    option. These checks catch bugs in subclasses and handlers so they are left
+    on by default (and in the tests).
+
+    In *trusted mode* the parameters are still checked where they enter the parser
+    (the public methods such as :py:meth:`parse_section`, the property setters and
+    the return values of handlers) but the internal checks in
+    ``_parse_section_r``, ``_launch_generic_option_handler``, ``_locate_handler_method``,
+    ``enter_handler``, ``exit_handler`` and the :py:meth:`operation_handler` wrapper
+    are skipped.
+
+    Default: ``False``
+    """
+
     @property
     def inifilepath(self) -> list:
         """Provides access to the path to the ``.ini`` file (or files).
@@ -180,9 +850,15 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         1. A ``str`` contining a path to a ``.ini`` file.
         2. A ``pathlib.Path`` object pointing to a ``.ini`` file.
-        3. A ``list`` of one or more of (1) or (2).
+        3. The contents of a ``.ini`` file held in memory: an :class:`InMemorySource`,
+           ``bytes``, an ``io`` stream (which is read to the end) or a ``str`` that
+           contains a newline.
+        4. A ``list`` of one or more of (1), (2) or (3).
 
-        Entries in the list will be converted to ``pathlib.Path`` objects.
+        Entries in the list will be converted to ``pathlib.Path`` objects, or to
+        :class:`InMemorySource` objects for in-memory contents. A ``str`` without a
+        newline is always treated as a path, so single-line contents must be wrapped
+        in an :class:`InMemorySource`.
 
         Returns:
             list: A ``list`` containing the ``.ini`` files that will be processed.
@@ -196,17 +872,25 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
     @inifilepath.setter
     def inifilepath(self, value) -> list:
-        self._validate_parameter(value, (str, list, Path))
+        self._validate_parameter(value, (str, list, Path, bytes, bytearray, io.IOBase, InMemorySource))
 
         # If we have already loaded a .ini file, we should reset the data
         # structure. Delete any lazy-created properties, etc.
         if hasattr(self, '_inifilepath'):
             if hasattr(self, '_configparserdata'):
                 delattr(self, '_configparserdata')
+            self._reset_lazy_attr("_inifile_states")
+            if hasattr(self, '_configparserenhanceddata'):
+                self._configparserenhanceddata._section_cache.clear()
+                self._configparserenhanceddata._section_plans.clear()
             self._reset_lazy_attr("_loginfo")
+            self._reset_lazy_attr("_unroll_base_class_parser")
+            self._reset_lazy_attr("_use_graph")
+            self._reset_lazy_attr("_use_graph_loaded")
+            self._reset_lazy_attr("_use_graph_cycles_reported")
 
-        # Internally we represent the inifile as a `list of Path` objects.
-        # Do the necessary conversions to make that so.
+        # Internally we represent the inifile as a `list of Path` objects
+        # (and `InMemorySource` objects). Do the necessary conversions to make that so.
         if not isinstance(value, list):
             value = [value]
 
@@ -214,7 +898,14 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         for entry in value:
             try:
-                self._inifilepath.append(Path(entry))
+                if isinstance(entry, InMemorySource):
+                    self._inifilepath.append(entry)
+                elif isinstance(entry, (bytes, bytearray, io.IOBase)):
+                    self._inifilepath.append(InMemorySource(entry))
+                elif isinstance(entry, str) and "\n" in entry:
+                    self._inifilepath.append(InMemorySource(entry))
+                else:
+                    self._inifilepath.append(Path(entry))
             except TypeError as ex:
                 self.debug_message(0, "ERROR: invalid entry in `inifilepath` list.")
                 raise ex
@@ -245,14 +936,6 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
               reference and user-guide.
         """
         if not hasattr(self, '_configparserdata'):
-            self._configparserdata = configparser.ConfigParser(
-                allow_no_value=True,
-                delimiters=self.configparser_delimiters,
-                default_section=self._internal_default_section_name
-            )
-
-            # Prevent ConfigParser from lowercasing the keys.
-            self._configparserdata.optionxform = str
 
             # configparser.ConfigParser.read() will not fail if it doesn't read the
             # .ini file(s) in the list, it'll just happily continue on and return
@@ -261,8 +944,14 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             if len(self.inifilepath) == 0:
                 raise ValueError("ERROR: No .ini filename(s) were provided.")
 
+            concurrent_load = self.concurrent_load and len(self.inifilepath) > 1
+
             for inifilepath_i in self.inifilepath:
 
+                # In-memory sources are always loadable.
+                if isinstance(inifilepath_i, InMemorySource):
+                    continue
+
                 # Sanity type check here -- we'd throw on the .exists() and .is_file()
                 # methods below if the entry isn't a Path object, but the error might
                 # be cryptic. This will throw a more explicit error.
@@ -271,23 +960,43 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                 if isinstance(inifilepath_i, Path) is not True:
                     raise TypeError("INTERNAL ERROR: .ini file paths should be Path objects!")
 
+                # In concurrent_load mode the files are checked when they're opened.
+                if concurrent_load:
+                    continue
+
                 if (inifilepath_i.exists() and inifilepath_i.is_file()) is not True:
-                    msg = f"\n" + \
-                          f"+" + "="*78 + "+\n" + \
-                          f"|   ERROR: Unable to load configuration .ini file\n" + \
-                          f"|   - Requested file: `{inifilepath_i}`\n" + \
-                          f"|   - CWD: `{os.getcwd()}`\n" + \
-                          f"+" + "="*78 + "+\n"
-                    raise IOError(msg)
+                    raise self._inifile_load_error(inifilepath_i)
 
-            try:
-                self._configparserdata.read(self.inifilepath, encoding='utf-8')
-            except configparser.DuplicateOptionError as ex:
-                delattr(self, '_configparserdata')
-                message = "ERROR: Configparser found a section with "
-                message += "two options with identical keys."
-                self.debug_message(0, message)
-                raise ex
+            if concurrent_load:
+                inifiles = self._read_inifiles_concurrent(self.inifilepath)
+            else:
+                inifiles = [self._read_inifile(x) for x in self.inifilepath]
+            inifile_states = [x[0] for x in inifiles]
+
+            cache_entry = None
+            if self.cache_dir is not None:
+                cache_entry = self._parse_cache_load(self._parse_cache_key(inifile_states))
+
+            if cache_entry is not None:
+                self._configparserdata = cache_entry['configparserdata']
+                if cache_entry['configparserenhanceddata'] is not None:
+                    self.configparserenhanceddata._set_state(cache_entry['configparserenhanceddata'])
+            else:
+                self._configparserdata = self._new_configparserdata([x[1] for x in inifiles])
+
+            # Only the snapshots are kept, the contents of the files are released here.
+            self._inifile_states = inifile_states
+            del inifiles
+
+            # The `use` graph is built at load time, except in lazy_load mode where
+            # it grows as the sections are loaded (see `_use_graph_update()`).
+            self._reset_lazy_attr("_use_graph")
+            self._reset_lazy_attr("_use_graph_loaded")
+            if not isinstance(self._configparserdata, _LazyConfigParser):
+                self._use_graph = self._new_use_graph()
+
+            if self.cache_dir is not None and cache_entry is None:
+                self._parse_cache_save()
 
         return self._configparserdata
 
@@ -323,6 +1032,137 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         return self._configparser_delimiters
 
+    @property
+    def lazy_load(self) -> bool:
+        """Load the sections of the ``.ini`` file(s) on demand.
+
+        If enabled, the ``.ini`` files are scanned once to build an index of where
+        each section is located and a section is only parsed by ``ConfigParser``
+        when its contents are needed (e.g., when it or a section that ``use``-es
+        it is parsed). This is much faster when only a few sections out of large
+        ``.ini`` files are needed. Files that are at least ``LAZY_LOAD_MMAP_THRESHOLD``
+        bytes are scanned using :py:mod:`mmap` and are not held in memory.
+
+        ``configparserdata`` behaves the same in either mode except that
+        ``DuplicateOptionError`` and ``DuplicateSectionError`` are raised when the
+        affected section is loaded rather than when the file is loaded.
+
+        Changing the value of this will trigger a **reset** of the cached data
+        in the class.
+
+        Default: ``False``
+
+        Note:
+            Section headers must start in the first column of the line.
+
+        Returns:
+            bool: ``True`` if sections are loaded on demand.
+
+        Raises:
+            TypeError: If assignment of something other than a ``bool`` is attempted.
+        """
+        if not hasattr(self, '_lazy_load'):
+            self._lazy_load = False
+        return self._lazy_load
+
+    @lazy_load.setter
+    def lazy_load(self, value) -> bool:
+        self._validate_parameter(value, (bool))
+
+        if value != self.lazy_load:
+            self._reset_configparserdata()
+
+        self._lazy_load = value
+        return self._lazy_load
+
+    @property
+    def encoding(self):
+        """The encoding used to read the ``.ini`` files.
+
+        If ``None``, the files are decoded using the locale's preferred encoding.
+        In-memory sources created from text (see :class:`InMemorySource`) are
+        always decoded as UTF-8.
+
+        Changing the value of this will trigger a **reset** of the cached data
+        in the class.
+
+        Default: ``'utf-8'``
+
+        Returns:
+            str: The name of the encoding or ``None``.
+
+        Raises:
+            TypeError: If assignment of something other than a ``str`` or ``None`` is attempted.
+        """
+        if not hasattr(self, '_encoding'):
+            self._encoding = 'utf-8'
+        return self._encoding
+
+    @encoding.setter
+    def encoding(self, value):
+        self._validate_parameter(value, (str, None))
+
+        if value != self.encoding:
+            self._reset_configparserdata()
+
+        self._encoding = value
+        return self._encoding
+
+    @property
+    def cache_dir(self):
+        """Directory for the persistent (on-disk) parse cache.
+
+        If set, the raw ``configparserdata`` is saved to this directory after
+        it is loaded and the parsed ``configparserenhanceddata`` is saved after
+        :py:meth:`parse_all_sections` runs. A new process that loads the same
+        ``.ini`` file(s) will load these from the cache instead of parsing the
+        files again.
+
+        Cache entries are keyed by the SHA-256 hashes of the contents of the
+        ``.ini`` file(s), the ``configparser_delimiters``, the section name
+        settings, the parser class, the code of its handlers, its
+        :py:attr:`parse_cache_version` and the ``configparserenhanced`` version.
+        Entries are written to a temporary file and then renamed into place so
+        several processes can safely share the same directory.
+
+        The directory is created if it does not exist. Errors reading or writing
+        the cache are reported at ``debug_level`` 1 and otherwise ignored.
+
+        Default: ``None`` (disabled)
+
+        Warning:
+            Cache entries are stored using :py:mod:`pickle`, so entries are only
+            loaded if the directory and the entry are owned by the current user
+            and are not writable by the group or others. Otherwise the entry is
+            skipped with a ``WARNING`` event. The directory is created with
+            mode ``0o700``.
+
+        Note:
+            Handlers are not run when parsed data is loaded from the cache, so
+            subclasses that save state from handlers (outside of the parsed data)
+            should call :py:meth:`parse_section` to get that state.
+
+        Returns:
+            Path: The cache directory or ``None`` if caching is disabled.
+
+        Raises:
+            TypeError: If assignment of something other than a ``str``, ``Path``
+                or ``None`` is attempted.
+        """
+        if not hasattr(self, '_cache_dir'):
+            self._cache_dir = None
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, value):
+        self._validate_parameter(value, (str, Path, None))
+
+        if value is not None:
+            value = Path(value)
+
+        self._cache_dir = value
+        return self._cache_dir
+
     @property
     def configparserenhanceddata(self):
         """Enhanced ``configparserdata`` ``.ini`` file information data.
@@ -366,6 +1206,37 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             self._configparserenhanceddata = self.ConfigParserEnhancedData(owner=self)
         return self._configparserenhanceddata
 
+    @property
+    def use_graph(self) -> UseGraph:
+        """The graph of ``use`` links between the sections of the ``.ini`` file(s).
+
+        The graph is built from ``configparserdata`` when the ``.ini`` file(s) are
+        loaded and is rebuilt after they change. In :py:attr:`lazy_load` mode the
+        graph holds the sections that have been loaded so far and sections are
+        added to it as they load, so accessing this property loads every section.
+        Sections are linked by their ``use`` operations without parsing them, so
+        no handlers are called. Links to sections that don't exist are not included.
+
+        The graph gives the ``use`` cycles, a topological order of the sections
+        and :py:meth:`~configparserenhanced.UseGraph.dependencies` /
+        :py:meth:`~configparserenhanced.UseGraph.dependents` queries. The parser
+        also uses it to report each ``use`` cycle only once (later hits on the same
+        cycle are ``SILENT`` events).
+
+        Returns:
+            :class:`~configparserenhanced.UseGraph`
+
+        Note:
+            Subclasses should not override this.
+        """
+        configparserdata = self.configparserdata
+        if isinstance(configparserdata, _LazyConfigParser):
+            configparserdata._lazy_load_all()
+            self._use_graph_update()
+        elif not hasattr(self, '_use_graph'):
+            self._use_graph = self._new_use_graph()
+        return self._use_graph
+
     # ---------------------------------------
     #   P U B L I C   A P I   M E T H O D S
     # ---------------------------------------
@@ -375,7 +1246,9 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
     ) -> int:
         """File writer utility for ConfigParserEnhanced objects.
 
-        Writes the output of :py:meth:`unroll_to_str` to a file.
+        Writes the same output as :py:meth:`unroll_to_str` to a file. The output
+        is written one section at a time as it is generated rather than being
+        built up as one string first.
 
         Args:
             file_object (:obj:`File Ptr`): Pointer to the file that should be written.
@@ -383,6 +1256,7 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                 space of padding.
             section (:obj:`str`): If a section name is provided we only generate the specified
                 section (if it exists), otherwise we generate output for all sections.
+            use_base_class_parser (bool): See :py:meth:`unroll_to_str`.
 
         Raises:
             TypeError: If ``file_object`` is not a file pointer (instance or derivitive
@@ -390,13 +1264,8 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """
         self._validate_parameter(file_object, (io.IOBase))
 
-        text = self.unroll_to_str(
-            section=section,
-            space_around_delimiters=space_around_delimiters,
-            use_base_class_parser=use_base_class_parser
-        )
-
-        file_object.write(text)
+        for text in self._unroll_iter(section, space_around_delimiters, use_base_class_parser):
+            file_object.write(text)
 
         return 0
 
@@ -422,7 +1291,14 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """
         output = 0
 
-        for section in self.configparserenhanceddata.sections(parse=False):
+        # Parse the sections that haven't been parsed yet in one batch.
+        sections = list(self.configparserenhanceddata.sections(parse=False))
+        sections_unparsed = [x for x in sections if x not in self.configparserenhanceddata._sections_checked]
+        if len(sections_unparsed) > 0:
+            self.configparserenhanceddata._set_owner_options()
+            self.parse_sections(sections_unparsed)
+
+        for section in sections:
             err = self.assert_section_all_options_handled(section, do_raise=False)
 
             if err != 0:
@@ -518,40 +1394,129 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         an operation there would be no distinction between ``foo-bar`` and
         ``foo_bar``.
 
+        The list has one entry per handler method, sorted by the method name,
+        so an operation that has both a *public* and a *private* handler
+        (see :py:meth:`_get_handler_dispatch_table`) is listed twice. The list
+        is saved when the class's handler dispatch table is built.
+
         Returns:
             list: A list of strings is returned containing the list of
                   known operations based on existing handlers.
         """
-        # Regex that looks for ``_handler`` or ``handler`` at the front of a string
-        re_handler_name = re.compile(r"^_?handler_")
-
-        # Regex that looks for strings that match any one of these options:
-        # - "_handler_initialize"
-        # - "_handler_finalize"
-        # - "handler_initialize"
-        # - "handler_finalize"
-        re_handler_init_final = re.compile(r"^_?handler_((finalize)|(initialize))$")
-
-        # Regex that is used in the list comprehension below to strip the handler
-        # prefix out of the name when we attempt to generate the operation names.
-        # - Matches "_handler_" and "handler_"
-        re_strip_handler_prefix = re.compile(r"^_?handler_")
-
-        # This list comprehension scans through the defined methods and will
-        # pull out every method that starts with "_handler" or "handler"
-        # and then strips the optional leading "_" off, then strips the
-        # leading "handler_" component off and finally replaces "_" with "-"
-        # in the handler name to generate the operation name.
-        # wcmclen - 2021-09-03 - The TypedProperty entry for `parse_Section_last_result`
-        #           was triggering the exception that required assignment before use
-        #           in the `getmembers` call here. I removed that condition on the property
-        #           but it might be worth figuring out why the inspection triggered it.
-        #           Perhaps `TypedProperty` needs a proper _getter_ implemented?
-        output = [
-            re_strip_handler_prefix.sub("", x[0]).replace("_", "-")
-            for x in inspect.getmembers(self, predicate=inspect.ismethod)
-            if re_handler_name.search(x[0]) and not re_handler_init_final.search(x[0])
-        ]
+        cls = type(self)
+        cls._get_handler_dispatch_table()
+        return list(cls.__dict__["_known_operations_cache"])
+
+    def profile_data(self) -> dict:
+        """Get the data collected by the profiler.
+
+        See :py:attr:`profile_enabled`.
+
+        Returns:
+            dict: A dictionary of ``{ category: { name: stats } }`` where ``category`` is
+                one of ``"root-section"``, ``"section"`` or ``"handler"`` and ``stats`` is
+                a dict containing ``calls`` (int), ``total_ms`` (float) and ``self_ms`` (float).
+        """
+        output = {}
+        for category in ["root-section", "section", "handler"]:
+            entries = getattr(self, '_profile_entries', {}).get(category, {})
+            output[category] = {
+                name: {
+                    'calls': calls,
+                    'total_ms': total * 1000.0,
+                    'self_ms': self_time * 1000.0
+                } for name, (calls, total, self_time) in entries.items()
+            }
+        return output
+
+    def profile_report(self, sort_by="total_ms", limit=None) -> str:
+        """Generate a table of the data collected by the profiler.
+
+        See :py:attr:`profile_enabled`.
+
+        Args:
+            sort_by (str): The field to sort each category by (largest first). One of
+                ``"total_ms"``, ``"self_ms"`` or ``"calls"``. Default: ``"total_ms"``.
+            limit (int): If provided, only show this many entries of each category.
+
+        Returns:
+            str: The report.
+
+        Raises:
+            ValueError: If ``sort_by`` is not a valid field.
+        """
+        if sort_by not in ("total_ms", "self_ms", "calls"):
+            raise ValueError(f"sort_by must be one of `total_ms`, `self_ms` or `calls`, not `{sort_by}`.")
+
+        data = self.profile_data()
+
+        len_name = max([len("name")] + [len(x) for entries in data.values() for x in entries.keys()])
+
+        output = []
+        for category, entries in data.items():
+            output.append(f"{category}")
+            output.append(f"  {'name'.ljust(len_name)}  {'calls':>8}  {'total ms':>12}  {'self ms':>12}")
+            output.append(f"  {'-' * len_name}  {'-' * 8}  {'-' * 12}  {'-' * 12}")
+
+            entries_sorted = sorted(entries.items(), key=lambda x: x[1][sort_by], reverse=True)
+            if limit is not None:
+                entries_sorted = entries_sorted[: limit]
+
+            for name, stats in entries_sorted:
+                output.append(
+                    f"  {name.ljust(len_name)}  {stats['calls']:>8}  " +
+                    f"{stats['total_ms']:>12.3f}  {stats['self_ms']:>12.3f}"
+                )
+            output.append("")
+
+        return "\n".join(output)
+
+    def profile_reset(self) -> None:
+        """Clear the data collected by the profiler."""
+        self._reset_lazy_attr("_profile_entries")
+        self._reset_lazy_attr("_profile_stack")
+        return
+
+    def loginfo_iter(self, typeinfo=None):
+        """Iterate over the records in the ``_loginfo`` trace from the last parse.
+
+        Records are only generated when ``debug_level > 0``. At most
+        :py:attr:`loginfo_capacity` of the most recent records are kept.
+
+        Args:
+            typeinfo (str): If provided, only records with this ``type`` are
+                returned (e.g., ``"section-entry"`` or ``"handler-entry"``).
+
+        Yields:
+            dict: The records, oldest first. Each record has a ``type`` key.
+        """
+        for entry in getattr(self, '_loginfo', []):
+            if typeinfo is None or entry['type'] == typeinfo:
+                yield entry
+
+    def loginfo_export(self, file_object, typeinfo=None) -> int:
+        """Write the ``_loginfo`` trace from the last parse as JSON Lines.
+
+        Each record is written as a JSON object on its own line. Values that
+        can't be represented in JSON are written as their ``str()``.
+
+        Args:
+            file_object (:obj:`File Ptr`): The (text) file the records are written to.
+            typeinfo (str): If provided, only records with this ``type`` are written.
+
+        Returns:
+            int: The number of records written.
+
+        Raises:
+            TypeError: If ``file_object`` is not a file pointer (instance or derivitive
+                of ``io.IOBase``).
+        """
+        self._validate_parameter(file_object, (io.IOBase))
+
+        output = 0
+        for entry in self.loginfo_iter(typeinfo):
+            file_object.write(json.dumps(entry, default=str) + "\n")
+            output += 1
         return output
 
     def unroll_to_str(self, section=None, space_around_delimiters=True, use_base_class_parser=True) -> str:
@@ -569,6 +1534,10 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         ``use`` operations processed and stripped, but this paramter gives the
         option to disable that capability.
 
+        The base-class parser is kept and reused by later calls until
+        :py:attr:`inifilepath` or :py:attr:`configparser_delimiters` are changed.
+        :py:meth:`refresh` also refreshes it.
+
         Args:
             section (:obj:`str`): If a section name is provided we only generate the specified
                 section (if it exists), otherwise we generate output for all sections.
@@ -583,71 +1552,28 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         Raises:
             TypeError: If ``section`` is not a ``str`` or ``None`` object.
         """
-
-        def __generate_section(section: str, parser, delimiter=":"):
-            """
-            Helper function (inner function)
-
-            This function generates the string containing the section header
-            and options.
-            """
-            output = ""
-            if parser.configparserenhanceddata.has_section(section):
-                output += f"[{section}]\n"
-                for key, value in parser.configparserenhanceddata.items(section):
-                    if value is None:
-                        value = ""
-                    output += delimiter.join([key, value]).strip() + "\n"
-            else:
-                raise KeyError(f"Section `{section}` was not found.")
-            return output
-
-        self._validate_parameter(section, (type(None), str))
-
-        output_str = ""
-
-        delimiter = ":"
-        if space_around_delimiters:
-            delimiter = " {} ".format(delimiter)
-
-        parser = None
-        if use_base_class_parser:
-            parser = ConfigParserEnhanced(filename=self.inifilepath)
-        else:
-            parser = self
-
-        # Turn off ECL notifications
-        ecl = parser.exception_control_level
-        parser.exception_control_level = 0
-
-        section_list = parser.configparserenhanceddata.sections()
-
-        if section is None:
-            for section in section_list:
-                output_str += __generate_section(section, parser, delimiter)
-                output_str += "\n"
-        else:
-            output_str += __generate_section(section, parser, delimiter)
-
-        # reset parser ECL (only useful when not using base class parser)
-        parser.exception_control_level = ecl
-
-        output_str = output_str.strip()
-        output_str += "\n"
-
-        return output_str
+        return "".join(self._unroll_iter(section, space_around_delimiters, use_base_class_parser))
 
     # -------------------------------------
     #   P A R S E R   P U B L I C   A P I
     # -------------------------------------
 
-    def parse_all_sections(self):
+    def parse_all_sections(self, jobs=None):
         """Parse ALL sections in the .ini file.
 
         This can be useful if the user wishes to pre-parse all the sections
         of an ``ini`` file in one go.
+
+        Args:
+            jobs (int): The number of worker processes to parse the sections with.
+                If ``None`` (default) or 1 the sections are parsed serially in this
+                process. See :py:meth:`ConfigParserEnhancedData.sections` for details
+                on parallel parsing.
         """
-        self.configparserenhanceddata.sections(True)
+        self.configparserenhanceddata.sections(True, jobs=jobs)
+
+        if self.cache_dir is not None:
+            self._parse_cache_save(include_parsed_data=True)
         return
 
     def parse_section(self, section, initialize=True, finalize=True):
@@ -665,26 +1591,266 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """
         # If a previous run generated _loginfo, clear it before this run.
         self._reset_lazy_attr("_loginfo")
+        self._loginfo = collections.deque(maxlen=self.loginfo_capacity)
+
+        debug_enabled = self.debug_enabled(1, "parse")
 
-        self.debug_message(1, f"[" + "-"*58 + ']')
-        self.debug_message(1, f"  Parse section `{section}` START")
-        self.debug_message(1, f"[" + "-"*58 + ']')
+        if debug_enabled:
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+            self.debug_message(1, f"  Parse section `{section}` START", category="parse")
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
         self._validate_parameter(section, (str))
 
         if section == "":
             raise ValueError("`section` cannot be empty.")
 
+        profile_enabled = self.profile_enabled
+        if profile_enabled:
+            # Discard frames left over from a parse that raised an exception.
+            self._profile_stack = []
+            self._profile_enter("root-section", section)
+
         # Parse the requested section.
         result = self._parse_section_r(section, initialize=initialize, finalize=finalize)
 
+        if profile_enabled:
+            self._profile_exit()
+
         # caches the "data_shared" component of handler_parameters
         self.parse_section_last_result = result
 
-        self.debug_message(1, f"[" + "-"*58 + ']')
-        self.debug_message(1, f"  Parse section `{section}` FINISH")
-        self.debug_message(1, f"[" + "-"*58 + ']')
+        if debug_enabled:
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+            self.debug_message(1, f"  Parse section `{section}` FINISH", category="parse")
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
         return result
 
+    def parse_sections(self, sections, initialize=True, finalize=True) -> dict:
+        """Execute parser operations for a list of sections.
+
+        This is a batch version of :py:meth:`parse_section` that processes the
+        ``DEFAULT`` section (see :py:attr:`default_section_name`) once for the batch
+        when its result is the same for every root section. That is the case when
+        :meth:`handler_initialize()` is not overridden and the ``DEFAULT`` section
+        does not ``use`` other sections or call handlers decorated with
+        :py:meth:`section_cache_optout` (the same rule as :py:attr:`use_section_cache`).
+        Each section then starts from a deep copy of the ``data_shared`` left by the
+        ``DEFAULT`` section, with its generic options copied into the section's data.
+        Otherwise each section is parsed the same as :py:meth:`parse_section` would
+        do it. :meth:`handler_initialize()` and :meth:`handler_finalize()` are called
+        for each section with ``section_root`` set to that section. The parameters
+        are checked before anything is parsed and the parse log (``_loginfo``) holds
+        the whole batch.
+
+        Note:
+            When the ``DEFAULT`` section is shared, the handlers of its options are
+            called once per batch with ``section_root`` set to
+            ``_internal_default_section_name``. Handlers that depend on the root
+            section should be decorated with :py:meth:`section_cache_optout`.
+
+        Args:
+            sections (list): The names of the sections to parse.
+            initialize (bool): If True then :meth:`handler_initialize()` will be executed
+                at the start of the search of each section.
+            finalize (bool): If True then :meth:`handler_finalize()` will be executed
+                at the end of the search of each section.
+
+        Returns:
+            dict: A dictionary of ``{ section: data_shared }`` with the
+            :attr:`~.HandlerParameters.data_shared` result of each section.
+
+        Raises:
+            KeyError: If one of the sections does not exist.
+        """
+        self._validate_parameter(sections, (list))
+        for section in sections:
+            self._validate_parameter(section, (str))
+            if section == "":
+                raise ValueError("`section` cannot be empty.")
+
+        # If a previous run generated _loginfo, clear it before this run.
+        self._reset_lazy_attr("_loginfo")
+        self._loginfo = collections.deque(maxlen=self.loginfo_capacity)
+
+        debug_enabled = self.debug_enabled(1, "parse")
+
+        if debug_enabled:
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+            self.debug_message(1, f"  Parse sections {sections} START", category="parse")
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+
+        profile_enabled = self.profile_enabled
+        if profile_enabled:
+            # Discard frames left over from a parse that raised an exception.
+            self._profile_stack = []
+
+        configparserenhanceddata = self.configparserenhanceddata
+
+        # Process the DEFAULT section once, on a template root, if its result
+        # doesn't depend on the root section.
+        template = None
+        if initialize and self._parse_sections_can_share_default():
+            template = self._new_handler_parameters()
+            template.section_root = self._internal_default_section_name
+            template.data_internal['visited_sections'] = set()
+            self._parse_section_r(self.default_section_name, template, initialize=False, finalize=False)
+            template_entries = configparserenhanceddata.data.pop(template.section_root, {})
+
+        output = {}
+        for section in sections:
+            if profile_enabled:
+                self._profile_enter("root-section", section)
+
+            if template is None:
+                result = self._parse_section_r(section, initialize=initialize, finalize=finalize)
+            else:
+                handler_parameters = self._new_handler_parameters()
+                handler_parameters.section_root = section
+                handler_parameters.data_shared = copy.deepcopy(template.data_shared)
+                handler_parameters.data_internal = copy.deepcopy(template.data_internal)
+                self._reset_lazy_attr("_use_graph_cycles_reported")
+
+                handler_initialize_params = self._new_handler_parameters(handler_parameters)
+                handler_initialize_params.handler_name = "handler_initialize"
+                self.handler_initialize(section, handler_initialize_params)
+                self._release_handler_parameters(handler_initialize_params)
+
+                configparserenhanceddata._sections_checked.add(section)
+                configparserenhanceddata.add_section(section).update(template_entries)
+
+                # The section is parsed as if it was `use`-d by the root section, which
+                # is the same as parsing it after the DEFAULT section.
+                result = self._parse_section_r(
+                    section, handler_parameters, initialize=False, finalize=finalize
+                )
+
+                configparserenhanceddata._section_closures[section] = frozenset(
+                    handler_parameters.data_internal['visited_sections']
+                )
+                self._release_handler_parameters(handler_parameters)
+
+            if profile_enabled:
+                self._profile_exit()
+
+            output[section] = result
+            self.parse_section_last_result = result
+
+        if template is not None:
+            self._release_handler_parameters(template)
+
+        if debug_enabled:
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+            self.debug_message(1, f"  Parse sections {sections} FINISH", category="parse")
+            self.debug_message(1, f"[" + "-"*58 + ']', category="parse")
+        return output
+
+    def refresh(self) -> list:
+        """Reload the ``.ini`` file(s) that changed since they were loaded.
+
+        Each file's modification time and size are checked first and only
+        files where those changed are re-read and hashed. Files whose contents
+        are unchanged are left alone. If any file changed then the
+        ``configparserdata`` is rebuilt and only the parsed sections whose
+        ``use`` closure includes a section that changed are invalidated in
+        ``configparserenhanceddata``. Everything else stays parsed.
+
+        Invalidated sections are re-parsed lazily the next time they are accessed
+        through ``configparserenhanceddata`` (or explicitly via :py:meth:`parse_section`).
+
+        If nothing has been loaded yet then this does nothing.
+
+        Returns:
+            list: A list of the section names that were invalidated.
+
+        Raises:
+            IOError: If any of the files in ``self.inifilepath`` no longer exist.
+        """
+        if hasattr(self, '_unroll_base_class_parser'):
+            self._unroll_base_class_parser.refresh()
+
+        if not hasattr(self, '_configparserdata'):
+            return []
+
+        inifile_states_new = []
+        inifiles_read = []
+        contents_changed = False
+
+        for inifilepath_i, inifile_state_i in zip(self.inifilepath, self._inifile_states):
+            # In-memory sources never change.
+            if isinstance(inifilepath_i, InMemorySource):
+                inifile_states_new.append(inifile_state_i)
+                inifiles_read.append(None)
+                continue
+
+            try:
+                file_stat = inifilepath_i.stat()
+            except OSError:
+                msg = f"\n" + \
+                      f"+" + "="*78 + "+\n" + \
+                      f"|   ERROR: Unable to refresh configuration .ini file\n" + \
+                      f"|   - Requested file: `{inifilepath_i}`\n" + \
+                      f"|   - CWD: `{os.getcwd()}`\n" + \
+                      f"+" + "="*78 + "+\n"
+                raise IOError(msg)
+
+            inifile_read_i = None
+            if (file_stat.st_mtime_ns, file_stat.st_size) != (inifile_state_i.mtime_ns, inifile_state_i.size):
+                self.debug_message(1, f"Refresh: `{inifilepath_i}` was modified", category="parse") # Console
+                inifile_read_i = self._read_inifile(inifilepath_i)
+                contents_changed = contents_changed or (inifile_read_i[0].digest != inifile_state_i.digest)
+                inifile_state_i = inifile_read_i[0]
+
+            inifile_states_new.append(inifile_state_i)
+            inifiles_read.append(inifile_read_i)
+
+        self._inifile_states = inifile_states_new
+
+        if not contents_changed:
+            return []
+
+        # The contents of the files are not kept once they're loaded, so the files
+        # that weren't read above are read again to rebuild `configparserdata`.
+        inifiles_new = [
+            x if x is not None else self._read_inifile(inifilepath_i)
+            for inifilepath_i, x in zip(self.inifilepath, inifiles_read)
+        ]
+        del inifiles_read
+        self._inifile_states = [x[0] for x in inifiles_new]
+
+        configparserdata_old = self._configparserdata
+        configparserdata_new = self._new_configparserdata([x[1] for x in inifiles_new])
+        del inifiles_new
+
+        # Find the sections whose raw content changed, including added and removed ones.
+        # - In lazy_load mode compare the text of the sections so that we don't load them.
+        if isinstance(configparserdata_old, _LazyConfigParser) and \
+                isinstance(configparserdata_new, _LazyConfigParser):
+            sections_changed = configparserdata_old.changed_sections(configparserdata_new)
+        else:
+            sections_old = set(configparserdata_old.sections())
+            sections_new = set(configparserdata_new.sections())
+            sections_changed = sections_old ^ sections_new
+            for section in sections_old & sections_new:
+                items_old = configparserdata_old.items(section, raw=True)
+                items_new = configparserdata_new.items(section, raw=True)
+                if items_old != items_new:
+                    sections_changed.add(section)
+
+        self._configparserdata = configparserdata_new
+        self._reset_lazy_attr("_use_graph")
+        self._reset_lazy_attr("_use_graph_loaded")
+        self._reset_lazy_attr("_use_graph_cycles_reported")
+        if not isinstance(configparserdata_new, _LazyConfigParser):
+            self._use_graph = self._new_use_graph()
+
+        output = []
+        if hasattr(self, '_configparserenhanceddata'):
+            output = self._configparserenhanceddata._invalidate_sections(sections_changed)
+
+        self.debug_message(1, f"Refresh: changed sections    : {sorted(sections_changed)}", category="parse")
+        self.debug_message(1, f"Refresh: invalidated sections: {output}", category="parse")
+        return output
+
     # ---------------------------------
     #   D E C O R A T O R S
     # ---------------------------------
@@ -704,21 +1870,53 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                 # do stuff
                 return 0
 
+        Warning:
+            If :py:attr:`reuse_handler_parameters` is enabled, handlers must not keep
+            a reference to ``handler_parameters`` after they return since the parser
+            reuses the object.
+
         Args:
             func_handler (Callable): Reference to the handler function.
                 This gets managed through Python's decorator syntax.
         """
 
+        handler_name = func_handler.__name__
+
+        @functools.wraps(func_handler)
         def wrapper(self, section_name, handler_parameters):
-            self._validate_parameter(section_name, (str))
-            self.enter_handler(handler_parameters)
+            profile_enabled = self._operation_handler_enter(handler_name, section_name, handler_parameters)
             output = func_handler(self, section_name, handler_parameters)
-            self.exit_handler(handler_parameters)
-            self._check_handler_rval(handler_parameters.handler_name, output)
+            self._operation_handler_exit(handler_parameters, output, profile_enabled)
             return output
 
         return wrapper
 
+    def section_cache_optout(func_handler):
+        """
+        Implements the ``section_cache_optout`` decorator.
+
+        Handlers decorated with this must see every option they handle, so
+        sections that call them are never cached when :py:attr:`use_section_cache`
+        is enabled (nor are any of the sections that ``use`` them).
+        Handlers that have side effects, such as recording actions into
+        ``handler_parameters.data_shared``, should use this.
+
+        .. code-block:: python
+            :linenos:
+
+            @section_cache_optout
+            @operation_handler
+            def handler_my_operation(self, section_name, handler_parameters) -> int:
+                # do stuff
+                return 0
+
+        Args:
+            func_handler (Callable): Reference to the handler function.
+                This gets managed through Python's decorator syntax.
+        """
+        func_handler.section_cache_optout = True
+        return func_handler
+
     # ---------------------------------
     #   P U B L I C   H A N D L E R S
     # ---------------------------------
@@ -734,16 +1932,37 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             handler_parameters (HandlerParameters): The parameters passed to
                 the handler.
         """
-        self._validate_handlerparameters(handler_parameters)
+        if not self.trusted_mode:
+            self._validate_handlerparameters(handler_parameters)
+
+        # Skip the messages entirely if debugging is disabled since this is
+        # called on every handler entry. The `_loginfo` record doesn't depend
+        # on the debug categories.
+        debug_enabled = self.debug_enabled(1, "handler")
+        if not debug_enabled and self.debug_level <= 0:
+            return
 
         handler_name = handler_parameters.handler_name
-        self.debug_message(1, f"Enter handler    : {handler_name}")                     # Console
-        self.debug_message(1, f" -> raw_option   : {handler_parameters.raw_option}")    # Console
-        self.debug_message(2, f" -> op           : {handler_parameters.op}")            # Console
-        self.debug_message(2, f" -> params       : {handler_parameters.params}")        # Console
-        self.debug_message(2, f" -> value        : {handler_parameters.value}")         # Console
-        self.debug_message(3, f" -> data_shared  : {handler_parameters.data_shared}")   # Console
-        self.debug_message(4, f" -> data_internal: {handler_parameters.data_internal}") # Console
+        if debug_enabled:
+            self.debug_message(1, f"Enter handler    : {handler_name}", category="handler")
+            self.debug_message(1, f" -> raw_option   : {handler_parameters.raw_option}", category="handler")
+            self.debug_message(2, f" -> op           : {handler_parameters.op}", category="handler")
+            self.debug_message(2, f" -> params       : {handler_parameters.params}", category="handler")
+            self.debug_message(2, f" -> value        : {handler_parameters.value}", category="handler")
+
+            # Formatting these is O(size of the data) so only do it if they'll be printed.
+            self.debug_message(
+                3,
+                lambda: f" -> data_shared  : {handler_parameters.data_shared}",
+                category="handler",
+                lazy=True
+            )
+            self.debug_message(
+                4,
+                lambda: f" -> data_internal: {handler_parameters.data_internal}",
+                category="handler",
+                lazy=True
+            )
 
         self._loginfo_add(
             'handler-entry', {
@@ -765,13 +1984,34 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             handler_parameters (HandlerParameters): The parameters passed to
                 the handler.
         """
-        self._validate_handlerparameters(handler_parameters)
+        if not self.trusted_mode:
+            self._validate_handlerparameters(handler_parameters)
+
+        # Skip the messages entirely if debugging is disabled since this is
+        # called on every handler exit. The `_loginfo` record doesn't depend
+        # on the debug categories.
+        debug_enabled = self.debug_enabled(1, "handler")
+        if not debug_enabled and self.debug_level <= 0:
+            return
 
         handler_name = handler_parameters.handler_name
-        self.debug_message(1, f"Exit handler     : {handler_name}")                     # Console
-        self.debug_message(1, f" -> raw_option   : {handler_parameters.raw_option}")    # Console
-        self.debug_message(3, f" -> data_shared  : {handler_parameters.data_shared}")   # Console
-        self.debug_message(4, f" -> data_internal: {handler_parameters.data_internal}") # Console
+        if debug_enabled:
+            self.debug_message(1, f"Exit handler     : {handler_name}", category="handler")
+            self.debug_message(1, f" -> raw_option   : {handler_parameters.raw_option}", category="handler")
+
+            # Formatting these is O(size of the data) so only do it if they'll be printed.
+            self.debug_message(
+                3,
+                lambda: f" -> data_shared  : {handler_parameters.data_shared}",
+                category="handler",
+                lazy=True
+            )
+            self.debug_message(
+                4,
+                lambda: f" -> data_internal: {handler_parameters.data_internal}",
+                category="handler",
+                lazy=True
+            )
 
         self._loginfo_add(
             'handler-exit', {
@@ -866,10 +2106,46 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
     #   P A R S E R   H E L P E R S   ( P R I V A T E )
     # ---------------------------------------------------
 
+    def _parse_sections_can_share_default(self) -> bool:
+        """Check if :py:meth:`parse_sections` can process the ``DEFAULT`` section once.
+
+        This is the case if there is a ``DEFAULT`` section, :meth:`handler_initialize()`
+        is not overridden and none of the ``DEFAULT`` section's options ``use`` another
+        section or call a handler decorated with :py:meth:`section_cache_optout`.
+        Handlers are only checked through the section plan's dispatch table, so this
+        is ``False`` if :py:meth:`_locate_handler_method` is overridden.
+        """
+        default_section_name = self.default_section_name
+
+        if type(self).handler_initialize is not ConfigParserEnhanced.handler_initialize:
+            return False
+        if not self.configparserdata.has_section(default_section_name):
+            return False
+
+        current_section = self.configparserdata[default_section_name]
+        for plan_entry in self._get_section_plan(default_section_name, current_section):
+            if plan_entry.op is None:
+                continue
+            if plan_entry.handler_op is None:
+                return False
+            if plan_entry.dispatch_entry is None:
+                continue
+
+            handler_name, handler_method, ambiguous = plan_entry.dispatch_entry
+            if ambiguous or handler_name == "_handler_use":
+                return False
+            if getattr(handler_method, "section_cache_optout", False):
+                return False
+        return True
+
     def _parse_section_r(self, section_name, handler_parameters=None, initialize=True, finalize=True):
         """Recursive driver of the parser.
 
-        This is the main heavy lifter of the parser.
+        This is the main heavy lifter of the parser. The section is processed by
+        :py:meth:`_parse_section_g` and the sections that it has to visit (the
+        ``DEFAULT`` section and ``use`` links) are processed by a recursive call.
+        If :py:attr:`parse_engine` is ``"iterative"`` the work is handed to
+        :py:meth:`_parse_section_iterative` instead.
 
         Args:
             section_name (str): The name of the section being processed.
@@ -885,9 +2161,91 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         Returns:
             :attr:`~HandlerParameters.data_shared`
         """
-        self._validate_parameter(section_name, (str))
-        self._validate_parameter(initialize, (bool))
-        self._validate_parameter(finalize, (bool))
+        if self.parse_engine == "iterative":
+            return self._parse_section_iterative(section_name, handler_parameters, initialize, finalize)
+
+        section_g = self._parse_section_g(section_name, handler_parameters, initialize, finalize)
+        try:
+            request = next(section_g)
+            while True:
+                try:
+                    self._parse_section_r(*request)
+                except Exception as ex:
+                    # Hand the exception to the section that requested the visit.
+                    request = section_g.throw(ex)
+                else:
+                    request = next(section_g)
+        except StopIteration as ex:
+            return ex.value
+
+    def _parse_section_iterative(self, section_name, handler_parameters=None, initialize=True, finalize=True):
+        """Iterative driver of the parser.
+
+        Like :py:meth:`_parse_section_r` the sections are processed by
+        :py:meth:`_parse_section_g`, but the sections being visited are kept on an
+        explicit stack of generators instead of Python's call stack. The depth of
+        ``use`` chains is therefore not limited by the recursion limit.
+
+        Args:
+            section_name (str): The name of the section being processed.
+            handler_parameters (HandlerParameters): The parameters passed to
+                the handler.
+            initialize (bool): See :py:meth:`_parse_section_r`.
+            finalize (bool): See :py:meth:`_parse_section_r`.
+
+        Returns:
+            :attr:`~HandlerParameters.data_shared`
+        """
+        stack = [self._parse_section_g(section_name, handler_parameters, initialize, finalize)]
+        pending_exception = None
+
+        while True:
+            section_g = stack[-1]
+            try:
+                if pending_exception is None:
+                    request = next(section_g)
+                else:
+                    ex, pending_exception = pending_exception, None
+                    request = section_g.throw(ex)
+            except StopIteration as ex:
+                stack.pop()
+                if len(stack) == 0:
+                    return ex.value
+                continue
+            except Exception as ex:
+                # Hand the exception to the section that requested the visit, the
+                # same way it would propagate out of a recursive call.
+                stack.pop()
+                if len(stack) == 0:
+                    raise
+                pending_exception = ex
+                continue
+
+            stack.append(self._parse_section_g(*request))
+
+    def _parse_section_g(self, section_name, handler_parameters, initialize, finalize):
+        """Process a section (generator used by both parse engines).
+
+        The sections that have to be visited from this one (the ``DEFAULT`` section
+        and ``use`` links) are *yielded* to the driver (:py:meth:`_parse_section_r`
+        or :py:meth:`_parse_section_iterative`) as
+        ``(section_name, handler_parameters, initialize, finalize)`` requests, which
+        it processes before resuming the generator. Exceptions raised while
+        processing a request are thrown back into the generator.
+
+        Args:
+            See :py:meth:`_parse_section_r`.
+
+        Returns:
+            :attr:`~HandlerParameters.data_shared` (as the generator's return value)
+        """
+        trusted_mode = self.trusted_mode
+        if not trusted_mode:
+            self._validate_parameter(section_name, (str))
+            self._validate_parameter(initialize, (bool))
+            self._validate_parameter(finalize, (bool))
+
+        is_root = handler_parameters is None
 
         # Initialize handler_parameters if not currently set up.
         if handler_parameters is None:
@@ -899,6 +2257,12 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
             handler_parameters.section_root = section_name
 
+            # Track every section visited from this root (its `use` closure).
+            handler_parameters.data_internal['visited_sections'] = set()
+
+            # Each root section reports the `use` cycles it hits.
+            self._reset_lazy_attr("_use_graph_cycles_reported")
+
             # Pitfall: Only add 'sections_checked' for the _root_ node
             #          because configparserenhanceddata recurses through and we
             #          want it's "meta section" to encapsulate the result
@@ -918,17 +2282,25 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             handler_initialize_params = self._new_handler_parameters(handler_parameters)
             handler_initialize_params.handler_name = "handler_initialize"
             self.handler_initialize(section_name, handler_initialize_params)
+            self._release_handler_parameters(handler_initialize_params)
 
             if self.configparserdata.has_section(self.default_section_name):
-                self._parse_section_r(
-                    self.default_section_name,
-                    handler_parameters=handler_parameters,
-                    initialize=False,
-                    finalize=False
-                )
+                yield (self.default_section_name, handler_parameters, False, False)
+
+        profile_enabled = self.profile_enabled
+        if profile_enabled:
+            self._profile_enter("section", section_name)
 
-        self.debug_message(1, f">>> Enter section    : `{section_name}`") # Console Logging
-        self._loginfo_add('section-entry', {'name': section_name})      # Logging
+        # Debugging messages and logging are guarded so they cost nothing when disabled.
+        # The `_loginfo` records don't depend on the debug categories.
+        debug_enabled = self.debug_enabled(1, "section")
+        debug_enabled_options = self.debug_enabled(2, "section")
+        loginfo_enabled = self.debug_level > 0
+
+        if debug_enabled:
+            self.debug_message(1, f">>> Enter section    : `{section_name}`", category="section")
+        if loginfo_enabled:
+            self._loginfo_add('section-entry', {'name': section_name})      # Logging
 
         # Load the section from the configparser.ConfigParser data.
         current_section = None
@@ -947,60 +2319,83 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         self.configparserenhanceddata.add_section(section_name)
 
+        use_section_cache = self.use_section_cache
+        section_cache_entry = None
+        if use_section_cache:
+            section_cache_entry = self._section_cache_lookup(section_name, handler_parameters)
+
         # Initialize and set processed_sections.
-        self._validate_handlerparameters(handler_parameters)
+        if not trusted_mode:
+            self._validate_handlerparameters(handler_parameters)
         handler_parameters.data_internal['processed_sections'].add(section_name)
+        handler_parameters.data_internal['visited_sections'].add(section_name)
 
-        for sec_k, sec_v in current_section.items():
-            sec_k = str(sec_k).strip()
-
-            # sec_v should be either a string or a NoneType entry. In the
-            # general case of either `key: value` or `key = value`, the value
-            # will be a string.  If the user specified `key:` (that is, with a
-            # separator, but without a value), then the value is the empty
-            # string "".  If the user omits the separator *and* the value,
-            # e.g., by specifying only `key`, then the value will be a
-            # NoneType.
-            if sec_v is not None:
-                sec_v = str(sec_v).strip()
-                sec_v = sec_v.strip('"')
-
-            handler_parameters.raw_option = (sec_k, sec_v)
-            handler_parameters.value = sec_v
-
-            self.debug_message(2, f"==>")
-            self.debug_message(2, f"==> Entry        : `{sec_k}` : `{sec_v}`")         # Console
-            self.debug_message(2, f"==>")
-            self._loginfo_add('section-key-value', {'key': sec_k, 'value': sec_v}) # Logging
-
-            # sec_k_tok = shlex.split(sec_k)                                                        # DEPRECATED
-            sec_k_tok = self._tokenize_option_key(sec_k)
-
-            if not re.match(r"^[\w\-]+$", sec_k_tok[0]):
-                # Call generic_handler if the first entry has invalid characters
-                self._launch_generic_option_handler(section_name, handler_parameters, sec_k, sec_v)
-            else:
-                # Otherwise, it _could_ be a 'handled' operation
-                op, params = self._get_op_components_from_tokenized_option_key(sec_k_tok)
-
-                #op = self._apply_transformation_to_operation(op)                                   # DEPRECATED
-                #params = [self._apply_transformation_to_parameter(x) for x in params]              # DEPRECATED
+        if section_cache_entry is not None:
+            self._section_cache_replay(section_name, handler_parameters, section_cache_entry)
+        else:
+            if use_section_cache:
+                self._section_cache_push_recorder(section_name, handler_parameters)
 
-                handler_parameters.op = op
-                handler_parameters.params = params
+            for plan_entry in self._get_section_plan(section_name, current_section):
+                sec_k = plan_entry.key
+                sec_v = plan_entry.value
 
-                self._loginfo_add('section-operation', {'op': op, 'params': params}) # Logging
-                self.debug_message(2, f" -> op           : {handler_parameters.op}")     # Console
-                self.debug_message(2, f" -> params       : {handler_parameters.params}") # Console
-                self.debug_message(2, f" -> value        : {handler_parameters.value}")  # Console
+                handler_parameters.raw_option = (sec_k, sec_v)
+                handler_parameters.value = sec_v
 
-                handler_name, ophandler_f = self._locate_handler_method(handler_parameters.op)
+                if debug_enabled_options:
+                    self.debug_message(2, f"==>", category="section")
+                    self.debug_message(2, f"==> Entry        : `{sec_k}` : `{sec_v}`", category="section")
+                    self.debug_message(2, f"==>", category="section")
+                if loginfo_enabled:
+                    self._loginfo_add('section-key-value', {'key': sec_k, 'value': sec_v}) # Logging
 
-                if ophandler_f is not None:
-                    handler_parameters.handler_name = handler_name
-                    ophandler_f(section_name, handler_parameters)
-                else:
+                if plan_entry.op is None:
+                    # Call generic_handler if the first entry has invalid characters
                     self._launch_generic_option_handler(section_name, handler_parameters, sec_k, sec_v)
+                else:
+                    # Otherwise, it _could_ be a 'handled' operation
+                    op = plan_entry.op
+                    params = list(plan_entry.params)
+
+                    handler_parameters.op = op
+                    handler_parameters.params = params
+
+                    if loginfo_enabled:
+                        self._loginfo_add('section-operation', {'op': op, 'params': params}) # Logging
+                    if debug_enabled_options:
+                        self.debug_message(
+                            2, f" -> op           : {handler_parameters.op}", category="section"
+                        )
+                        self.debug_message(
+                            2, f" -> params       : {handler_parameters.params}", category="section"
+                        )
+                        self.debug_message(
+                            2, f" -> value        : {handler_parameters.value}", category="section"
+                        )
+
+                    if plan_entry.handler_op is None:
+                        handler_name, ophandler_f = self._locate_handler_method(op)
+                    else:
+                        handler_name, ophandler_f = self._locate_dispatched_handler(
+                            plan_entry.handler_op, plan_entry.dispatch_entry
+                        )
+
+                    if ophandler_f is not None:
+                        if use_section_cache and getattr(ophandler_f, "section_cache_optout", False):
+                            self._section_cache_disable_recorders(handler_parameters)
+                        handler_parameters.handler_name = handler_name
+                        if getattr(ophandler_f, "__func__", None) is ConfigParserEnhanced._handler_use:
+                            # Visit the `use`-d section through the driver. Subclasses
+                            # that override `_handler_use` get their handler called as-is.
+                            yield from self._use_section_g(section_name, handler_parameters)
+                        else:
+                            ophandler_f(section_name, handler_parameters)
+                    else:
+                        self._launch_generic_option_handler(section_name, handler_parameters, sec_k, sec_v)
+
+            if use_section_cache:
+                self._section_cache_pop_recorder(section_name, handler_parameters)
 
         # If we're exiting recursion from the root node and and finalize is
         # enabled, we call the finalize handler.
@@ -1008,27 +2403,71 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             handler_finalize_params = self._new_handler_parameters(handler_parameters)
             handler_finalize_params.handler_name = "handler_finalize"
             self.handler_finalize(section_name, handler_finalize_params)
+            self._release_handler_parameters(handler_finalize_params)
 
         # Remove the section from the `processed_sections` field when we exit.
         # - This properly enables a true depth-first search of `use` links.
-        self._validate_handlerparameters(handler_parameters)
+        if not trusted_mode:
+            self._validate_handlerparameters(handler_parameters)
         handler_parameters.data_internal['processed_sections'].remove(section_name)
 
+        # Save the `use` closure of the root section so that `refresh()` can
+        # tell if the section is affected by a change.
+        if is_root:
+            self.configparserenhanceddata._section_closures[section_name] = frozenset(
+                handler_parameters.data_internal['visited_sections']
+            )
+
         # Set up the return value.
         output = handler_parameters.data_shared
 
+        # This level's HandlerParameters can be reused once we've left it.
+        self._release_handler_parameters(handler_parameters)
+
         # Finalize the logging data / output
-        self._loginfo_add('section-exit', {'name': section_name})      # Logging
-        self.debug_message(1, "Exit section: `{}`".format(section_name)) # Console
+        if loginfo_enabled:
+            self._loginfo_add('section-exit', {'name': section_name})      # Logging
+        if debug_enabled:
+            self.debug_message(1, "Exit section: `{}`".format(section_name), category="section") # Console
+
+        if profile_enabled:
+            self._profile_exit()
 
         return output
 
     def _tokenize_option_key(self, option_key):
         """
+        Split an option key into tokens using the same rules as ``shlex.split``.
+
+        Subclasses may override this to change how option keys are tokenized.
+
+        Returns:
+            list: A list of ``str`` tokens.
+        """
+        option_key = str(option_key).strip()
+        option_key_tok, _ = _tokenize_option_key_cached(option_key)
+        return list(option_key_tok)
+
+    def _tokenize_and_classify_option_key(self, option_key) -> tuple:
+        """
+        Tokenize an option key and check if its first token can be an *operation*.
+
+        Tokenization results are cached (see :py:func:`_tokenize_option_key_cached`)
+        so a key is only tokenized once no matter how many sections it appears in.
+        If a subclass overrides :py:meth:`_tokenize_option_key` then the override
+        is called instead of the cached tokenizer.
+
+        Returns:
+            tuple: A tuple ``(tokens, is_operation)`` where ``tokens`` is a ``tuple``
+                of ``str`` and ``is_operation`` is a ``bool``.
         """
         option_key = str(option_key).strip()
-        option_key_tok = shlex.split(option_key)
-        return option_key_tok
+        if type(self)._tokenize_option_key is not ConfigParserEnhanced._tokenize_option_key:
+            option_key_tok = tuple(self._tokenize_option_key(option_key))
+            is_operation = len(option_key_tok) > 0
+            is_operation = is_operation and _re_operation_token.match(option_key_tok[0]) is not None
+            return (option_key_tok, is_operation)
+        return _tokenize_option_key_cached(option_key)
 
     def _get_op_components_from_tokenized_option_key(self, option_key_tok):
         """
@@ -1082,8 +2521,18 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         Returns:
             :class:`~configparserenhanced.HandlerParameters` object.
+
+        Note:
+            Objects released by :meth:`_release_handler_parameters` are reused
+            before new ones are created.
         """
-        new_handler_parameters = HandlerParameters()
+        if not hasattr(self, "_handler_parameters_pool"):
+            self._handler_parameters_pool = []
+
+        if self._handler_parameters_pool:
+            new_handler_parameters = self._handler_parameters_pool.pop()
+        else:
+            new_handler_parameters = HandlerParameters()
         new_handler_parameters.data_internal['processed_sections'] = set()
 
         # Copy the 'persistent' state from the old handler_parameters object.
@@ -1094,6 +2543,37 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
 
         return new_handler_parameters
 
+    def _release_handler_parameters(self, handler_parameters) -> None:
+        """Release a :class:`~configparserenhanced.HandlerParameters` object for reuse.
+
+        The parser calls this when it is done with a ``HandlerParameters`` object
+        (i.e., when it leaves a level of recursion or a ``handler_initialize()``
+        or ``handler_finalize()`` call returns). The object is reset and kept so
+        that :meth:`_new_handler_parameters` can hand it out again rather than
+        allocating a new one for every section visited.
+
+        Only plain :class:`~configparserenhanced.HandlerParameters` objects are
+        reused, so subclasses that override :meth:`_new_handler_parameters` to
+        return their own type are not affected.
+
+        Objects are only reused if :py:attr:`reuse_handler_parameters` is enabled.
+
+        Note:
+            While reuse is enabled, handlers must not keep a reference to the
+            ``handler_parameters`` object they are given after they return. Keep
+            references to the ``data_shared`` entries instead.
+        """
+        if type(handler_parameters) is not HandlerParameters or not self.reuse_handler_parameters:
+            return
+
+        if not hasattr(self, "_handler_parameters_pool"):
+            self._handler_parameters_pool = []
+
+        if len(self._handler_parameters_pool) < HANDLER_PARAMETERS_POOL_SIZE:
+            handler_parameters.__init__()
+            self._handler_parameters_pool.append(handler_parameters)
+        return
+
     def _apply_transformation_to_operation(self, operation) -> str:
         """
         Apply transformations to the **operator** parameters which are necessary
@@ -1142,182 +2622,1031 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         the *PUBLIC* handler definition to execute.
 
         Args:
-            operation (str): The operation parameter that is converted to
-              a proper handler name of the form ``_handler_{operation}()``
-              or ``handler_{operation}()``.
+            operation (str): The operation parameter that is converted to
+              a proper handler name of the form ``_handler_{operation}()``
+              or ``handler_{operation}()``.
+
+        Returns:
+            tuple: A tuple containing the ``(handler_name, handler_method)`` where:
+              - ``handler_name`` is a string.
+              - ``handler_method`` is either a reference to the handler method
+                if it exists, or None if it does not exist.
+
+        Raises:
+            AmbiguousHandlerError: An ``AmbiguousHandlerError`` might be raised
+                if both a *public* and a *private* handler of the same name are
+                defined and the ``exception_control_level`` is set to raise
+                exceptions for "SERIOUS" events.
+        """
+        if not self.trusted_mode:
+            self._validate_parameter(operation, (str))
+
+        handler_name = operation
+        handler_name = self._apply_transformation_to_operation(handler_name)
+
+        dispatch_entry = self._get_bound_handler_dispatch_table().get(handler_name, None)
+
+        return self._locate_dispatched_handler(handler_name, dispatch_entry)
+
+    def _locate_dispatched_handler(self, handler_name, dispatch_entry) -> tuple:
+        """Get the reference to the handler for an entry of the dispatch table.
+
+        This is the second half of :py:meth:`_locate_handler_method`, which is also
+        used to replay section plans (see :py:meth:`_get_section_plan`) where the
+        dispatch table lookup was done when the plan was compiled.
+
+        Args:
+            handler_name (str): The (transformed) operation.
+            dispatch_entry (tuple): The entry of the bound dispatch table for ``handler_name``
+                (see :py:meth:`_get_bound_handler_dispatch_table`) or ``None``.
+
+        Returns:
+            tuple: A tuple ``(handler_name, handler_method)``, see
+            :py:meth:`_locate_handler_method`.
+        """
+        output = (None, None)
+
+        if dispatch_entry is None:
+            self.debug_message(
+                4,
+                lambda: f" -> No handler found for operation `{handler_name}`",
+                category="handler",
+                lazy=True
+            )
+        else:
+            handler_name_located, handler_method, ambiguous = dispatch_entry
+
+            if ambiguous:
+                message = "Ambiguous handler name."
+                message += " Both `_handler_{}` and `handler_{}` exist".format(handler_name, handler_name)
+                message += " but only one is allowed."
+                self.exception_control_event("SERIOUS", AmbiguousHandlerError, message)
+
+            output = (handler_name_located, handler_method)
+            self.debug_message(
+                4, lambda: f" -> Using handler: `{handler_name_located}`", category="handler", lazy=True
+            )
+
+        return output
+
+    @classmethod
+    def _get_handler_dispatch_table(cls) -> dict:
+        """Get the handler dispatch table for this class.
+
+        The dispatch table maps an *operation* name (after the transformation
+        applied by :py:meth:`_apply_transformation_to_operation`) to the name
+        and the (unbound) function of the handler method that processes it. The
+        table is built lazily the first time it is needed and cached on the class
+        itself, so each subclass gets its own table and the scan of the class
+        members is only done once. Each parser binds the functions once, see
+        :py:meth:`_get_bound_handler_dispatch_table`.
+
+        Handlers may be *public* (``handler_<operation>``) or *private*
+        (``_handler_<operation>``). If both exist for the same operation the
+        *public* handler is selected and the entry is flagged as ambiguous so
+        that :py:meth:`_locate_handler_method` can raise the
+        ``AmbiguousHandlerError`` event.
+
+        Returns:
+            dict: A dictionary of ``{ operation: (handler_name, handler_function, ambiguous) }``
+                entries, where ``handler_name`` is a ``str``, ``handler_function``
+                is the attribute of the class that defines the handler and
+                ``ambiguous`` is a ``bool``.
+
+        The operations of the handlers (one per handler method, in the order of the
+        method names) are saved with the table for :py:meth:`get_known_operations`.
+
+        Note:
+            Handlers added to a class *after* its table has been built will not
+            be found. Defining handlers in the class body (the normal case) or
+            via a subclass is fine.
+        """
+        # Note: look in cls.__dict__ directly so that a table cached on a parent
+        #       class is not picked up by subclasses through inheritance.
+        table = cls.__dict__.get("_dispatch_table_cache", None)
+        if table is not None:
+            return table
+
+        re_handler_name = re.compile(r"^(_?)handler_(.+)$")
+
+        table = {}
+        known_operations = []
+        for method_name in dir(cls):
+            match = re_handler_name.match(method_name)
+            if match is None:
+                continue
+            if not callable(getattr(cls, method_name, None)):
+                continue
+
+            is_private = match.group(1) == "_"
+            operation = match.group(2)
+
+            if operation not in ("initialize", "finalize"):
+                known_operations.append(operation.replace("_", "-"))
+
+            # Get the function itself (not bound to the class) from the class that defines it.
+            method_f = next(x.__dict__[method_name] for x in cls.__mro__ if method_name in x.__dict__)
+
+            if operation not in table:
+                table[operation] = (method_name, method_f, False)
+            elif is_private:
+                table[operation] = table[operation][: 2] + (True, )
+            else:
+                table[operation] = (method_name, method_f, True)
+
+        cls._known_operations_cache = tuple(known_operations)
+        cls._dispatch_table_cache = table
+        return table
+
+    def _get_bound_handler_dispatch_table(self) -> dict:
+        """Get the handler dispatch table with the handlers bound to this parser.
+
+        This is :py:meth:`_get_handler_dispatch_table` with each function bound to
+        this parser, so that finding the handler of an operation is a single ``dict``
+        lookup. The table is built the first time it is needed by each parser.
+        Handlers set on the parser object itself, and overrides of
+        :py:meth:`_locate_class_method`, are used when the table is built.
+
+        Returns:
+            dict: A dictionary of ``{ operation: (handler_name, handler_method, ambiguous) }``
+                entries, where ``handler_method`` is the bound method.
+        """
+        # Note: the table is stored with the parser it belongs to so that a (shallow)
+        #       copy of the parser doesn't use the handlers bound to the original.
+        table_data = self.__dict__.get("_bound_dispatch_table_data", None)
+        if table_data is not None and table_data[0] is self:
+            return table_data[1]
+
+        cls = type(self)
+        locate_overridden = cls._locate_class_method is not ConfigParserEnhanced._locate_class_method
+
+        table = {}
+        for operation, (method_name, method_f, ambiguous) in cls._get_handler_dispatch_table().items():
+            if locate_overridden or method_name in self.__dict__ or not hasattr(method_f, "__get__"):
+                method_bound = self._locate_class_method(method_name)[1]
+            else:
+                method_bound = method_f.__get__(self, cls)
+            table[operation] = (method_name, method_bound, ambiguous)
+
+        self._bound_dispatch_table_data = (self, table)
+        return table
+
+    def _locate_class_method(self, method_name) -> tuple:
+        """Helper that locates a class method (if it exists)
+
+        Args:
+            method_name (str): The name of the class method we're searching for.
+
+        Returns:
+            tuple: A tuple containing the name and a reference to the method if it
+                is found or None if not found. ``(method_name, method_ref or None)``
+        """
+        output = (None, None)
+        method_f = getattr(self, method_name, None)
+        output = (method_name, method_f)
+
+        if output[1] == None:
+            self.debug_message(5, f" -> Class method `{method_name}` was not found.", category="handler")
+
+        return output
+
+    def _operation_handler_enter(self, handler_name, section_name, handler_parameters) -> bool:
+        """Steps done by the :py:meth:`operation_handler` wrapper before a handler runs.
+
+        Args:
+            handler_name (str): The name of the handler (used by the profiler).
+            section_name (str): The name of the section being processed.
+            handler_parameters (HandlerParameters): The parameters passed to the handler.
+
+        Returns:
+            bool: The value of :py:attr:`profile_enabled`, which must be passed to
+            :py:meth:`_operation_handler_exit`.
+        """
+        if not self.trusted_mode:
+            self._validate_parameter(section_name, (str))
+        profile_enabled = self.profile_enabled
+        if profile_enabled:
+            self._profile_enter("handler", handler_name)
+        self.enter_handler(handler_parameters)
+        return profile_enabled
+
+    def _operation_handler_exit(self, handler_parameters, handler_rval, profile_enabled) -> None:
+        """Steps done by the :py:meth:`operation_handler` wrapper after a handler runs.
+
+        Args:
+            handler_parameters (HandlerParameters): The parameters passed to the handler.
+            handler_rval (int): The return value from the handler.
+            profile_enabled (bool): The value returned by :py:meth:`_operation_handler_enter`.
+        """
+        self.exit_handler(handler_parameters)
+        if profile_enabled:
+            self._profile_exit()
+        self._check_handler_rval(handler_parameters.handler_name, handler_rval)
+        return
+
+    def _check_handler_rval(self, handler_name, handler_rval) -> 0:
+        """Check the returned value from a handler.
+
+        Args:
+            handler_name (string): The name of the handler.
+            handler_rval (int): The return value from a handler being processed.
+
+        Returns:
+            int: Returns a 0 if everything is ok or a 1 if a warning occurred.
+
+        Raises:
+            RuntimeError: If ``handler_rval > 0`` and the ``exception_control_level``
+                is high enough, depending on the value of ``handler_rval``.
+        """
+        if not self.trusted_mode:
+            self._validate_parameter(handler_name, (str))
+        self._validate_parameter(handler_rval, (int))
+
+        self.debug_message(
+            2, lambda: f"_check_handler_rval({handler_name}, {handler_rval})", category="handler", lazy=True
+        )
+
+        output = 0
+        if handler_rval == 0:
+            pass
+        elif handler_rval <= 10:
+            # These rvals are currently reserved. If someone uses it we should
+            # throw a critical error to get the developers' attention to either
+            # expand rval handling or users should use something > 10.
+            self.exception_control_event(
+                "WARNING", RuntimeError, f"Handler `{handler_name}` returned {handler_rval}"
+            )
+            output = 1
+        else:
+            self.exception_control_event(
+                "CATASTROPHIC", RuntimeError, f"Handler `{handler_name}` returned {handler_rval}"
+            )
+        return output
+
+    def _launch_generic_option_handler(self, section_name, handler_parameters, sec_k, sec_v) -> int:
+        """Launcher for ``_generic_option_handler()``
+
+        ``_generic_option_handler()`` is called in two places inside the recursive parser.
+
+        1. It is called when the ``key:value`` pair in an option does not parse out
+           to ``operation`` and ``parameter`` fields.
+        2. It is called when the ``key:value`` pair in an option does parse to
+           an ``operation`` and a ``parameter`` field, but there are no handlers
+           defined for the ``operation``.
+
+        This helper just manages the call in both places so thay're done the same way.
+
+        Returns:
+            int: Returns the output value from ``_generic_option_handler()``
+        """
+        if not self.trusted_mode:
+            self._validate_parameter(section_name, (str))
+            self._validate_handlerparameters(handler_parameters)
+            self._validate_parameter(sec_k, (str, None))
+            self._validate_parameter(sec_v, (str, None))
+
+        output = 0
+
+        self.configparserenhanceddata.set(handler_parameters.section_root, sec_k, sec_v)
+
+        section_cache_recorders = handler_parameters.data_internal.get('section_cache_recorders', None)
+        if section_cache_recorders:
+            section_cache_recorders[-1]['entries'].append((sec_k, sec_v))
+
+        handler_parameters.handler_name = "_generic_option_handler"
+        output = self._generic_option_handler(section_name, handler_parameters)
+
+        return output
+
+    # ---------------------------------------
+    #   H A N D L E R S   ( P R I V A T E )
+    # ---------------------------------------
+
+    @operation_handler
+    def _handler_use(self, section_name, handler_parameters) -> int:
+        """
+        This is a handler that will get executed when we detect a `use` operation in
+        our parser.
+
+        Args:
+            section_name (str): The name of the section being processed.
+            handler_parameters (HandlerParameters): The parameters for the current operation.
+
+        Returns:
+            int:
+            * 0     : SUCCESS
+            * [1-10]: Reserved for future use (WARNING)
+            * > 10  : An unknown failure occurred (CRITICAL)
+
+        Todo:
+            Once we can use Python 3.8 in our environments, we can use the @final decorator
+            to mark this as something that should not be overridden. We also have to
+            import it: `from typing import final`.
+            https://stackoverflow.com/questions/321024/making-functions-non-override-able
+        """
+        op2 = handler_parameters.params[0]
+
+        if op2 not in handler_parameters.data_internal['processed_sections']:
+            self._parse_section_r(op2, handler_parameters, finalize=False)
+        else:
+            self._use_section_cycle(section_name, handler_parameters)
+
+        return 0
+
+    def _use_section_g(self, section_name, handler_parameters):
+        """Generator version of :py:meth:`_handler_use` used by :py:meth:`_parse_section_g`.
+
+        The ``use``-d section is yielded to the parser's driver instead of being
+        parsed here. The handler is entered and exited through the same steps as
+        the :py:meth:`operation_handler` wrapper around ``_handler_use`` (see
+        :py:meth:`_operation_handler_enter` and :py:meth:`_operation_handler_exit`).
+        """
+        profile_enabled = self._operation_handler_enter("_handler_use", section_name, handler_parameters)
+
+        op2 = handler_parameters.params[0]
+
+        if op2 not in handler_parameters.data_internal['processed_sections']:
+            yield (op2, handler_parameters, True, False)
+        else:
+            self._use_section_cycle(section_name, handler_parameters)
+        output = 0
+
+        self._operation_handler_exit(handler_parameters, output, profile_enabled)
+        return output
+
+    def _use_section_cycle(self, section_name, handler_parameters) -> None:
+        """Handle a ``use`` of a section that is already being processed (a cycle).
+
+        Each cycle is reported once per root section as a ``WARNING`` event, later
+        hits on the same cycle while parsing that root section are ``SILENT`` events.
+        """
+        entry = handler_parameters.raw_option
+        handler_name = handler_parameters.handler_name
+        op1 = handler_parameters.op
+        op2 = handler_parameters.params[0]
+
+        self._loginfo_add('cycle-detected', {'sec-src': section_name, 'sec-dst': op1}) # Logging
+        self._loginfo_add('handler-exit', {'name': handler_name, 'entry': entry})      # Logging
+
+        # The result of a search that was cut short by a cycle depends on the path
+        # taken to get here so it can't be cached.
+        self._section_cache_disable_recorders(handler_parameters)
+
+        # Cycles are matched by their sections since a cycle can gain sections as
+        # lazy_load adds them to the graph.
+        cycle = self._find_use_cycle(op2)
+        if not hasattr(self, '_use_graph_cycles_reported'):
+            self._use_graph_cycles_reported = set()
+
+        message = f"Detected a cycle in `use` dependencies in .ini file {self.inifilepath}.\n"
+        message += f"- cannot load [{op2}] from [{section_name}]."
+        if cycle is not None:
+            message += "\n- sections in the cycle: " + ", ".join(f"[{x}]" for x in cycle)
+
+        if cycle is None or self._use_graph_cycles_reported.isdisjoint(cycle):
+            self._use_graph_cycles_reported.update(cycle or ())
+            self.exception_control_event("WARNING", ValueError, message)
+        else:
+            self.exception_control_event("SILENT", ValueError, message)
+        return
+
+    def _find_use_cycle(self, section_name):
+        """Find the ``use`` cycle that a section is part of, for reporting a cycle.
+
+        This is :py:meth:`UseGraph.cycle` on :py:attr:`use_graph`. Under
+        :py:attr:`lazy_load` the sections loaded since the last lookup are added
+        to the graph instead of loading every section. The sections of a cycle that
+        was just hit are all loaded since they are on the current search path.
+
+        Returns:
+            tuple: The names of the sections in the cycle or ``None`` (also if the
+            section was added to ``configparserdata`` after it was loaded).
+        """
+        if isinstance(self.configparserdata, _LazyConfigParser):
+            self._use_graph_update()
+            use_graph = self._use_graph
+        else:
+            use_graph = self.use_graph
+
+        if section_name not in use_graph:
+            return None
+        return use_graph.cycle(section_name)
+
+    # -----------------------------------------------------
+    #   P R O F I L E R   H E L P E R S   ( P R I V A T E )
+    # -----------------------------------------------------
+
+    def _profile_enter(self, category, name) -> None:
+        """Start timing a frame (root section, section or handler) for the profiler.
+
+        Frames nest, so the time spent in a frame is excluded from the self
+        time of the frame that encloses it.
+        """
+        if not hasattr(self, '_profile_stack'):
+            self._profile_stack = []
+        self._profile_stack.append([category, name, time.perf_counter(), 0.0])
+        return
+
+    def _profile_exit(self) -> None:
+        """Stop timing the innermost frame and record it in the profiler data."""
+        category, name, time_start, time_children = self._profile_stack.pop()
+        elapsed = time.perf_counter() - time_start
+
+        if len(self._profile_stack) > 0:
+            self._profile_stack[-1][3] += elapsed
+
+        # Profiler data: { category: { name: [calls, total_seconds, self_seconds] } }
+        if not hasattr(self, '_profile_entries'):
+            self._profile_entries = {}
+
+        entry = self._profile_entries.setdefault(category, {}).setdefault(name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += elapsed - time_children
+
+        threshold_ms = self.profile_threshold_ms
+        if threshold_ms is not None and category != "handler" and elapsed * 1000.0 >= threshold_ms:
+            self.debug_message(0, f"Profile: {category} `{name}` took {elapsed * 1000.0:.3f} ms")
+        return
+
+    # -----------------------------------------------------------
+    #   S E C T I O N   C A C H E   H E L P E R S   ( P R I V A T E )
+    # -----------------------------------------------------------
+
+    def _section_cache_lookup(self, section_name, handler_parameters):
+        """Look up a *replayable* cached result for a section.
+
+        A cached result can be replayed only if none of the sections in its
+        ``use`` closure are currently being processed, otherwise walking the
+        section now would hit a cycle that the cached walk did not see.
+
+        Returns:
+            tuple: The cache entry ``(entries, closure)`` or ``None`` if there
+                is no entry that can be replayed.
+        """
+        cache_entry = self.configparserenhanceddata._section_cache.get(section_name, None)
+
+        if cache_entry is not None:
+            processed_sections = handler_parameters.data_internal['processed_sections']
+            if not cache_entry[1].isdisjoint(processed_sections):
+                cache_entry = None
+
+        return cache_entry
+
+    def _section_cache_replay(self, section_name, handler_parameters, cache_entry) -> None:
+        """Replay a cached section result into the root section's data.
+
+        The cached ``(key, value)`` entries are applied in the same order that the
+        original walk set them, so the result is the same as re-walking the section.
+        """
+        entries, closure = cache_entry
+
+        if self.debug_enabled(2, "section"):
+            self.debug_message(
+                2, f"==> Replay cached result for section `{section_name}`", category="section"
+            )
+        if self.debug_level > 0:
+            self._loginfo_add('section-cache-replay', {'name': section_name})               # Logging
+
+        section_root_data = self.configparserenhanceddata.add_section(handler_parameters.section_root)
+        section_root_data.update(entries)
+
+        handler_parameters.data_internal['visited_sections'].update(closure)
+
+        section_cache_recorders = handler_parameters.data_internal.get('section_cache_recorders', None)
+        if section_cache_recorders:
+            section_cache_recorders[-1]['entries'].extend(entries)
+            section_cache_recorders[-1]['closure'].update(closure)
+        return
+
+    def _section_cache_push_recorder(self, section_name, handler_parameters) -> None:
+        """Start recording the generic options produced by walking a section."""
+        section_cache_recorders = handler_parameters.data_internal.setdefault('section_cache_recorders', [])
+        section_cache_recorders.append(
+            {
+                'entries': [],
+                'closure': {section_name},
+                'cacheable': True,
+            }
+        )
+        return
+
+    def _section_cache_pop_recorder(self, section_name, handler_parameters) -> None:
+        """Finish recording a section.
+
+        If the section's result is cacheable it is saved in the cache. The recorded
+        entries and closure are then merged into the recorder of the calling section.
+        """
+        section_cache_recorders = handler_parameters.data_internal['section_cache_recorders']
+        recorder = section_cache_recorders.pop()
+
+        if recorder['cacheable']:
+            self.configparserenhanceddata._section_cache[section_name] = (
+                tuple(recorder['entries']), frozenset(recorder['closure'])
+            )
+
+        if section_cache_recorders:
+            section_cache_recorders[-1]['entries'].extend(recorder['entries'])
+            section_cache_recorders[-1]['closure'].update(recorder['closure'])
+        return
+
+    def _section_cache_disable_recorders(self, handler_parameters) -> None:
+        """Mark every section currently being recorded as not cacheable."""
+        for recorder in handler_parameters.data_internal.get('section_cache_recorders', []):
+            recorder['cacheable'] = False
+        return
+
+    # -------------------------------------
+    #   H E L P E R S   ( P R I V A T E )
+    # -------------------------------------
+
+    def _read_inifile(self, inifilepath, check_is_file=False) -> tuple:
+        """Read a ``.ini`` file and take a snapshot of it.
+
+        Only the snapshot is kept by the parser (in ``_inifile_states``), the
+        contents are used to build :py:attr:`configparserdata` and then released.
+
+        Args:
+            inifilepath (Path,InMemorySource): The path to the ``.ini`` file or an
+                in-memory source.
+            check_is_file (bool): If ``True`` then raise an ``IOError`` if the
+                opened file is not a regular file.
+
+        Returns:
+            tuple: A tuple ``(inifile_state, content)``. ``inifile_state`` is an
+            ``_InifileState`` containing the modification time, size and content
+            hash (SHA-256) of the file and ``content`` is its raw contents (``bytes``).
+            In :py:attr:`lazy_load` mode large files are memory mapped instead of
+            read and ``content`` is ``None``. In-memory sources have no modification
+            time (``None``).
+        """
+        if isinstance(inifilepath, InMemorySource):
+            inifile_state = _InifileState(None, len(inifilepath.content), inifilepath.digest)
+            return inifile_state, inifilepath.content
+
+        with open(inifilepath, 'rb') as ifp:
+            file_stat = os.fstat(ifp.fileno())
+            if check_is_file and not stat.S_ISREG(file_stat.st_mode):
+                raise self._inifile_load_error(inifilepath)
+            if self.lazy_load and file_stat.st_size >= LAZY_LOAD_MMAP_THRESHOLD:
+                with mmap.mmap(ifp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    digest = hashlib.sha256(buffer).hexdigest()
+                return _InifileState(file_stat.st_mtime_ns, file_stat.st_size, digest), None
+            content = ifp.read()
+        digest = hashlib.sha256(content).hexdigest()
+        return _InifileState(file_stat.st_mtime_ns, file_stat.st_size, digest), content
+
+    def _read_inifiles_concurrent(self, inifilepaths) -> list:
+        """Read ``.ini`` files on a thread pool and take a snapshot of each one.
+
+        Each file is checked to be an existing regular file as part of opening
+        it (see :py:attr:`concurrent_load`).
+
+        Args:
+            inifilepaths (list): The paths (``Path``) to the ``.ini`` files or in-memory
+                sources (``InMemorySource``).
+
+        Returns:
+            list: A list of ``(inifile_state, content)`` tuples (see :py:meth:`_read_inifile`)
+            in the same order as ``inifilepaths``.
+
+        Raises:
+            IOError: If any of the files don't exist or are not files. If several
+                files can't be loaded, the error is for the first one in the list.
+        """
+
+        def read_checked(inifilepath):
+            try:
+                return self._read_inifile(inifilepath, check_is_file=True)
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                raise self._inifile_load_error(inifilepath)
+
+        max_workers = min(len(inifilepaths), CONCURRENT_LOAD_MAX_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # `map()` returns the results (and raises the errors) in order.
+            output = list(executor.map(read_checked, inifilepaths))
+        return output
+
+    def _inifile_load_error(self, inifilepath) -> IOError:
+        """Create the error raised when a ``.ini`` file can't be loaded.
+
+        Args:
+            inifilepath (Path): The path to the ``.ini`` file.
+
+        Returns:
+            IOError: The error to raise.
+        """
+        msg = f"\n" + \
+              f"+" + "="*78 + "+\n" + \
+              f"|   ERROR: Unable to load configuration .ini file\n" + \
+              f"|   - Requested file: `{inifilepath}`\n" + \
+              f"|   - CWD: `{os.getcwd()}`\n" + \
+              f"+" + "="*78 + "+\n"
+        return IOError(msg)
+
+    def _new_configparserdata(self, inifile_contents) -> configparser.ConfigParser:
+        """Create a new :class:`ConfigParser` from the loaded ``.ini`` file contents.
+
+        The contents are read in the same order as ``inifilepath`` so the result
+        is the same as handing the list of files to ``ConfigParser.read()``.
+        In :py:attr:`lazy_load` mode the files are only indexed here and sections
+        are parsed when they are accessed.
+
+        Args:
+            inifile_contents (list): The raw contents (``bytes``) of each file in
+                ``inifilepath`` (see :py:meth:`_read_inifile`).
+
+        Raises:
+            configparser.DuplicateOptionError: If a section in one of the files
+                has two options with identical keys.
+        """
+        configparser_type = _LazyConfigParser if self.lazy_load else configparser.ConfigParser
+
+        configparserdata = configparser_type(
+            allow_no_value=True,
+            delimiters=self.configparser_delimiters,
+            default_section=self._internal_default_section_name
+        )
+
+        # Prevent ConfigParser from lowercasing the keys.
+        configparserdata.optionxform = str
+
+        try:
+            for inifilepath_i, inifile_content_i in zip(self.inifilepath, inifile_contents):
+                encoding = self.encoding
+                if isinstance(inifilepath_i, InMemorySource) and inifilepath_i.encoding is not None:
+                    encoding = inifilepath_i.encoding
+                if self.lazy_load:
+                    configparserdata.add_lazy_source(str(inifilepath_i), inifile_content_i, encoding)
+                    continue
+                with io.TextIOWrapper(io.BytesIO(inifile_content_i), encoding=encoding) as ifp:
+                    configparserdata.read_file(ifp, source=str(inifilepath_i))
+        except configparser.DuplicateOptionError as ex:
+            message = "ERROR: Configparser found a section with "
+            message += "two options with identical keys."
+            self.debug_message(0, message)
+            raise ex
+
+        return configparserdata
+
+    def _new_use_graph(self) -> UseGraph:
+        """Build the graph of ``use`` links of all sections in ``configparserdata``."""
+        sections = self.configparserdata.sections()
+        return UseGraph(sections, *self._get_use_links(sections))
+
+    def _use_graph_update(self) -> None:
+        """Add the sections that :py:attr:`lazy_load` loaded since the last update to the ``use`` graph.
+
+        The graph is created (empty) the first time this is called. Each loaded
+        section is only added once, in the order the sections were loaded.
+        """
+        if not hasattr(self, '_use_graph'):
+            self._use_graph = UseGraph()
+            self._use_graph_loaded = 0
+
+        sections = self.configparserdata._lazy_loaded[self._use_graph_loaded:]
+        self._use_graph_loaded += len(sections)
+        if len(sections) > 0:
+            self._use_graph.add_sections(sections, *self._get_use_links(sections))
+        return
+
+    def _get_use_links(self, sections) -> tuple:
+        """Find the ``use`` links and option keys of sections in ``configparserdata``.
+
+        Option keys are tokenized and transformed the same way as in
+        :py:meth:`_parse_section_r` so an option is a link if its operation is
+        ``use`` and it has a parameter.
+
+        Args:
+            sections (list): The names of the sections.
 
         Returns:
-            tuple: A tuple containing the ``(handler_name, handler_method)`` where:
-              - ``handler_name`` is a string.
-              - ``handler_method`` is either a reference to the handler method
-                if it exists, or None if it does not exist.
+            tuple: The ``edges`` and ``options`` dicts for :class:`UseGraph`.
+        """
+        edges = {}
+        options = {}
+        for section in sections:
+            targets = edges[section] = []
+            option_keys = options[section] = []
+            for option_key in self.configparserdata[section].keys():
+                option_key = str(option_key).strip()
+                option_keys.append(option_key)
+                option_key_tok, is_operation = self._tokenize_and_classify_option_key(option_key)
+                if not is_operation or len(option_key_tok) < 2:
+                    continue
+                op, params = self._get_op_components_from_tokenized_option_key(option_key_tok)
+                if op == "use":
+                    targets.append(params[0])
+        return edges, options
+
+    def _get_section_plan(self, section_name, current_section) -> tuple:
+        """Get the compiled plan of a section.
+
+        The plan of a section holds the work on its options that does not change
+        between visits: the cleaned up key and value, the tokenized and transformed
+        operation and parameters, and the handler dispatch table lookup. Plans are
+        compiled on the first visit of a section and replayed by later visits (from
+        any root section and any parse).
+
+        Plans are held by :py:attr:`configparserenhanceddata` and are discarded at
+        the same points as its cached section results: when the ``.ini`` data is
+        reloaded (e.g., :py:attr:`inifilepath` or :py:attr:`configparser_delimiters`
+        change) or, for the changed sections, by :py:meth:`refresh`. Like the parsed
+        results, they don't follow changes made directly to :py:attr:`configparserdata`.
+
+        If a subclass overrides :py:meth:`_locate_handler_method`, the handler of each
+        operation is looked up by the override on every visit instead of being kept
+        in the plan.
 
-        Raises:
-            AmbiguousHandlerError: An ``AmbiguousHandlerError`` might be raised
-                if both a *public* and a *private* handler of the same name are
-                defined and the ``exception_control_level`` is set to raise
-                exceptions for "SERIOUS" events.
+        Args:
+            section_name (str): The name of the section.
+            current_section (configparser.SectionProxy): The section in ``configparserdata``.
+
+        Returns:
+            tuple: A tuple of ``_SectionPlanEntry`` entries, one per option in the
+            order of the section.
         """
-        self._validate_parameter(operation, (str))
+        section_plans = self.configparserenhanceddata._section_plans
 
-        handler_name = operation
-        handler_name = self._apply_transformation_to_operation(handler_name)
+        plan = section_plans.get(section_name, None)
+        if plan is None:
+            plan = self._compile_section_plan(current_section)
+            section_plans[section_name] = plan
+        return plan
+
+    def _compile_section_plan(self, current_section) -> tuple:
+        """Compile the plan of a section (see :py:meth:`_get_section_plan`)."""
+        dispatch_table = self._get_bound_handler_dispatch_table()
+        locate_handler_method = type(self)._locate_handler_method
+        locate_overridden = locate_handler_method is not ConfigParserEnhanced._locate_handler_method
+
+        output = []
+        for sec_k, sec_v in current_section.items():
+            sec_k = str(sec_k).strip()
 
-        handler_name_private = "_handler_{}".format(handler_name)
-        handler_name_public = "handler_{}".format(handler_name)
+            # sec_v should be either a string or a NoneType entry. In the
+            # general case of either `key: value` or `key = value`, the value
+            # will be a string.  If the user specified `key:` (that is, with a
+            # separator, but without a value), then the value is the empty
+            # string "".  If the user omits the separator *and* the value,
+            # e.g., by specifying only `key`, then the value will be a
+            # NoneType.
+            if sec_v is not None:
+                sec_v = str(sec_v).strip()
+                sec_v = sec_v.strip('"')
 
-        handler_public = self._locate_class_method(handler_name_public)
-        handler_private = self._locate_class_method(handler_name_private)
+            sec_k_tok, is_operation = self._tokenize_and_classify_option_key(sec_k)
 
-        if (handler_private[1] is not None) and (handler_public[1] is not None):
-            message = "Ambiguous handler name."
-            message += " Both `{}` and `{}` exist".format(handler_name_private, handler_name_public)
-            message += " but only one is allowed."
-            self.exception_control_event("SERIOUS", AmbiguousHandlerError, message)
+            if not is_operation:
+                output.append(_SectionPlanEntry(sec_k, sec_v, None, None, None, None))
+                continue
 
-        output = (None, None)
-        if handler_public[1] is not None:
-            self.debug_message(4, f" -> Using _public_ handler : `{handler_name_public}`")  # Console
-            output = handler_public
-        elif handler_private[1] is not None:
-            self.debug_message(4, f" -> Using _private_ handler: `{handler_name_private}`") # Console
-            output = handler_private
-        else:
-            self.debug_message(4, f" -> No handler found for operation `{handler_name}`")   # Console
+            op, params = self._get_op_components_from_tokenized_option_key(sec_k_tok)
+            if locate_overridden:
+                output.append(_SectionPlanEntry(sec_k, sec_v, op, tuple(params), None, None))
+                continue
 
-        return output
+            handler_op = self._apply_transformation_to_operation(op)
+            output.append(
+                _SectionPlanEntry(
+                    sec_k, sec_v, op, tuple(params), handler_op, dispatch_table.get(handler_op, None)
+                )
+            )
+        return tuple(output)
 
-    def _locate_class_method(self, method_name) -> tuple:
-        """Helper that locates a class method (if it exists)
+    def _parse_cache_key(self, inifile_states) -> str:
+        """Generate the key used for entries in the on-disk parse cache.
 
         Args:
-            method_name (str): The name of the class method we're searching for.
+            inifile_states (list): A list of ``_InifileState`` entries for each
+                file in ``inifilepath``.
 
         Returns:
-            tuple: A tuple containing the name and a reference to the method if it
-                is found or None if not found. ``(method_name, method_ref or None)``
+            str: A hex digest that identifies the cache entry.
         """
-        output = (None, None)
-        method_f = getattr(self, method_name, None)
-        output = (method_name, method_f)
+        key_parts = [
+            f"format={PARSE_CACHE_FORMAT_VERSION}",
+            f"version={__version__}",
+            f"class={type(self).__module__}.{type(self).__qualname__}",
+            f"class_version={self.parse_cache_version!r}",
+            f"handlers={self._get_handler_code_digest()}",
+            f"delimiters={self.configparser_delimiters!r}",
+            f"encoding={self.encoding!r}",
+            f"default_section_name={self.default_section_name!r}",
+            f"internal_default_section_name={self._internal_default_section_name!r}",
+            f"lazy_load={self.lazy_load}",
+        ]
+        key_parts += [f"file={x.digest}" for x in inifile_states]
+        return hashlib.sha256("\n".join(key_parts).encode('utf-8')).hexdigest()
 
-        if output[1] == None:
-            self.debug_message(5, f" -> Class method `{method_name}` was not found.") # Console
+    @classmethod
+    def _get_handler_code_digest(cls) -> str:
+        """Get a hash of the code of the handlers of this class.
 
-        return output
+        The hash covers every handler in the dispatch table (see
+        :py:meth:`_get_handler_dispatch_table`) plus :meth:`handler_initialize` and
+        :meth:`handler_finalize`, so a change to any of them gives a new
+        :py:meth:`_parse_cache_key`. Like the dispatch table, the hash is computed
+        once and cached on the class.
 
-    def _check_handler_rval(self, handler_name, handler_rval) -> 0:
-        """Check the returned value from a handler.
+        Returns:
+            str: A hex digest of the handlers' code.
+        """
+        digest = cls.__dict__.get("_handler_code_digest_cache", None)
+        if digest is not None:
+            return digest
+
+        handler_names = {x[0] for x in cls._get_handler_dispatch_table().values()}
+        handler_names |= {"handler_initialize", "handler_finalize"}
+
+        hasher = hashlib.sha256()
+        for handler_name in sorted(handler_names):
+            handler_f = inspect.unwrap(getattr(cls, handler_name))
+            handler_code = getattr(handler_f, "__code__", None)
+            hasher.update(handler_name.encode('utf-8'))
+            if handler_code is not None:
+                hasher.update(marshal.dumps(handler_code))
+            else:
+                hasher.update(repr(handler_f).encode('utf-8'))
+
+        digest = hasher.hexdigest()
+        cls._handler_code_digest_cache = digest
+        return digest
+
+    def _parse_cache_is_trusted(self, path) -> bool:
+        """Check that a path in the on-disk parse cache can be trusted.
+
+        A path is trusted if it is owned by the current user and is not writable
+        by the group or others. The ownership check is skipped on platforms that
+        don't have user IDs.
 
         Args:
-            handler_name (string): The name of the handler.
-            handler_rval (int): The return value from a handler being processed.
+            path (Path, int): The file or directory (or an open file descriptor) to check.
 
         Returns:
-            int: Returns a 0 if everything is ok or a 1 if a warning occurred.
-
-        Raises:
-            RuntimeError: If ``handler_rval > 0`` and the ``exception_control_level``
-                is high enough, depending on the value of ``handler_rval``.
+            bool: ``True`` if the path can be trusted.
         """
-        self._validate_parameter(handler_name, (str))
-        self._validate_parameter(handler_rval, (int))
+        path_stat = os.stat(path)
+        if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+            return False
+        return (path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)) == 0
 
-        self.debug_message(2, f"_check_handler_rval({handler_name}, {handler_rval})")
+    def _parse_cache_load(self, cache_key):
+        """Load an entry from the on-disk parse cache.
 
-        output = 0
-        if handler_rval == 0:
+        Entries are not loaded unless the cache directory and the entry pass
+        :py:meth:`_parse_cache_is_trusted` since loading a :py:mod:`pickle` can
+        run arbitrary code.
+
+        Returns:
+            dict: The cache entry or ``None`` if there is no (usable) entry.
+        """
+        cache_file = self.cache_dir / f"{cache_key}.pickle"
+
+        output = None
+        trusted = True
+        try:
+            with open(cache_file, 'rb') as ifp:
+                trusted = self._parse_cache_is_trusted(self.cache_dir)
+                trusted = trusted and self._parse_cache_is_trusted(ifp.fileno())
+                if trusted:
+                    output = pickle.load(ifp)
+                    self.debug_message(1, f"Parse cache: loaded `{cache_file}`", category="parse") # Console
+        except FileNotFoundError:
             pass
-        elif handler_rval <= 10:
-            # These rvals are currently reserved. If someone uses it we should
-            # throw a critical error to get the developers' attention to either
-            # expand rval handling or users should use something > 10.
-            self.exception_control_event(
-                "WARNING", RuntimeError, f"Handler `{handler_name}` returned {handler_rval}"
-            )
-            output = 1
-        else:
-            self.exception_control_event(
-                "CATASTROPHIC", RuntimeError, f"Handler `{handler_name}` returned {handler_rval}"
-            )
-        return output
+        except Exception as ex:
+            self.debug_message(1, f"Parse cache: unable to load `{cache_file}`: {ex}", category="parse")
 
-    def _launch_generic_option_handler(self, section_name, handler_parameters, sec_k, sec_v) -> int:
-        """Launcher for ``_generic_option_handler()``
+        if not trusted:
+            message = f"Parse cache: skipped `{cache_file}` because it or the cache directory"
+            message += " is not owned by the current user or is writable by the group or others."
+            self.exception_control_event("WARNING", PermissionError, message)
 
-        ``_generic_option_handler()`` is called in two places inside the recursive parser.
+        if not isinstance(output, dict) or output.get('key', None) != cache_key:
+            output = None
 
-        1. It is called when the ``key:value`` pair in an option does not parse out
-           to ``operation`` and ``parameter`` fields.
-        2. It is called when the ``key:value`` pair in an option does parse to
-           an ``operation`` and a ``parameter`` field, but there are no handlers
-           defined for the ``operation``.
+        return output
 
-        This helper just manages the call in both places so thay're done the same way.
+    def _parse_cache_save(self, include_parsed_data=False) -> int:
+        """Save the current state to the on-disk parse cache.
+
+        The entry is written to a temporary file in ``cache_dir`` and then
+        renamed into place so that readers never see a partial entry.
+
+        Args:
+            include_parsed_data (bool): If ``True`` the ``configparserenhanceddata``
+                state is saved along with the ``configparserdata``.
 
         Returns:
-            int: Returns the output value from ``_generic_option_handler()``
+            int: 0 if the entry was saved, 1 if saving the entry failed.
         """
-        self._validate_parameter(section_name, (str))
-        self._validate_handlerparameters(handler_parameters)
-        self._validate_parameter(sec_k, (str, None))
-        self._validate_parameter(sec_v, (str, None))
+        cache_key = self._parse_cache_key(self._inifile_states)
 
-        output = 0
+        cache_entry = {
+            'key': cache_key,
+            'configparserdata': self._configparserdata,
+            'configparserenhanceddata': None,
+        }
+        if include_parsed_data:
+            cache_entry['configparserenhanceddata'] = self.configparserenhanceddata._get_state()
 
-        self.configparserenhanceddata.set(handler_parameters.section_root, sec_k, sec_v)
+        cache_file = self.cache_dir / f"{cache_key}.pickle"
 
-        handler_parameters.handler_name = "_generic_option_handler"
-        output = self._generic_option_handler(section_name, handler_parameters)
+        output = 0
+        tmp_filename = None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            tmp_fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".pickle")
+            with os.fdopen(tmp_fd, 'wb') as ofp:
+                pickle.dump(cache_entry, ofp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, cache_file)
+            tmp_filename = None
+            self.debug_message(1, f"Parse cache: saved `{cache_file}`", category="parse") # Console
+        except (OSError, pickle.PicklingError) as ex:
+            self.debug_message(1, f"Parse cache: unable to save `{cache_file}`: {ex}", category="parse")
+            output = 1
+        finally:
+            if tmp_filename is not None and os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
 
         return output
 
-    # ---------------------------------------
-    #   H A N D L E R S   ( P R I V A T E )
-    # ---------------------------------------
+    def _parse_sections_parallel(self, sections, jobs) -> dict:
+        """Parse root sections on a process pool and merge the results.
 
-    @operation_handler
-    def _handler_use(self, section_name, handler_parameters) -> int:
-        """
-        This is a handler that will get executed when we detect a `use` operation in
-        our parser.
+        The sections are split across ``jobs`` worker processes, each of which
+        gets a copy of this parser. Workers parse their sections without calling
+        ``handler_finalize``. Once all workers finish, the results are merged into
+        ``configparserenhanceddata`` in the order of ``sections`` and
+        ``handler_finalize`` is called *in this process* for each section with the
+        ``data_shared`` returned by the worker. This keeps any state that subclasses
+        save in ``handler_finalize`` (e.g., a cache of actions) in this object, and
+        ``parse_section_last_result`` is the same as it would be after a serial parse.
 
         Args:
-            section_name (str): The name of the section being processed.
-            handler_parameters (HandlerParameters): The parameters for the current operation.
+            sections (list): The root sections to parse.
+            jobs (int): The number of worker processes to use.
 
         Returns:
-            int:
-            * 0     : SUCCESS
-            * [1-10]: Reserved for future use (WARNING)
-            * > 10  : An unknown failure occurred (CRITICAL)
+            dict: A dictionary of ``{ section: data_shared }``.
 
-        Todo:
-            Once we can use Python 3.8 in our environments, we can use the @final decorator
-            to mark this as something that should not be overridden. We also have to
-            import it: `from typing import final`.
-            https://stackoverflow.com/questions/321024/making-functions-non-override-able
+        Note:
+            The parser (including subclasses) and the ``data_shared`` results must be
+            picklable. A :py:attr:`debug_sink` that can't be pickled (e.g., an open
+            file) is not sent to the workers, which print their debug messages instead.
         """
-        entry = handler_parameters.raw_option
-        handler_name = handler_parameters.handler_name
-        op1 = handler_parameters.op
-        op2 = handler_parameters.params[0]
+        self._validate_parameter(sections, (list))
+        self._validate_parameter(jobs, (int))
 
-        if op2 not in handler_parameters.data_internal['processed_sections']:
-            self._parse_section_r(op2, handler_parameters, finalize=False)
-        else:
-            self._loginfo_add('cycle-detected', {'sec-src': section_name, 'sec-dst': op1}) # Logging
-            self._loginfo_add('handler-exit', {'name': handler_name, 'entry': entry})      # Logging
+        # Make sure the .ini file is loaded before the parser gets copied to the workers.
+        self.configparserdata
 
-            message = f"Detected a cycle in `use` dependencies in .ini file {self.inifilepath}.\n"
-            message += f"- cannot load [{op2}] from [{section_name}]."
-            self.exception_control_event("WARNING", ValueError, message)
+        # Workers get a copy of this parser without any of the parsed state.
+        worker_parser = copy.copy(self)
+        worker_parser._reset_lazy_attr("_configparserenhanceddata")
+        worker_parser._reset_lazy_attr("_loginfo")
+        worker_parser._reset_lazy_attr("_handler_parameters_pool")
+        worker_parser._reset_lazy_attr("_unroll_base_class_parser")
+        worker_parser._reset_lazy_attr("_bound_dispatch_table_data")
 
-        return 0
+        try:
+            pickle.dumps(worker_parser.debug_sink)
+        except Exception:
+            self.debug_message(
+                1, "Parse: `debug_sink` can't be sent to the worker processes", category="parse"
+            )
+            worker_parser.debug_sink = None
 
-    # -------------------------------------
-    #   H E L P E R S   ( P R I V A T E )
-    # -------------------------------------
+        chunks = [sections[i :: jobs] for i in range(jobs)]
+        chunks = [x for x in chunks if len(x) > 0]
+
+        results = {}
+        if len(chunks) > 0:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [executor.submit(_parse_sections_worker, worker_parser, x) for x in chunks]
+                for future in futures:
+                    results.update(future.result())
+
+        output = {}
+        for section in sections:
+            data, data_shared, closure = results[section]
+
+            self.configparserenhanceddata.data[section] = data
+            self.configparserenhanceddata._sections_checked.add(section)
+            self.configparserenhanceddata._section_closures[section] = closure
+
+            handler_finalize_params = self._new_handler_parameters()
+            handler_finalize_params.section_root = section
+            handler_finalize_params.data_shared = data_shared
+            handler_finalize_params.handler_name = "handler_finalize"
+            handler_finalize_params.data_internal['processed_sections'].add(section)
+            self.handler_finalize(section, handler_finalize_params)
+
+            output[section] = handler_finalize_params.data_shared
+            self.parse_section_last_result = handler_finalize_params.data_shared
+            self._release_handler_parameters(handler_finalize_params)
+
+        return output
 
     def _reset_configparserdata(self) -> int:
         """Reset the internal state for all of the ConfigParser data.
@@ -1327,13 +3656,90 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         - ``configparserenhanceddata``
         - ``parse_section_last_result``
         - ``_loginfo``
+        - the base-class parser used by :py:meth:`unroll_to_str`
+        - ``use_graph``
+        - the compiled section plans (held by ``configparserenhanceddata``)
         """
         self._reset_lazy_attr("_loginfo")
         self._reset_lazy_attr("_configparserdata")
+        self._reset_lazy_attr("_inifile_states")
         self._reset_lazy_attr("_configparserenhanceddata")
+        self._reset_lazy_attr("_unroll_base_class_parser")
+        self._reset_lazy_attr("_use_graph")
+        self._reset_lazy_attr("_use_graph_loaded")
+        self._reset_lazy_attr("_use_graph_cycles_reported")
         del self.parse_section_last_result
         return 0
 
+    def _get_unroll_base_class_parser(self):
+        """Get the base-class parser used by :py:meth:`unroll_to_str`.
+
+        The parser is created on first use and kept until it is reset by
+        :py:meth:`_reset_configparserdata` or a change of :py:attr:`inifilepath`.
+
+        Returns:
+            ConfigParserEnhanced: A base-class parser of :py:attr:`inifilepath`.
+        """
+        if not hasattr(self, "_unroll_base_class_parser"):
+            parser = ConfigParserEnhanced(filename=self.inifilepath)
+            parser.exception_control_level = 0
+            self._unroll_base_class_parser = parser
+        return self._unroll_base_class_parser
+
+    def _unroll_iter(self, section, space_around_delimiters, use_base_class_parser):
+        """Generate the text of :py:meth:`unroll_to_str` in pieces.
+
+        Each section is generated as it is reached, so the caller can stream the
+        output (e.g., to a file) instead of building it up in memory.
+
+        Yields:
+            str: The next piece of the output.
+
+        Raises:
+            TypeError: If ``section`` is not a ``str`` or ``None`` object.
+            KeyError: If ``section`` is not a section of the parser.
+        """
+        self._validate_parameter(section, (type(None), str))
+
+        delimiter = ":"
+        if space_around_delimiters:
+            delimiter = " {} ".format(delimiter)
+
+        parser = None
+        if use_base_class_parser:
+            parser = self._get_unroll_base_class_parser()
+        else:
+            parser = self
+
+        # Turn off ECL notifications
+        ecl = parser.exception_control_level
+        parser.exception_control_level = 0
+
+        try:
+            if section is None:
+                section_list = parser.configparserenhanceddata.sections()
+            else:
+                section_list = [section]
+
+            for index, section_i in enumerate(section_list):
+                if not parser.configparserenhanceddata.has_section(section_i):
+                    raise KeyError(f"Section `{section_i}` was not found.")
+
+                # Sections are separated by a blank line.
+                lines = ["\n"] if index > 0 else []
+                lines.append(f"[{section_i}]\n")
+                for key, value in parser.configparserenhanceddata.items(section_i):
+                    if value is None:
+                        value = ""
+                    lines.append(delimiter.join([key, value]).strip() + "\n")
+                yield "".join(lines)
+
+            if len(section_list) == 0:
+                yield "\n"
+        finally:
+            # reset parser ECL (only useful when not using base class parser)
+            parser.exception_control_level = ecl
+
     def _reset_lazy_attr(self, attribute: str) -> int:
         """Deletes an attribute of the class if it exists.
 
@@ -1349,6 +3755,11 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """
         If in debug mode, we can use this to log operations by appending to ``_loginfo``.
 
+        ``_loginfo`` is a ring buffer that holds at most :py:attr:`loginfo_capacity`
+        records. Entries must not keep the parser's working state alive, so any
+        :class:`~configparserenhanced.HandlerParameters` values are replaced by a
+        snapshot of them (see :py:meth:`_loginfo_snapshot`).
+
         Args:
             typeinfo (str): The kind of operation this is. This generates the
                 'type' entry in the ``_loginfo`` dict. (Required)
@@ -1362,17 +3773,46 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             https://stackoverflow.com/questions/321024/making-functions-non-override-able
         """
         if not hasattr(self, '_loginfo'):
-            self._loginfo = []
+            self._loginfo = collections.deque(maxlen=self.loginfo_capacity)
 
         if self.debug_level > 0:
             if not isinstance(entry, dict):
                 raise TypeError("Entry should be a `dict` type.")
             entry['type'] = typeinfo
 
+            for key, value in entry.items():
+                if isinstance(value, HandlerParameters):
+                    entry[key] = self._loginfo_snapshot(value)
+
             self._loginfo.append(entry)
 
         return
 
+    def _loginfo_snapshot(self, handler_parameters) -> dict:
+        """Make a compact snapshot of a ``HandlerParameters`` object for ``_loginfo``.
+
+        The snapshot copies the small per-option fields and records the ``id()``
+        and size of ``data_shared`` and ``data_internal`` rather than keeping
+        references to them.
+
+        Args:
+            handler_parameters (HandlerParameters): The parameters to take a snapshot of.
+
+        Returns:
+            dict: The snapshot.
+        """
+        return {
+            'section_root': handler_parameters.section_root,
+            'handler_name': handler_parameters.handler_name,
+            'raw_option': handler_parameters.raw_option,
+            'op': handler_parameters.op,
+            'params': tuple(handler_parameters.params),
+            'value': handler_parameters.value,
+            'data_shared_id': id(handler_parameters.data_shared),
+            'data_shared_len': len(handler_parameters.data_shared),
+            'data_internal_id': id(handler_parameters.data_internal),
+        }
+
     def _loginfo_print(self, pretty=True) -> None:
         """
         This is a helper to pretty-print the ``_loginfo`` object.
@@ -1408,7 +3848,7 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                         self.debug_message(1, line)
                 self.debug_message(1, "")
         else:
-            print(self._loginfo)
+            print(list(self._loginfo))
 
         return
 
@@ -1425,11 +3865,7 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
         """
         output = 0
 
-        # It's pretty common for someone to enter (int, None) to isinstance()
-        # which is wrong, `None` isn't a type.
-        if not isinstance(type_restriction, tuple):
-            type_restriction = tuple([type_restriction])
-        type_restriction = tuple([x if x != None else type(x) for x in type_restriction])
+        type_restriction = _normalize_type_restriction(type_restriction)
 
         if not isinstance(parameter, type_restriction):
             output = 1
@@ -1599,7 +4035,7 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             """
             return len(self.keys())
 
-        def sections(self, parse=False):
+        def sections(self, parse=False, jobs=None):
             """
             Returns an iterable of sections in the ``.ini`` file.
 
@@ -1612,11 +4048,27 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                     - "force"  : Same as ``True`` but we *force* a (re)parse of all sections
                         even if they've already been parsed before.
 
+                jobs (int): If greater than 1 then the sections are parsed on a pool of
+                    ``jobs`` worker processes and the results are merged back in.
+                    ``handler_finalize`` is still called in this process, once per
+                    section and in order, so the results are the same as a serial parse.
+                    The owner parser and the ``data_shared`` results must be picklable.
+                    Default: ``None`` (parse serially).
+
             Returns:
                 iterable object: containing the sections in the ``.ini`` file.
+
+            Raises:
+                ValueError: If ``jobs`` is less than 1.
             """
             force_parse = False
 
+            if jobs is not None:
+                if not isinstance(jobs, int):
+                    raise TypeError("jobs must be an int type.")
+                if jobs < 1:
+                    raise ValueError("jobs must be 1 or greater.")
+
             # Check the parameters.
             if not isinstance(parse, (bool, str)):
                 raise TypeError("parse option must be a bool or str type.")
@@ -1632,8 +4084,15 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
                     )
 
             if parse:
-                for section in self.keys():
-                    self._parse_owner_section(section, force_parse)
+                if jobs is not None and jobs > 1 and self._owner != None:
+                    sections_to_parse = [
+                        x for x in self.keys() if force_parse or (x not in self._sections_checked)
+                    ]
+                    self._set_owner_options()
+                    self._owner._parse_sections_parallel(sections_to_parse, jobs)
+                else:
+                    for section in self.keys():
+                        self._parse_owner_section(section, force_parse)
             return self.keys()
 
         def has_section(self, section) -> bool:
@@ -1714,6 +4173,56 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             # this check helps prevent one from doing bad things.
             raise KeyError("Missing section {}.".format(section))
 
+        def affected_sections(self, section=None, option=None) -> list:
+            """Find the sections that are affected by a change to a section or option.
+
+            A section is affected if its ``use`` closure (the sections it pulls in
+            through ``use`` operations, directly or transitively, and itself) contains
+            the changed section. Since the ``DEFAULT`` section is parsed into every
+            section, a change to it or to a section in its closure affects all sections.
+
+            This is answered from the reachability bitsets of the owner's
+            :py:attr:`~ConfigParserEnhanced.use_graph` so no sections are parsed.
+
+            Args:
+                section (str): The name of the changed section.
+                option (str): The key of the changed option (as written in the ``.ini``
+                    file). If ``section`` is also given then only the option in that
+                    section is considered, otherwise every section containing the
+                    option is.
+
+            Returns:
+                list: The names of the affected sections, in the order of the ``.ini``
+                file. This is empty if no section contains ``option``.
+
+            Raises:
+                ValueError: If neither ``section`` nor ``option`` is given.
+                KeyError: If ``section`` does not exist.
+            """
+            if section is None and option is None:
+                raise ValueError("ERROR: affected_sections() requires a `section` or an `option`.")
+            if self._owner is None:
+                return []
+
+            use_graph = self._owner.use_graph
+
+            if section is not None:
+                changed = 1 << use_graph.section_id(section)
+                if option is not None:
+                    changed &= use_graph.option_bitset(option)
+            else:
+                changed = use_graph.option_bitset(option)
+
+            default_section_name = self._owner.default_section_name
+            if changed and default_section_name in use_graph.sections:
+                if changed & use_graph.closure_bitset(default_section_name):
+                    return list(use_graph.sections)
+
+            affected = 0
+            for name in use_graph.sections_from_bitset(changed):
+                affected |= use_graph.dependents_bitset(name)
+            return use_graph.sections_from_bitset(affected)
+
         def add_section(self, section, force=False):
             """Add a new empty section.
 
@@ -1762,6 +4271,40 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             self._owner_data = value
             return self._owner_data
 
+        @property
+        def _section_closures(self):
+            """
+            Implements a dict that maps each section that has been parsed as a *root*
+            section to a ``frozenset`` of the sections it visited (its ``use`` closure).
+            """
+            if not hasattr(self, '_section_closures_data'):
+                self._section_closures_data = {}
+            return self._section_closures_data
+
+        @property
+        def _section_cache(self):
+            """
+            Implements a dict that caches the generic options produced by walking
+            each section when the owner's ``use_section_cache`` option is enabled.
+
+            Entries are ``{ section: (entries, closure) }`` where ``entries`` is a
+            ``tuple`` of ``(key, value)`` pairs in the order they were set and
+            ``closure`` is a ``frozenset`` of the sections that were walked.
+            """
+            if not hasattr(self, '_section_cache_data'):
+                self._section_cache_data = {}
+            return self._section_cache_data
+
+        @property
+        def _section_plans(self):
+            """
+            Implements a dict that holds the compiled plan of each section (see
+            the owner's ``_get_section_plan()``).
+            """
+            if not hasattr(self, '_section_plans_data'):
+                self._section_plans_data = {}
+            return self._section_plans_data
+
         @property
         def _sections_checked(self):
             """
@@ -1780,10 +4323,88 @@ class ConfigParserEnhanced(Debuggable, ExceptionControl):
             """
             if self._owner != None:
                 self.exception_control_level = self._owner.exception_control_level
+                self.exception_control_silent_warnings = self._owner.exception_control_silent_warnings
+                self.exception_control_compact_warnings = self._owner.exception_control_compact_warnings
+                self.exception_control_collect = self._owner.exception_control_collect
+                self.exception_control_collect_capacity = self._owner.exception_control_collect_capacity
                 self.debug_level = self._owner.debug_level
+                self.debug_categories = self._owner.debug_categories
+                self.debug_sink = self._owner.debug_sink
+
+            return
+
+        def _exception_control_collect_event(self, event_type, exception_type, message, req_level, frame):
+            """Record an event in *collect mode* in the owner's store, if we have an owner class.
+
+            This keeps the events raised from the data object in the owner's
+            ``exception_control_summary()`` and ``exception_control_report()``.
+            """
+            if self._owner != None:
+                self._owner._exception_control_collect_event(
+                    event_type, exception_type, message, req_level, frame
+                )
+            else:
+                super()._exception_control_collect_event(
+                    event_type, exception_type, message, req_level, frame
+                )
+            return
 
+        def _get_state(self) -> dict:
+            """Get the parsed state so it can be saved (e.g., to the parse cache)."""
+            output = {
+                'data': self.data,
+                'sections_checked': self._sections_checked,
+                'section_closures': self._section_closures,
+                'section_cache': self._section_cache,
+            }
+            return output
+
+        def _set_state(self, state) -> None:
+            """Restore the parsed state saved by :py:meth:`_get_state`."""
+            self.data = state['data']
+            self._sections_checked_data = state['sections_checked']
+            self._section_closures_data = state['section_closures']
+            self._section_cache_data = state['section_cache']
             return
 
+        def _invalidate_sections(self, sections_changed) -> list:
+            """Invalidate parsed results that depend on sections that changed.
+
+            Any section whose recorded ``use`` closure contains one of the sections in
+            ``sections_changed`` is dropped so it will be re-parsed on its next access.
+            Cached section results (see ``use_section_cache``) are dropped the same way
+            and the compiled plans of the changed sections are dropped.
+
+            Args:
+                sections_changed (set): The names of the sections that changed.
+
+            Returns:
+                list: The names of the sections that were invalidated.
+            """
+            output = []
+
+            for section, closure in list(self._section_closures.items()):
+                if not closure.isdisjoint(sections_changed):
+                    output.append(section)
+                    del self._section_closures[section]
+                    self._sections_checked.discard(section)
+                    self.data.pop(section, None)
+
+            # Sections that changed but were never parsed as a root may still have
+            # placeholder entries in the data.
+            for section in sections_changed:
+                if section not in self._sections_checked:
+                    self.data.pop(section, None)
+
+            for section, cache_entry in list(self._section_cache.items()):
+                if not cache_entry[1].isdisjoint(sections_changed):
+                    del self._section_cache[section]
+
+            for section in sections_changed:
+                self._section_plans.pop(section, None)
+
+            return output
+
         def _parse_owner_section(self, section, force_parse=False):
             """Parse the section from the owner class.
 
@@ -46,6 +46,7 @@
 """
 from __future__ import print_function
 
+import logging
 import sys
 
 # ===========================================================
@@ -65,6 +66,10 @@ class Debuggable(object):
     messages based on a debug level. Generally, the higher the ``debug_level``
     the more *verbose*/*detailed* the messages will be.
 
+    Messages are printed to ``stdout`` by default but can be sent somewhere else
+    by setting :py:attr:`debug_sink`, and messages can be tagged with a *category*
+    whose level can be set separately through :py:attr:`debug_categories`.
+
     Note:
         Normal operation of codes will have a ``debug_level`` of 0, which would
         not print out extra debugging information.
@@ -92,7 +97,104 @@ class Debuggable(object):
         self._debug_level = max(int(value), 0)
         return self._debug_level
 
-    def debug_message(self, debug_level, message, end="\n", useprefix=True):
+    @property
+    def debug_categories(self) -> dict:
+        """Debug levels for categories of messages.
+
+        Messages passed to :py:meth:`debug_message` with a ``category`` that is
+        a key of this ``dict`` use the level given here instead of
+        :py:attr:`debug_level`. This allows the messages from one part of the code
+        to be turned on (or off) without changing the others, e.g.,
+
+        .. code-block:: python
+
+            obj.debug_level = 0
+            obj.debug_categories = {"section": 3}
+
+        Messages without a category, or with a category that isn't a key, use
+        :py:attr:`debug_level`.
+
+        Returns:
+            dict: A ``dict`` mapping category names (``str``) to debug levels (``int``).
+            Default: ``{}``
+
+        Raises:
+            TypeError: If the value assigned is not a ``dict``.
+        """
+        if not hasattr(self, '_debug_categories'):
+            self._debug_categories = {}
+        return self._debug_categories
+
+    @debug_categories.setter
+    def debug_categories(self, value):
+        if not isinstance(value, dict):
+            raise TypeError("Value must be a `dict` type in assignment.")
+        self._debug_categories = {k: max(int(v), 0) for k, v in value.items()}
+        return self._debug_categories
+
+    @property
+    def debug_sink(self):
+        """Where the messages from :py:meth:`debug_message` are sent.
+
+        This can be one of:
+
+        1. ``None`` (default): Messages are printed with ``print()``. If the
+           message has a ``debug_level > 0`` then ``stdout`` is flushed after it.
+        2. A :py:class:`logging.Logger`: Messages are logged at ``logging.DEBUG``
+           (``logging.INFO`` for messages with a ``debug_level`` of 0). Lazy
+           messages are not formatted if the logger will drop them.
+        3. A file-like object with a ``write()`` method: Messages (including the
+           line ending) are written to it. It is not flushed after each message,
+           so it can buffer the output.
+        4. A callable: It is called with the text of each message (including
+           the line ending).
+
+        Returns:
+            The current sink.
+
+        Raises:
+            TypeError: If the value assigned is not one of the above.
+        """
+        if not hasattr(self, '_debug_sink'):
+            self._debug_sink = None
+        return self._debug_sink
+
+    @debug_sink.setter
+    def debug_sink(self, value):
+        if not (
+            value is None or isinstance(value, logging.Logger) or hasattr(value, "write") or callable(value)
+        ):
+            raise TypeError("Value must be `None`, a `logging.Logger`, a file object or a callable.")
+        self._debug_sink = value
+        return self._debug_sink
+
+    def debug_enabled(self, debug_level, category=None) -> bool:
+        """Check if messages at a given ``debug_level`` will be printed.
+
+        This can be used to guard debugging code that is expensive to run
+        so it can be skipped entirely when it isn't needed:
+
+        .. code-block:: python
+
+            if self.debug_enabled(3):
+                self.debug_message(3, f"data: {large_dict}")
+
+        Args:
+            debug_level (int): The debug level requirement to check.
+            category (str): The category of the messages (see :py:attr:`debug_categories`).
+                Default: ``None``
+
+        Returns:
+            bool: ``True`` if ``self.debug_level >= debug_level``, or if the level set
+            for ``category`` in :py:attr:`debug_categories` is ``>= debug_level``.
+        """
+        if category is not None:
+            category_level = self.debug_categories.get(category, None)
+            if category_level is not None:
+                return category_level >= debug_level
+        return self.debug_level >= debug_level
+
+    def debug_message(self, debug_level, message, end="\n", useprefix=True, category=None, lazy=False):
         """Optionally prints a message based on the ``debug_level`` setting.
 
         A simple wrapper to ``print()`` which optionally prints out a message
@@ -109,21 +211,55 @@ class Debuggable(object):
                 be printed. If this paramter is 0 then we do not prepend the debug
                 level annotation to the message so that it will appear the same as
                 a basic ``print()`` message.
-            message (str): This is the message that will be printed.
+            message (str,Callable): This is the message that will be printed.
+                If ``lazy`` is enabled this is a callable that takes no arguments
+                and returns the message (see ``lazy``).
             end (str): This allows us to override the line-ending.
             useprefix (bool): If enabled and ``debug_level > 0``, then a prefix
                 of ``[D-{debug_level}]`` will be prepended to the message to
                 indicate the ``debug_level`` that triggers this message.
+            category (str): The category of the message. If it is a key of
+                :py:attr:`debug_categories`, that level is used instead of ``debug_level``.
+                Default: ``None``
+            lazy (bool): If enabled, ``message`` is called to get the message, and only
+                if the message will be printed. This is useful for messages that are
+                expensive to format, e.g. ``lambda: f"data: {large_dict}"``.
+                Default: ``False``
+
+        Note:
+            The ``message`` argument of a regular call is formatted before this method
+            is called, even if the message is not printed. In performance-critical code,
+            wrap calls in a check like ``if self.debug_enabled(2):`` or pass a callable
+            with ``lazy=True``.
         """
-        if self.debug_level >= debug_level:
-            if debug_level > 0:
-                prefix = ""
-                if useprefix:
-                    prefix = f"[D-{debug_level}] "
-                message = f"{prefix}{message}"
+        if not self.debug_enabled(debug_level, category):
+            return
+
+        sink = self.debug_sink
+
+        if isinstance(sink, logging.Logger):
+            log_level = logging.DEBUG if debug_level > 0 else logging.INFO
+            if not sink.isEnabledFor(log_level):
+                return
+
+        if lazy:
+            message = message()
+
+        if debug_level > 0:
+            prefix = ""
+            if useprefix:
+                prefix = f"[D-{debug_level}] "
+            message = f"{prefix}{message}"
 
+        if sink is None:
             print(message, end=end)
 
             if debug_level > 0:
                 sys.stdout.flush()
+        elif isinstance(sink, logging.Logger):
+            sink.log(log_level, "%s", message)
+        elif hasattr(sink, "write"):
+            sink.write(f"{message}{end}")
+        else:
+            sink(f"{message}{end}")
         return
@@ -44,6 +44,7 @@
 """
 from __future__ import print_function
 
+import collections
 import sys
 import traceback
 
@@ -51,6 +52,58 @@ import traceback
 #   H E L P E R   F U N C T I O N S   A N D   C L A S S E S
 # ===========================================================
 
+
+
+# Default maximum number of distinct events kept in *collect mode*
+# (see ``exception_control_collect``).
+EXCEPTION_CONTROL_COLLECT_CAPACITY_DEFAULT = 1000
+
+# Cache of whether each exception *type* passed to ``exception_control_event``
+# can be raised, so the check is only done once per type.
+_raisable_types_cache = {}
+
+
+
+def _is_raisable(exception) -> bool:
+    """Helper function: determine if an object is 'raiseable'.
+
+    To determine if an object is something that can be raised via ``raise``,
+    you must do something more than just check if something inherits from
+    :class:`Exception`.
+
+    This function determines if an object *can be raised*. The result is
+    cached for types (instances are checked every time).
+
+    Args:
+        exception (object): An object we wish to test if it can be **raised**.
+
+    Returns:
+        bool: True if ``exception`` can be raised via ``raise exception(message)``.
+    """
+    is_type = isinstance(exception, type)
+    if is_type:
+        output = _raisable_types_cache.get(exception, None)
+        if output is not None:
+            return output
+
+    try:
+        raise exception
+    except:
+        exc_type, exc = sys.exc_info()[: 2]
+
+        if exc is exception or exc_type is exception:
+            output = True
+        elif exc_type is TypeError:
+            output = False # pragma: no cover
+        else:
+                           # Re-raise other exceptions such as KeyboardInterrupt, etc.
+            raise          # pragma: no cover
+
+    if is_type:
+        _raisable_types_cache[exception] = output
+    return output
+
+
 # ===============================
 #   M A I N   C L A S S
 # ===============================
@@ -126,6 +179,10 @@ class ExceptionControl(object):
     by setting the ``exception_control_silent_warnings`` flag.
     """
 
+    _EXCEPTION_CONTROL_MAP_EVENT_TO_LEVEL_REQ = {
+        "SILENT": 5, "WARNING": 5, "MINOR": 4, "SERIOUS": 3, "CRITICAL": 2, "CATASTROPHIC": 0
+    }
+
     @property
     def _exception_control_map_event_to_level_req(self):
         """
@@ -136,9 +193,11 @@ class ExceptionControl(object):
         Values for each class can range from 0 to 5. An event class of 0
         indicates that the event will *always* raise an exception and a
         level of 5 would only be raised at the highest ``exception_control_level``.
+
+        This returns the class-level table ``_EXCEPTION_CONTROL_MAP_EVENT_TO_LEVEL_REQ``
+        so it is not rebuilt for every event. It should not be modified.
         """
-        output = {"SILENT": 5, "WARNING": 5, "MINOR": 4, "SERIOUS": 3, "CRITICAL": 2, "CATASTROPHIC": 0}
-        return output
+        return self._EXCEPTION_CONTROL_MAP_EVENT_TO_LEVEL_REQ
 
     @property
     def exception_control_silent_warnings(self) -> bool:
@@ -186,6 +245,58 @@ class ExceptionControl(object):
         self._exception_control_compact_warnings = value
         return self._exception_control_compact_warnings
 
+    @property
+    def exception_control_collect(self) -> bool:
+        """A flag that toggles *collect mode*.
+
+        In *collect mode*, events that would print a warning are recorded instead
+        of printed. Identical events (same event type, exception type, message and
+        calling line) are stored once with a count and no call stack is formatted
+        until a report is requested. At most ``exception_control_collect_capacity``
+        distinct events are kept.
+
+        Use :py:meth:`exception_control_summary` and :py:meth:`exception_control_report`
+        to get the recorded events and :py:meth:`exception_control_clear` to clear them.
+        Events that raise their exception, ``SILENT`` events and events silenced by
+        ``exception_control_silent_warnings`` are not recorded.
+
+        Returns:
+            bool: ``True`` if *collect mode* is enabled. Default: ``False``
+        """
+        if not hasattr(self, '_exception_control_collect'):
+            self._exception_control_collect = False
+        return self._exception_control_collect
+
+    @exception_control_collect.setter
+    def exception_control_collect(self, value) -> bool:
+        if not isinstance(value, (bool)):
+            raise TypeError("Value must be a `bool` type in assignment.")
+        self._exception_control_collect = value
+        return self._exception_control_collect
+
+    @property
+    def exception_control_collect_capacity(self) -> int:
+        """The maximum number of distinct events recorded in *collect mode*.
+
+        Once the store is full, new distinct events are only counted as dropped
+        (repeats of recorded events are still counted).
+
+        Returns:
+            int: The capacity. Default: ``EXCEPTION_CONTROL_COLLECT_CAPACITY_DEFAULT`` (1000)
+        """
+        if not hasattr(self, '_exception_control_collect_capacity'):
+            self._exception_control_collect_capacity = EXCEPTION_CONTROL_COLLECT_CAPACITY_DEFAULT
+        return self._exception_control_collect_capacity
+
+    @exception_control_collect_capacity.setter
+    def exception_control_collect_capacity(self, value) -> int:
+        if not isinstance(value, (int)) or isinstance(value, (bool)):
+            raise TypeError("Value must be an `int` type in assignment.")
+        if value < 1:
+            raise ValueError("Value must be at least 1.")
+        self._exception_control_collect_capacity = value
+        return self._exception_control_collect_capacity
+
     @property
     def exception_control_level(self):
         """Get the value of the ``exception_control_level`` property.
@@ -231,85 +342,222 @@ class ExceptionControl(object):
                 should we pass along when it gets raised?
         """
 
-        def _is_raisable(exception):
-            """Helper function: determine if an object is 'raiseable'.
-
-            To determine if an object is something that can be raised via ``raise``,
-            you must do something more than just check if something inherits from
-            :class:`Exception`.
-
-            This function determines if an object *can be raised*.
-
-            Args:
-                exception (object): An object we wish to test if it can be **raised**.
-
-            Returns:
-                bool: True if ``exception`` can be raised via ``raise exception(message)``.
-            """
-            try:
-                raise exception
-            except:
-                exc_type, exc = sys.exc_info()[: 2]
-
-                if exc is exception or exc_type is exception:
-                    return True
-                elif exc_type is TypeError:
-                    return False # pragma: no cover
-                else:
-                                 # Re-raise other exceptions such as KeyboardInterrupt, etc.
-                    raise        # pragma: no cover
-
         event_type = str(event_type).upper()
 
         if not _is_raisable(exception_type):
             raise TypeError("The exception type must be some kind of `Exception`.")
 
         req_exception_control_level = self._exception_control_map_event_to_level_req[event_type]
-        if self.exception_control_level >= req_exception_control_level:
+        exception_control_level = self.exception_control_level
+        if exception_control_level >= req_exception_control_level:
             if message == None:
                 raise exception_type
             else:
                 raise exception_type(message)
-        elif self.exception_control_level > 0:
-            try:
-                raise exception_type
-            except exception_type as exc:
+        elif exception_control_level > 0:
+            # The exception is not raised, at most a warning is printed.
+            if (not self.exception_control_silent_warnings) and (event_type != "SILENT"):
+                if self.exception_control_collect:
+                    self._exception_control_collect_event(
+                        event_type, exception_type, message, req_exception_control_level, sys._getframe(1)
+                    )
+                else:
+                    # Ignore the last entry from the call stack since that is _this_ method.
+                    # and it's the _caller_ that we care about for the call stack in reporting.
+                    stack = traceback.format_stack()[:-1]
+                    print(
+                        self._exception_control_format_warning(
+                            event_type, exception_type, message, req_exception_control_level, stack
+                        )
+                    )
+                    sys.stdout.flush()
 
-                if (not self.exception_control_silent_warnings) and (event_type != "SILENT"):
+        return
 
-                    if self.exception_control_compact_warnings:
-                        tb_last = str(traceback.format_stack()[-2])
-                        tb_last = tb_last.splitlines()[0]
-                        tb_last = tb_last.strip()
-                        print(
-                            f"!! EXCEPTION SKIPPED ({event_type} :"
-                            f" {exception_type.__name__}) @ {tb_last}"
-                        )
-                    else:
-                        print(f"!! " + "="*80)
-                        print(f"!! EXCEPTION SKIPPED")
-                        print(f"!! Event Type : {event_type}")
-                        print(f"!! Exception  : {exception_type.__name__}")
-                        if message != None:
-                            message = message.replace("\n", "\n!!            : ")
-                            print(f"!! Message    : {message}")
-
-                        print("!!")
-                        print("!! Call Stack:")
-                        # Ignore the last entry from the call stack since that is _this_ method.
-                        # and it's the _caller_ that we care about for the call stack in reporting.
-                        for line in traceback.format_stack()[:-1]:
-                            line = line.strip()
-                            line = line.replace("\n", "\n!! ")
-                            print(f"!! {line.strip()}")
-
-                        print("!!")
-                        print(
-                            f"!! Increase `exception_control_level` to "
-                            f"{req_exception_control_level} to raise this exception."
-                        )
-                        print("!! " + "="*80)
+    def exception_control_summary(self) -> list:
+        """Get the events recorded in *collect mode*.
 
-                    sys.stdout.flush()
+        See :py:attr:`exception_control_collect`.
+
+        Returns:
+            list: A ``list`` of ``dict`` objects, one per distinct event, in the order
+            they first happened. Each one contains the keys ``event_type``,
+            ``exception`` (the name of the exception type), ``message``, ``filename``,
+            ``lineno`` and ``function`` (the caller of ``exception_control_event``)
+            and ``count`` (the number of times the event happened).
+        """
+        output = []
+        for record in self._exception_control_records.values():
+            output.append(
+                {
+                    "event_type": record["event_type"],
+                    "exception": record["exception_type"].__name__,
+                    "message": record["message"],
+                    "filename": record["filename"],
+                    "lineno": record["lineno"],
+                    "function": record["function"],
+                    "count": record["count"],
+                }
+            )
+        return output
+
+    def exception_control_report(self, stack=True) -> str:
+        """Format the events recorded in *collect mode*.
+
+        Each distinct event is formatted once, the same way it would have been printed
+        if *collect mode* were off (including ``exception_control_compact_warnings``),
+        with the number of times it happened. Call stacks are only formatted here.
+
+        Args:
+            stack (bool): Include the call stack of each event (if warnings are
+                not compact). Default: ``True``
+
+        Returns:
+            str: The report. This is empty if there are no recorded events.
+        """
+        output = []
+        for record in self._exception_control_records.values():
+            stack_lines = record["stack"].format() if stack else None
+            output.append(
+                self._exception_control_format_warning(
+                    record["event_type"],
+                    record["exception_type"],
+                    record["message"],
+                    record["req_level"],
+                    stack_lines,
+                    count=record["count"],
+                )
+            )
+
+        if self._exception_control_records_dropped > 0:
+            output.append(
+                f"!! {self._exception_control_records_dropped} event(s) not recorded: "
+                f"`exception_control_collect_capacity` reached."
+            )
+        return "\n".join(output)
+
+    def exception_control_clear(self):
+        """Clear the events recorded in *collect mode*."""
+        self._exception_control_records = collections.OrderedDict()
+        self._exception_control_records_dropped = 0
+        return
+
+    # -------------------------------------
+    #   H E L P E R S   ( P R I V A T E )
+    # -------------------------------------
+
+    @property
+    def _exception_control_records(self) -> collections.OrderedDict:
+        """The events recorded in *collect mode*, keyed by event."""
+        if not hasattr(self, '_exception_control_records_data'):
+            self._exception_control_records_data = collections.OrderedDict()
+        return self._exception_control_records_data
+
+    @_exception_control_records.setter
+    def _exception_control_records(self, value):
+        self._exception_control_records_data = value
+
+    @property
+    def _exception_control_records_dropped(self) -> int:
+        """The number of events not recorded because the store was full."""
+        if not hasattr(self, '_exception_control_records_dropped_data'):
+            self._exception_control_records_dropped_data = 0
+        return self._exception_control_records_dropped_data
+
+    @_exception_control_records_dropped.setter
+    def _exception_control_records_dropped(self, value):
+        self._exception_control_records_dropped_data = value
+
+    def _exception_control_collect_event(self, event_type, exception_type, message, req_level, frame):
+        """Record an event in *collect mode*.
 
+        Identical events (same type, exception, message and calling line) are
+        counted rather than stored again. The call stack of the first occurrence
+        is saved without looking up the source lines, which is deferred until
+        :py:meth:`exception_control_report` formats it.
+
+        Args:
+            frame (frame): The frame of the caller of ``exception_control_event``.
+        """
+        code = frame.f_code
+        key = (event_type, exception_type, message, code.co_filename, frame.f_lineno, code.co_name)
+
+        records = self._exception_control_records
+        record = records.get(key, None)
+        if record is not None:
+            record["count"] += 1
+        elif len(records) < self.exception_control_collect_capacity:
+            stack = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+            stack.reverse()
+            records[key] = {
+                "event_type": event_type,
+                "exception_type": exception_type,
+                "message": message,
+                "filename": code.co_filename,
+                "lineno": frame.f_lineno,
+                "function": code.co_name,
+                "req_level": req_level,
+                "stack": stack,
+                "count": 1,
+            }
+        else:
+            self._exception_control_records_dropped += 1
         return
+
+    def _exception_control_format_warning(
+        self, event_type, exception_type, message, req_level, stack, count=None
+    ) -> str:
+        """Format the warning printed for an event that is not raised.
+
+        Args:
+            event_type (str): The event type.
+            exception_type (object): The exception type.
+            message (str): The message or ``None``.
+            req_level (int): The ``exception_control_level`` that would raise the event.
+            stack (list): The formatted call stack (as from ``traceback.format_stack()``)
+                ending with the caller of ``exception_control_event``. If ``None`` then
+                the stack is not included (unless warnings are compact, it must then
+                have at least one entry).
+            count (int): The number of times the event happened, or ``None``.
+
+        Returns:
+            str: The warning.
+        """
+        count_str = f" (x{count})" if count is not None else ""
+        lines = []
+
+        if self.exception_control_compact_warnings:
+            tb_last = ""
+            if stack:
+                tb_last = str(stack[-1])
+                tb_last = tb_last.splitlines()[0]
+                tb_last = tb_last.strip()
+            lines.append(
+                f"!! EXCEPTION SKIPPED ({event_type} :"
+                f" {exception_type.__name__}) @ {tb_last}{count_str}"
+            )
+        else:
+            lines.append(f"!! " + "="*80)
+            lines.append(f"!! EXCEPTION SKIPPED{count_str}")
+            lines.append(f"!! Event Type : {event_type}")
+            lines.append(f"!! Exception  : {exception_type.__name__}")
+            if message != None:
+                message = message.replace("\n", "\n!!            : ")
+                lines.append(f"!! Message    : {message}")
+
+            if stack is not None:
+                lines.append("!!")
+                lines.append("!! Call Stack:")
+                for line in stack:
+                    line = line.strip()
+                    line = line.replace("\n", "\n!! ")
+                    lines.append(f"!! {line.strip()}")
+
+            lines.append("!!")
+            lines.append(
+                f"!! Increase `exception_control_level` to "
+                f"{req_level} to raise this exception."
+            )
+            lines.append("!! " + "="*80)
+
+        return "\n".join(lines)
@@ -50,6 +50,7 @@ try:
 except ImportError:          # pragma: no cover
     pass                     # pragma: no cover
 
+from .TypedProperty import TypedProperty
 from .TypedProperty import typed_property
 
 # ===================================
@@ -58,6 +59,22 @@ from .TypedProperty import typed_property
 
 
 
+def find_typed_properties(cls) -> tuple:
+    """
+    Find the :class:`~configparserenhanced.TypedProperty.TypedProperty` descriptors
+    of a class, including the ones it inherits.
+
+    Returns:
+        tuple: A tuple of the descriptors, in the order they are defined.
+    """
+    output = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if isinstance(attr, TypedProperty):
+                output[name] = attr
+    return tuple(output.values())
+
+
 def value_len_eq_2(value):
     """
     Validates that the length of the paramter is equal to 2.
@@ -81,6 +98,22 @@ def value_len_eq_2(value):
 
 class HandlerParameters(object):
     """Contains the set of parameters that we pass to *handlers*.
+
+    A ``HandlerParameters`` object is created for every level of recursion
+    in the parser, so this class is kept light: it uses ``__slots__`` (one slot for
+    the value of each property and one for its *is set* flag) and its fields are
+    initialized when the object is created rather than lazily copied from the
+    property defaults when they are first read. Since it uses ``__slots__``,
+    attributes that are not declared with ``typed_property`` can't be added to it.
+
+    Calling ``__init__()`` on an existing object resets it to the state of a new
+    object. If ``ConfigParserEnhanced.reuse_handler_parameters`` is enabled the
+    parser uses this to reuse objects rather than allocating new ones, so handlers
+    must then not keep a reference to the object they are given after they return.
+
+    The slots and the initial values are taken from the ``typed_property``
+    declarations, which are the only place the defaults are defined. Subclasses
+    that add ``typed_property`` fields get them reset by ``__init__()`` too.
     """
     section_root = typed_property("section_root", (str), default=None)
     raw_option = typed_property("raw_option", tuple, default=(None, None), validator=value_len_eq_2)
@@ -91,6 +124,25 @@ class HandlerParameters(object):
     data_internal = typed_property("data_internal", dict, {})
     handler_name = typed_property("handler_name", str, "")
 
+    __slots__ = tuple(
+        slot_name for attr in list(locals().values()) if isinstance(attr, TypedProperty)
+        for slot_name in attr.slot_names
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._typed_properties = find_typed_properties(cls)
+
+    def __init__(self):
+        # Set the defaults directly. This is the same as what the properties
+        # would lazily set the first time they're read.
+        for typed_prop in self._typed_properties:
+            typed_prop.reset(self)
+
+
+
+HandlerParameters._typed_properties = find_typed_properties(HandlerParameters)
+
 
 
 # EOF
@@ -52,6 +52,20 @@ class SENTINEL:
 
 
 
+# Types whose values can be shared between objects, so defaults of these types
+# don't need to be copied.
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, frozenset)
+
+
+
+def _is_immutable(value) -> bool:
+    """Check if a value can be shared, i.e., it's immutable (including tuples of immutable values)."""
+    if isinstance(value, tuple):
+        return all(_is_immutable(x) for x in value)
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+
 def typed_property(
     name: str,
     expected_type=(int, str),
@@ -86,6 +100,9 @@ def typed_property(
             Default=None (i.e., no extra validation).
         transform (func): A function that can be used to transform the value before assignment.
 
+    Returns:
+        TypedProperty: The descriptor that implements the property.
+
     Raises:
         TypeError: if the assigned value is of the wrong type on assigmment.
         ValueError: if a *validator* is provided and the check fails (is Falsy).
@@ -93,72 +110,177 @@ def typed_property(
             the property is made before it's been assigned.
 
     """
-    varname = "_" + name
-    varname_set = varname + "_is_set"
-    expected_type = expected_type
-    validator = validator
+    return TypedProperty(
+        name,
+        expected_type=expected_type,
+        default=default,
+        default_factory=default_factory,
+        req_assign_before_use=req_assign_before_use,
+        internal_type=internal_type,
+        validator=validator,
+        transform=transform
+    )
 
-    @property
-    def prop(self):
-        if not hasattr(self, varname_set):
-            setattr(self, varname_set, False)
-        if req_assign_before_use is True and getattr(self, varname_set) is False:
-            raise UnboundLocalError("Property {} referenced before assigned.".format(name))
-        if not hasattr(self, varname):
-            if default is not SENTINEL:
-                setattr(self, varname, copy.deepcopy(default))
-            else:
-                if not callable(default_factory):
-                    raise TypeError(
-                        "default_factory `{}` in `{}` must be callable.".format(default_factory, name)
-                    )
-                setattr(self, varname, default_factory())
-        return getattr(self, varname)
-
-    @prop.setter
-    def prop(self, value):
-        _expected_type = copy.deepcopy(expected_type)
-        if not isinstance(_expected_type, typing.Iterable):
-            _expected_type = (_expected_type, )
-        for expected_type_i in _expected_type:
-            if isinstance(value, expected_type_i):
-                break
+
+
+class TypedProperty(object):
+    """
+    Descriptor that implements :func:`typed_property`.
+
+    The value of the property is stored in the ``_<name>`` attribute of the object
+    and whether it's been assigned is stored in ``_<name>_is_set``. Everything that
+    does not depend on the value (the tuple of expected types and how to create the
+    default value) is worked out once when the descriptor is created, so reading
+    a property that has a value is a single attribute lookup.
+
+    If ``name`` is ``None`` then the name of the class attribute the descriptor is
+    assigned to is used (see ``__set_name__``).
+
+    See :func:`typed_property` for a description of the arguments.
+    """
+
+    def __init__(
+        self,
+        name=None,
+        expected_type=(int, str),
+        default=SENTINEL,
+        default_factory=lambda: None,
+        req_assign_before_use=False,
+        internal_type=None,
+        validator=None,
+        transform=None
+    ):
+        # Normalize the expected type(s) to a tuple once rather than on every assignment.
+        if isinstance(expected_type, typing.Iterable):
+            expected_type = tuple(expected_type)
         else:
-            type_names = [i.__name__ for i in _expected_type]
-            raise TypeError("'{}' must be in ({})".format(name, ",".join(type_names)))
+            expected_type = (expected_type, )
+
+        self.expected_type = expected_type
+        self.default = default
+        self.default_factory = default_factory
+        self.req_assign_before_use = req_assign_before_use
+        self.internal_type = internal_type
+        self.validator = validator
+        self.transform = transform
+        self._make_default = self._resolve_default_factory()
 
+        self.name = None
+        if name is not None:
+            self._set_name(name)
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self._set_name(name)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        if self.req_assign_before_use and not getattr(obj, self.varname_set, False):
+            raise UnboundLocalError("Property {} referenced before assigned.".format(self.name))
+
+        try:
+            return getattr(obj, self.varname)
+        except AttributeError:
+            pass
+
+        # First read without an assignment: save the default.
+        if not hasattr(obj, self.varname_set):
+            setattr(obj, self.varname_set, False)
+        value = self._make_default()
+        setattr(obj, self.varname, value)
+        return value
+
+    def __set__(self, obj, value):
+        if not isinstance(value, self.expected_type):
+            type_names = [i.__name__ for i in self.expected_type]
+            raise TypeError("'{}' must be in ({})".format(self.name, ",".join(type_names)))
+
+        internal_type = self.internal_type
         if internal_type is not None:
             value = internal_type(value)
 
+        transform = self.transform
         if transform is not None:
             if callable(transform):
                 value = transform(value)
                 if internal_type is not None:
                     value = internal_type(value)
             else:
-                raise TypeError(f"transform '{transform}' for property '{name}' is not callable.")
+                raise TypeError(f"transform '{transform}' for property '{self.name}' is not callable.")
 
+        validator = self.validator
         if validator is not None:
             if callable(validator):
                 if not validator(value):
                     raise ValueError(
-                        f"Assignment of `{value}` to property `{name}` " +
+                        f"Assignment of `{value}` to property `{self.name}` " +
                         f"failed validation check in `{validator}`"
                     )
             else:
-                raise TypeError(f"Validator '{validator}' for property '{name}' is not callable.")
+                raise TypeError(f"Validator '{validator}' for property '{self.name}' is not callable.")
 
         # Assign the value to the property
-        setattr(self, varname, value)
+        setattr(obj, self.varname, value)
 
         # Save that we've assigned the value to something
-        setattr(self, varname_set, True)
+        setattr(obj, self.varname_set, True)
+
+    def __delete__(self, obj):
+        if hasattr(obj, self.varname):
+            delattr(obj, self.varname)
+        if hasattr(obj, self.varname_set):
+            delattr(obj, self.varname_set)
+
+    @property
+    def slot_names(self) -> tuple:
+        """tuple: The names of the attributes that hold the property's state,
+        ``(_<name>, _<name>_is_set)``, for classes that use ``__slots__``.
+        """
+        return (self.varname, self.varname_set)
+
+    def reset(self, obj):
+        """Set the property of ``obj`` to a new default value, as if it was never assigned.
+
+        This is the same state that reading the property for the first time creates.
+        """
+        setattr(obj, self.varname, self._make_default())
+        setattr(obj, self.varname_set, False)
+
+    # -------------------------------------
+    #   H E L P E R S   ( P R I V A T E )
+    # -------------------------------------
+
+    def _set_name(self, name):
+        self.name = name
+        self.varname = "_" + name
+        self.varname_set = self.varname + "_is_set"
+
+    def _resolve_default_factory(self):
+        """Work out how to make the default value of the property.
+
+        Returns:
+            Callable: A function that takes no arguments and returns a new default value.
+        """
+        default = self.default
+        default_factory = self.default_factory
+
+        if default is not SENTINEL:
+            if _is_immutable(default):
+                return lambda: default
+            if type(default) in (list, dict, set) and len(default) == 0:
+                # A new empty container is the same as a copy, without the cost of deepcopy.
+                return type(default)
+            return lambda: copy.deepcopy(default)
+
+        if not callable(default_factory):
+
+            def default_factory_error():
+                raise TypeError(
+                    "default_factory `{}` in `{}` must be callable.".format(default_factory, self.name)
+                )
 
-    @prop.deleter
-    def prop(self):
-        if hasattr(self, varname):
-            delattr(self, varname)
-        if hasattr(self, varname_set):
-            delattr(self, varname_set)
+            return default_factory_error
 
-    return prop
+        return default_factory
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# -*- mode: python; py-indent-offset: 4; py-continuation-offset: 4 -*-
+#===============================================================================
+# Copyright Notice
+# ----------------
+# Copyright 2021 National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS,
+# the U.S. Government retains certain rights in this software.
+#
+# License (3-Clause BSD)
+# ----------------------
+# Copyright 2021 National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS,
+# the U.S. Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above
+#    copyright notice, this list of conditions and the following
+#    disclaimer in the documentation and/or other materials provided
+#    with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#===============================================================================
+"""
+An index of the ``use`` links between the sections of a ``.ini`` file.
+"""
+from __future__ import print_function
+
+
+
+# ===============================
+#   M A I N   C L A S S
+# ===============================
+
+
+
+class UseGraph(object):
+    """The graph of ``use`` links between the sections of a ``.ini`` file.
+
+    Each section gets an integer ID (in the order the sections are given) and
+    the graph is stored as adjacency arrays of IDs, with an edge from each
+    section to every section it ``use`` s. The strongly connected components
+    of the graph are found with (an iterative version of) Tarjan's algorithm
+    the first time they're needed, which takes O(V+E) time. Components with more
+    than one section, or a section that ``use`` s itself, are the ``use`` cycles.
+
+    Sections can be added to the graph later with :py:meth:`add_sections` (e.g.,
+    as the sections of a file are loaded on demand). The IDs of the sections
+    already in the graph don't change, links to sections that are not in the
+    graph yet are kept until the section is added, and the components and
+    bitsets are computed again the next time they're needed.
+
+    Components are ordered so that every component comes after all of the
+    components it ``use`` s, which gives a topological order of the sections
+    where the sections of a cycle are kept together.
+
+    For reachability queries the graph also keeps *bitsets* (``int`` s where bit
+    ``i`` stands for the section with ID ``i``) of the ``use`` closure of each
+    section and of the sections whose closure contains it. These are computed
+    once, the first time they're needed, by walking the components in order so
+    each query afterwards is a lookup plus bitwise operations.
+
+    Args:
+        sections (iterable): The names of the sections.
+        edges (dict): Maps a section name to a list of the names of the sections
+            it ``use`` s, in the order of the ``use`` operations. Links to
+            sections that are not in the graph are left out (until the section
+            is added by :py:meth:`add_sections`).
+        options (dict): Maps a section name to the option keys in the section.
+            Used by :py:meth:`option_bitset`. Default: ``None`` (no options).
+    """
+
+    def __init__(self, sections=(), edges=None, options=None):
+        self._sections = []
+        self._section_ids = {}
+        self._adjacency = []
+        self._reverse_adjacency = []
+        self._pending_edges = {}
+        self._option_bitsets = {}
+        self._components = None
+        self._component_ids = None
+        self.add_sections(sections, edges, options)
+
+    # -----------------------
+    #   P R O P E R T I E S
+    # -----------------------
+
+    @property
+    def sections(self) -> tuple:
+        """tuple: The names of the sections, indexed by section ID."""
+        return tuple(self._sections)
+
+    @property
+    def adjacency(self) -> tuple:
+        """tuple: The IDs of the sections each section ``use`` s, indexed by section ID."""
+        return tuple(tuple(x) for x in self._adjacency)
+
+    @property
+    def components(self) -> list:
+        """list: The strongly connected components as ``tuple`` s of section names.
+
+        A component comes after every component that it ``use`` s.
+        """
+        self._update_components()
+        return [self._component_names(x) for x in self._components]
+
+    @property
+    def cycles(self) -> list:
+        """list: The components that are ``use`` cycles, as ``tuple`` s of section names."""
+        self._update_components()
+        return [self._component_names(x) for x in self._components if self._is_cycle(x)]
+
+    # ---------------------------------------
+    #   P U B L I C   A P I   M E T H O D S
+    # ---------------------------------------
+
+    def __contains__(self, section) -> bool:
+        return section in self._section_ids
+
+    def add_sections(self, sections, edges=None, options=None) -> None:
+        """Add sections to the graph.
+
+        New sections get the next IDs, in the order they are given. The links of
+        the new sections are added in the order of the ``use`` operations, and the
+        links of sections already in the graph to the new ones are appended to
+        their adjacency arrays.
+
+        Args:
+            sections (iterable): The names of the sections. Sections that are already
+                in the graph are skipped.
+            edges (dict): See :class:`UseGraph`.
+            options (dict): See :class:`UseGraph`.
+        """
+        sections_new = []
+        for name in sections:
+            if name in self._section_ids:
+                continue
+            self._section_ids[name] = len(self._sections)
+            self._sections.append(name)
+            self._adjacency.append([])
+            self._reverse_adjacency.append([])
+            sections_new.append(name)
+
+        for name in sections_new:
+            for source in self._pending_edges.pop(name, ()):
+                self._add_edge(source, self._section_ids[name])
+
+        if edges is not None:
+            for name in sections_new:
+                source = self._section_ids[name]
+                for target in edges.get(name, ()):
+                    target_id = self._section_ids.get(target, None)
+                    if target_id is None:
+                        self._pending_edges.setdefault(target, []).append(source)
+                    else:
+                        self._add_edge(source, target_id)
+
+        if options is not None:
+            for name in sections_new:
+                section_bit = 1 << self._section_ids[name]
+                for option_key in options.get(name, ()):
+                    self._option_bitsets[option_key] = self._option_bitsets.get(option_key, 0) | section_bit
+
+        if len(sections_new) > 0:
+            self._components = None
+            self._component_ids = None
+            self.__dict__.pop('_closure_bitsets', None)
+            self.__dict__.pop('_dependents_bitsets', None)
+        return
+
+    def section_id(self, section) -> int:
+        """Get the ID of a section.
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        try:
+            return self._section_ids[section]
+        except KeyError:
+            raise KeyError(f"ERROR: No section named `{section}` is in the `use` graph.")
+
+    def dependencies(self, section, transitive=False) -> list:
+        """Get the sections that a section ``use`` s.
+
+        Args:
+            section (str): The name of the section.
+            transitive (bool): If ``True`` then include every section that can be
+                reached through ``use`` links, not just the direct ones.
+
+        Returns:
+            list: The names of the sections. Direct dependencies are in the order
+            of the ``use`` operations and transitive ones in breadth-first order.
+            ``section`` itself is only included if it ``use`` s itself directly
+            or, with ``transitive``, is part of a cycle.
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        return self._neighbors(self._adjacency, section, transitive)
+
+    def dependents(self, section, transitive=False) -> list:
+        """Get the sections that ``use`` a section.
+
+        Args:
+            section (str): The name of the section.
+            transitive (bool): If ``True`` then include every section that can
+                reach ``section`` through ``use`` links, not just the direct ones.
+
+        Returns:
+            list: The names of the sections, in section ID order for direct
+            dependents and in breadth-first order for transitive ones.
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        return self._neighbors(self._reverse_adjacency, section, transitive)
+
+    def cycle(self, section):
+        """Get the ``use`` cycle that a section is part of.
+
+        Returns:
+            tuple: The names of the sections in the cycle (in section ID order), or
+            ``None`` if ``section`` is not part of a cycle.
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        section_id = self.section_id(section)
+        self._update_components()
+        component = self._components[self._component_ids[section_id]]
+        if not self._is_cycle(component):
+            return None
+        return self._component_names(component)
+
+    def topological_order(self) -> list:
+        """Get the sections in an order where each one comes after the sections it ``use`` s.
+
+        Sections in a ``use`` cycle can't be ordered, they are listed together in
+        section ID order.
+
+        Returns:
+            list: The names of all of the sections.
+        """
+        self._update_components()
+        return [self._sections[i] for component in self._components for i in component]
+
+    def closure_bitset(self, section) -> int:
+        """Get the ``use`` closure of a section as a bitset.
+
+        The closure is the section itself and every section it can reach through
+        ``use`` links.
+
+        Returns:
+            int: A bitset of section IDs (see :py:meth:`sections_from_bitset`).
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        section_id = self.section_id(section)
+        self._update_components()
+        if not hasattr(self, '_closure_bitsets'):
+            self._closure_bitsets = self._component_bitsets(self._components, self._adjacency)
+        return self._closure_bitsets[self._component_ids[section_id]]
+
+    def dependents_bitset(self, section) -> int:
+        """Get the sections whose ``use`` closure contains a section, as a bitset.
+
+        This includes ``section`` itself.
+
+        Returns:
+            int: A bitset of section IDs (see :py:meth:`sections_from_bitset`).
+
+        Raises:
+            KeyError: If ``section`` is not in the graph.
+        """
+        section_id = self.section_id(section)
+        self._update_components()
+        if not hasattr(self, '_dependents_bitsets'):
+            # Dependents come after their dependencies so walk the components backwards.
+            self._dependents_bitsets = self._component_bitsets(
+                reversed(self._components), self._reverse_adjacency
+            )
+        return self._dependents_bitsets[self._component_ids[section_id]]
+
+    def option_bitset(self, option) -> int:
+        """Get the sections that contain an option key, as a bitset.
+
+        Returns:
+            int: A bitset of section IDs (see :py:meth:`sections_from_bitset`).
+            This is ``0`` if no section contains ``option``.
+        """
+        return self._option_bitsets.get(option, 0)
+
+    def sections_from_bitset(self, bitset) -> list:
+        """Convert a bitset of section IDs to a list of section names.
+
+        Returns:
+            list: The names of the sections in section ID order.
+        """
+        output = []
+        while bitset:
+            low_bit = bitset & -bitset
+            output.append(self._sections[low_bit.bit_length() - 1])
+            bitset ^= low_bit
+        return output
+
+    # -------------------------------------
+    #   H E L P E R S   ( P R I V A T E )
+    # -------------------------------------
+
+    def _add_edge(self, source, target) -> None:
+        """Add a link between two section IDs, unless it is already there."""
+        if target not in self._adjacency[source]:
+            self._adjacency[source].append(target)
+            self._reverse_adjacency[target].append(source)
+        return
+
+    def _update_components(self) -> None:
+        """Find the strongly connected components if the graph changed since they were found."""
+        if self._components is None:
+            self._components, self._component_ids = self._strongly_connected_components()
+        return
+
+    def _component_bitsets(self, components, adjacency) -> list:
+        """Compute the bitset of the sections reachable from each component.
+
+        Args:
+            components (iterable): The components, each one after every component
+                reachable from it through ``adjacency``.
+            adjacency (tuple): The adjacency arrays to follow.
+
+        Returns:
+            list: The bitsets, indexed by component.
+        """
+        output = [0] * len(self._components)
+        for component in components:
+            bitset = 0
+            for i in component:
+                bitset |= 1 << i
+            for i in component:
+                for j in adjacency[i]:
+                    bitset |= output[self._component_ids[j]]
+            output[self._component_ids[component[0]]] = bitset
+        return output
+
+    def _neighbors(self, adjacency, section, transitive) -> list:
+        """Get the sections next to (or reachable from) a section in ``adjacency``."""
+        section_id = self.section_id(section)
+
+        if not transitive:
+            return [self._sections[i] for i in adjacency[section_id]]
+
+        output = []
+        visited = [False] * len(self._sections)
+        queue = list(adjacency[section_id])
+        for i in queue:
+            visited[i] = True
+        for i in queue:
+            output.append(self._sections[i])
+            for j in adjacency[i]:
+                if not visited[j]:
+                    visited[j] = True
+                    queue.append(j)
+        return output
+
+    def _component_names(self, component) -> tuple:
+        return tuple(self._sections[i] for i in component)
+
+    def _is_cycle(self, component) -> bool:
+        return len(component) > 1 or component[0] in self._adjacency[component[0]]
+
+    def _strongly_connected_components(self) -> tuple:
+        """Find the strongly connected components with Tarjan's algorithm.
+
+        The depth-first search keeps its own stack of ``(section_id, next_edge)``
+        entries instead of recursing, so deep ``use`` chains can't hit Python's
+        recursion limit.
+
+        Returns:
+            tuple: A tuple ``(components, component_ids)`` where ``components`` is a
+            ``list`` of ``tuple`` s of section IDs in the order they were completed
+            (every component after the components it ``use`` s) and
+            ``component_ids`` maps each section ID to the index of its component.
+        """
+        num_sections = len(self._sections)
+        index = [-1] * num_sections
+        lowlink = [0] * num_sections
+        on_stack = [False] * num_sections
+        stack = []
+        counter = 0
+
+        components = []
+        component_ids = [0] * num_sections
+
+        for root in range(num_sections):
+            if index[root] != -1:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [[root, 0]]
+
+            while work:
+                frame = work[-1]
+                v = frame[0]
+                targets = self._adjacency[v]
+
+                if frame[1] < len(targets):
+                    w = targets[frame[1]]
+                    frame[1] += 1
+                    if index[w] == -1:
+                        index[w] = lowlink[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append([w, 0])
+                    elif on_stack[w]:
+                        lowlink[v] = min(lowlink[v], index[w])
+                    continue
+
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    lowlink[u] = min(lowlink[u], lowlink[v])
+
+                if lowlink[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component_ids[w] = len(components)
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(tuple(sorted(component)))
+
+        return components, component_ids
@@ -47,8 +47,11 @@ from .version import __version__
 
 from .TypedProperty import typed_property
 
+from .UseGraph import UseGraph
+
 from .ConfigParserEnhanced import AmbiguousHandlerError
 from .ConfigParserEnhanced import ConfigParserEnhanced
+from .ConfigParserEnhanced import InMemorySource
 
 from .Debuggable import Debuggable
 
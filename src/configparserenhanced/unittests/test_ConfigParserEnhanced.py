@@ -75,7 +75,11 @@ try:
 except ImportError:
     from io import StringIO
 
+import collections
 import configparser
+import copy
+import json
+from pathlib import Path
 
 from configparserenhanced import *
 # from ..HandlerParameters import HandlerParameters
@@ -88,6 +92,29 @@ from .common import *
 #
 #===============================================================================
 
+
+
+class ConfigParserEnhancedRecordFinalize(ConfigParserEnhanced):
+    """
+    Subclass used by the ``jobs`` tests of ``parse_all_sections``. This must live
+    at module scope so that it can be pickled and sent to the worker processes.
+
+    ``handler_record`` appends to ``data_shared`` and ``handler_finalize`` saves
+    the ``data_shared`` of each root section into ``self.finalized``.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.finalized = {}
+
+    def _handler_record(self, section_name, handler_parameters) -> int:
+        handler_parameters.data_shared.setdefault("record", []).append(handler_parameters.params[0])
+        return 0
+
+    def handler_finalize(self, section_name, handler_parameters) -> int:
+        self.finalized[handler_parameters.section_root] = handler_parameters.data_shared
+        return 0
+
 #===============================================================================
 #
 # Mock Helpers
@@ -194,7 +221,7 @@ class ConfigParserEnhancedTest(TestCase):
 
         parser.parse_section(section)
 
-        self.assertIsInstance(parser._loginfo, list)
+        self.assertIsInstance(parser._loginfo, collections.deque)
         self.assertIsInstance(parser._configparserdata, configparser.ConfigParser)
 
         print("OK")
@@ -214,7 +241,7 @@ class ConfigParserEnhancedTest(TestCase):
 
         parser.parse_section(section)
 
-        self.assertIsInstance(parser._loginfo, list)
+        self.assertIsInstance(parser._loginfo, collections.deque)
         self.assertIsInstance(parser._configparserdata, configparser.ConfigParser)
 
         parser.inifilepath = "foobar"
@@ -340,6 +367,64 @@ class ConfigParserEnhancedTest(TestCase):
         print("OK")
         return 0
 
+    def test_ConfigParserEnhanced_tokenize_option_key(self):
+        """
+        Verify that the cached option key tokenizer matches ``shlex.split``
+        and classifies the first token the same way the parser used to.
+        """
+        import re
+        import shlex
+
+        parser = ConfigParserEnhanced(filename=self._filename)
+
+        option_keys = [
+            "use X",
+            "use 'SECTION A'",
+            "envvar-set FOO",
+            "module-load gcc 7.2.0",
+            "op1 'op 2' op3",
+            'op1 "op2" +++',
+            "op1\top2   op3",
+            "op\\ 1 op2",
+            "key with # hash",
+            "op1 ''",
+            "key.with.dots",
+            "  opA  ",
+        ]
+
+        for option_key in option_keys:
+            tokens_expect = shlex.split(option_key.strip())
+            is_operation_expect = re.match(r"^[\w\-]+$", tokens_expect[0]) is not None
+
+            tokens_actual, is_operation_actual = parser._tokenize_and_classify_option_key(option_key)
+
+            print(f"{option_key!r:30} -> {tokens_actual} ({is_operation_actual})")
+            self.assertIsInstance(tokens_actual, tuple)
+            self.assertListEqual(tokens_expect, list(tokens_actual))
+            self.assertListEqual(tokens_expect, parser._tokenize_option_key(option_key))
+            self.assertEqual(is_operation_expect, is_operation_actual)
+
+        # Unbalanced quotes still raise like shlex does.
+        with self.assertRaises(ValueError):
+            parser._tokenize_option_key("op1 'op2")
+
+        # Subclasses that override `_tokenize_option_key` get it called by the parser.
+        class ConfigParserEnhancedTokenizer(ConfigParserEnhanced):
+
+            def _tokenize_option_key(self, option_key):
+                option_key_tok = super()._tokenize_option_key(option_key)
+                if option_key_tok[0] == "include":
+                    option_key_tok[0] = "use"
+                return option_key_tok
+
+        parser = ConfigParserEnhancedTokenizer(InMemorySource("[A]\ninclude B:\n[B]\nkey: B\n"))
+        self.assertTupleEqual((("use", "B"), True), parser._tokenize_and_classify_option_key("include B"))
+        self.assertDictEqual({"key": "B"}, parser.configparserenhanceddata["A"])
+        self.assertListEqual(["B"], parser.use_graph.dependencies("A"))
+
+        print("OK")
+        return 0
+
     def test_ConfigParserEnhanced_keyword_use(self):
         """
         Test the handler and parser for `use` commands to make sure we recurse properly.
@@ -1578,13 +1663,1710 @@ class ConfigParserEnhancedTest(TestCase):
 
         known_operations = parser.get_known_operations()
 
-        #self.assertIn("handlebars-are-cool", known_operations)
-        #self.assertIn("use", known_operations)
+        self.assertIn("handlebars-are-cool", known_operations)
+        self.assertIn("use", known_operations)
+        self.assertNotIn("initialize", known_operations)
+        self.assertNotIn("finalize", known_operations)
         print("----[ TEST END A  ]----------------------------------")
 
+        print("----[ TEST BEGIN B ]----------------------------------")
+        # An operation with both a public and a private handler is listed once per handler.
+        class ConfigParserEnhancedAmbiguous(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.operation_handler
+            def _handler_a_op(self, section_name, handler_parameters) -> int:
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_a_op(self, section_name, handler_parameters) -> int:
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_b_op(self, section_name, handler_parameters) -> int:
+                return 0
+
+        parser = ConfigParserEnhancedAmbiguous()
+        known_operations = parser.get_known_operations()
+        self.assertListEqual(["a-op", "use", "a-op", "b-op"], known_operations)
+
+        # The list is a copy of the one saved with the dispatch table.
+        known_operations.append("c-op")
+        self.assertListEqual(["a-op", "use", "a-op", "b-op"], parser.get_known_operations())
+        print("----[ TEST END B  ]----------------------------------")
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_handler_dispatch_table(self):
+        """
+        Check that the handler dispatch table is built per class and that
+        it flags ambiguous handlers.
+        """
+
+        class ConfigParserEnhancedTest(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_operation(self, section_name, handler_parameters) -> int:
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def _handler_operation(self, section_name, handler_parameters) -> int:
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_my_op(self, section_name, handler_parameters) -> int:
+                return 0
+
+        table_base = ConfigParserEnhanced._get_handler_dispatch_table()
+        table_test = ConfigParserEnhancedTest._get_handler_dispatch_table()
+
+        print(table_base)
+        print(table_test)
+
+        handler_use_f = ConfigParserEnhanced.__dict__["_handler_use"]
+        self.assertEqual(table_base["use"], ("_handler_use", handler_use_f, False))
+        self.assertNotIn("my_op", table_base)
+        self.assertNotIn("operation", table_base)
+
+        self.assertEqual(table_test["use"], ("_handler_use", handler_use_f, False))
+        self.assertEqual(
+            table_test["my_op"], ("handler_my_op", ConfigParserEnhancedTest.__dict__["handler_my_op"], False)
+        )
+        self.assertEqual(table_test["operation"][0 :: 2], ("handler_operation", True))
+
+        # The table is cached on the class.
+        self.assertIs(table_test, ConfigParserEnhancedTest._get_handler_dispatch_table())
+
+        parser = ConfigParserEnhancedTest(filename=self._filename)
+        parser.exception_control_level = 2
+
+        # Each parser binds the handlers once.
+        table_bound = parser._get_bound_handler_dispatch_table()
+        self.assertIs(table_bound, parser._get_bound_handler_dispatch_table())
+        self.assertEqual(table_bound["my_op"], ("handler_my_op", parser.handler_my_op, False))
+
+        # A copy of the parser binds the handlers to itself.
+        parser_copy = copy.copy(parser)
+        self.assertIs(parser_copy, parser_copy._get_bound_handler_dispatch_table()["my_op"][1].__self__)
+
+        with patch.object(parser, "_get_handler_dispatch_table", side_effect=AssertionError):
+            handler_name, handler_f = parser._locate_handler_method("my-op")
+        self.assertEqual(handler_name, "handler_my_op")
+        self.assertEqual(handler_f, parser.handler_my_op)
+
+        handler_name, handler_f = parser._locate_handler_method("operation")
+        self.assertEqual(handler_name, "handler_operation")
+
+        self.assertEqual(parser._locate_handler_method("no-such-op"), (None, None))
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_use_section_cache(self):
+        """
+        Check that enabling the section cache gives the same results as
+        a normal parse on a ``use`` graph with diamonds and cycles.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+        print("\n")
+        print("Load file: {}".format(filename_ini))
+
+        parser_expect = ConfigParserEnhanced(filename_ini)
+        parser_expect.exception_control_level = 0
+        parser_expect.parse_all_sections()
+
+        parser_actual = ConfigParserEnhanced(filename_ini)
+        parser_actual.exception_control_level = 0
+        parser_actual.use_section_cache = True
+        parser_actual.parse_all_sections()
+
+        for section in parser_expect.configparserenhanceddata.sections():
+            data_expect = parser_expect.configparserenhanceddata[section]
+            data_actual = parser_actual.configparserenhanceddata[section]
+            print(f"{section}: {data_actual}")
+            self.assertDictEqual(data_expect, data_actual)
+            self.assertListEqual(list(data_expect.keys()), list(data_actual.keys()))
+
+        section_cache = parser_actual.configparserenhanceddata._section_cache
+        self.assertIn("BASE-COMPILER", section_cache)
+        self.assertIn("ENV-C", section_cache)
+        self.assertSetEqual(
+            set(section_cache["ENV-A"][1]), {"ENV-A", "BASE-MPI", "BASE-BLAS", "BASE-COMPILER"}
+        )
+
+        # Sections that hit a cycle are not cached.
+        self.assertNotIn("CYCLE-A", section_cache)
+        self.assertNotIn("CYCLE-B", section_cache)
+
+        # The cache is reset when the .ini file changes.
+        parser_actual.inifilepath = filename_ini
+        self.assertDictEqual({}, parser_actual.configparserenhanceddata._section_cache)
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_use_section_cache_optout(self):
+        """
+        Check that handlers decorated with ``section_cache_optout`` see every
+        option when the section cache is enabled.
+        """
+
+        class ConfigParserEnhancedTest(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.section_cache_optout
+            @ConfigParserEnhanced.operation_handler
+            def _handler_record(self, section_name, handler_parameters) -> int:
+                data_shared = handler_parameters.data_shared
+                data_shared.setdefault("record", []).append(handler_parameters.params[0])
+                return 0
+
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser_expect = ConfigParserEnhancedTest(filename_ini)
+        parser_actual = ConfigParserEnhancedTest(filename_ini)
+        parser_actual.use_section_cache = True
+
+        for section in ["ENV-A", "ENV-B", "ENV-C"]:
+            result_expect = parser_expect.parse_section(section)
+            result_actual = parser_actual.parse_section(section)
+            print(f"{section}: {result_actual}")
+            self.assertDictEqual(result_expect, result_actual)
+
+        # Only DEFAULT, which has no `record` options, can be cached.
+        section_cache = parser_actual.configparserenhanceddata._section_cache
+        self.assertListEqual(["DEFAULT"], list(section_cache.keys()))
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_refresh(self):
+        """
+        Check that ``refresh()`` reloads changed files and only invalidates
+        the sections that depend on the sections that changed.
+        """
+        import shutil
+        import tempfile
+
+        filename_src = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_ini = os.path.join(tmpdir, "refresh.ini")
+            shutil.copyfile(filename_src, filename_ini)
+
+            parser = ConfigParserEnhanced(filename_ini)
+            parser.exception_control_level = 0
+
+            # Nothing is loaded yet so there is nothing to refresh.
+            self.assertListEqual([], parser.refresh())
+
+            parser.parse_all_sections()
+            sections_all = set(parser.configparserenhanceddata.sections())
+            configparserdata_old = parser.configparserdata
+
+            # Touching the file without changing its contents doesn't invalidate anything.
+            stat = os.stat(filename_ini)
+            os.utime(filename_ini, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+            self.assertListEqual([], parser.refresh())
+            self.assertIs(configparserdata_old, parser.configparserdata)
+
+            # Change BASE-BLAS
+            with open(filename_ini, "r") as ifp:
+                text = ifp.read()
+            text = text.replace("blas: openblas", "blas: mkl")
+            with open(filename_ini, "w") as ofp:
+                ofp.write(text)
+            os.utime(filename_ini, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2000000))
+
+            sections_invalidated = parser.refresh()
+            print(f"sections_invalidated: {sections_invalidated}")
+
+            sections_expect = {"BASE-BLAS", "ENV-A", "ENV-B", "ENV-C", "CYCLE-A", "CYCLE-B"}
+            self.assertSetEqual(sections_expect, set(sections_invalidated))
+
+            sections_checked = parser.configparserenhanceddata._sections_checked
+            self.assertSetEqual(sections_all - sections_expect, sections_checked)
+
+            # Invalidated sections are re-parsed with the new data.
+            self.assertEqual("mkl", parser.configparserenhanceddata.get("ENV-C", "blas"))
+            self.assertEqual("gcc", parser.configparserenhanceddata.get("ENV-A", "cc"))
+
+            # The contents of the files are not kept. Files that didn't change are
+            # read again when another file changed.
+            filename_ini_2 = os.path.join(tmpdir, "refresh-2.ini")
+            with open(filename_ini_2, "w") as ofp:
+                ofp.write("[EXTRA]\nkey: value1\n")
+
+            parser = ConfigParserEnhanced([filename_ini, filename_ini_2])
+            parser.exception_control_level = 0
+            parser.parse_all_sections()
+            for inifile_state in parser._inifile_states:
+                self.assertTupleEqual(("mtime_ns", "size", "digest"), inifile_state._fields)
+
+            with open(filename_ini_2, "w") as ofp:
+                ofp.write("[EXTRA]\nkey: value22\n")
+
+            with patch.object(parser, "_read_inifile", wraps=parser._read_inifile) as read_inifile:
+                self.assertListEqual(["EXTRA"], parser.refresh())
+            self.assertListEqual(
+                sorted([filename_ini, filename_ini_2]), sorted(str(x[0][0]) for x in read_inifile.call_args_list)
+            )
+            self.assertEqual("value22", parser.configparserenhanceddata.get("EXTRA", "key"))
+            self.assertEqual("mkl", parser.configparserenhanceddata.get("ENV-C", "blas"))
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_cache_dir(self):
+        """
+        Check that the on-disk parse cache is saved and reused by new
+        parser instances.
+        """
+        import glob
+        import tempfile
+
+        class ConfigParserEnhancedTest(ConfigParserEnhanced):
+            pass
+
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, "cache")
+
+            parser = ConfigParserEnhanced(filename_ini)
+            parser.exception_control_level = 0
+            parser.cache_dir = cache_dir
+            self.assertIsInstance(parser.cache_dir, Path)
+
+            # Loading the raw data saves an entry.
+            parser.configparserdata
+            self.assertEqual(1, len(glob.glob(os.path.join(cache_dir, "*.pickle"))))
+
+            # Parsing everything updates the entry with the parsed data.
+            parser.parse_all_sections()
+            self.assertEqual(1, len(glob.glob(os.path.join(cache_dir, "*.pickle"))))
+            self.assertEqual(0, len(glob.glob(os.path.join(cache_dir, ".tmp-*"))))
+
+            # A new parser loads the parsed data without running the parser.
+            parser_cached = ConfigParserEnhanced(filename_ini)
+            parser_cached.cache_dir = cache_dir
+            with patch.object(parser_cached, "_parse_section_r", side_effect=RuntimeError) as mock_parse:
+                for section in parser.configparserenhanceddata.sections():
+                    self.assertDictEqual(
+                        parser.configparserenhanceddata[section], parser_cached.configparserenhanceddata[section]
+                    )
+                mock_parse.assert_not_called()
+
+            # Subclasses get their own entries.
+            parser_subclass = ConfigParserEnhancedTest(filename_ini)
+            parser_subclass.cache_dir = cache_dir
+            parser_subclass.configparserdata
+            self.assertEqual(2, len(glob.glob(os.path.join(cache_dir, "*.pickle"))))
+
+            # Changing a handler or `parse_cache_version` gives a new entry.
+            class ConfigParserEnhancedTestHandler(ConfigParserEnhanced):
+
+                def handler_finalize(self, section_name, handler_parameters) -> int:
+                    handler_parameters.data_shared["finalized"] = True
+                    return 0
+
+            class ConfigParserEnhancedTestVersion(ConfigParserEnhancedTest):
+                parse_cache_version = 2
+
+            parser_keys = set()
+            for parser_class in [ConfigParserEnhancedTest, ConfigParserEnhancedTestVersion]:
+                parser_key = parser_class(filename_ini)
+                parser_key.configparserdata
+                parser_keys.add(parser_key._parse_cache_key(parser_key._inifile_states))
+            self.assertEqual(2, len(parser_keys))
+            self.assertNotEqual(
+                ConfigParserEnhanced._get_handler_code_digest(),
+                ConfigParserEnhancedTestHandler._get_handler_code_digest()
+            )
+            self.assertEqual(
+                ConfigParserEnhanced._get_handler_code_digest(),
+                ConfigParserEnhancedTest._get_handler_code_digest()
+            )
+
+            # Entries that are writable by others are not loaded.
+            self.assertEqual(0, os.stat(cache_dir).st_mode & 0o077)
+            parser_untrusted = ConfigParserEnhanced(filename_ini)
+            parser_untrusted.exception_control_level = 4
+            parser_untrusted.cache_dir = cache_dir
+            cache_key = parser._parse_cache_key(parser._inifile_states)
+            cache_file = parser_untrusted.cache_dir / f"{cache_key}.pickle"
+            os.chmod(cache_file, 0o666)
+            with patch.object(
+                parser_untrusted, "exception_control_event", wraps=parser_untrusted.exception_control_event
+            ) as event:
+                with patch('pickle.load', side_effect=RuntimeError) as mock_load:
+                    parser_untrusted.configparserdata
+                    mock_load.assert_not_called()
+                self.assertEqual(("WARNING", PermissionError), event.call_args_list[0][0][:2])
+            os.chmod(cache_file, 0o600)
+
+            # Bad cache entries are ignored.
+            for cache_file in glob.glob(os.path.join(cache_dir, "*.pickle")):
+                with open(cache_file, "wb") as ofp:
+                    ofp.write(b"not a pickle")
+
+            parser_bad_cache = ConfigParserEnhanced(filename_ini)
+            parser_bad_cache.exception_control_level = 0
+            parser_bad_cache.cache_dir = cache_dir
+            self.assertDictEqual(
+                parser.configparserenhanceddata["ENV-C"], parser_bad_cache.configparserenhanceddata["ENV-C"]
+            )
+
+            parser_bad_cache.cache_dir = None
+            self.assertIsNone(parser_bad_cache.cache_dir)
+
+            with self.assertRaises(TypeError):
+                parser_bad_cache.cache_dir = 10
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_parse_all_sections_jobs(self):
+        """
+        Test that ``parse_all_sections(jobs=N)`` gives the same results as a serial
+        parse, including the state saved by ``handler_finalize``.
+        """
+        import concurrent.futures
+        import pickle
+        import tempfile
+
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser_serial = ConfigParserEnhancedRecordFinalize(filename_ini)
+        parser_serial.exception_control_level = 0
+        parser_serial.parse_all_sections()
+
+        parser_jobs = ConfigParserEnhancedRecordFinalize(filename_ini)
+        parser_jobs.exception_control_level = 0
+        parser_jobs.parse_all_sections(jobs=3)
+
+        for section in parser_serial.configparserenhanceddata.sections():
+            print(f"Check section: {section}")
+            self.assertDictEqual(
+                parser_serial.configparserenhanceddata[section], parser_jobs.configparserenhanceddata[section]
+            )
+
+        self.assertDictEqual(parser_serial.finalized, parser_jobs.finalized)
+        self.assertListEqual(
+            parser_jobs.finalized["ENV-C"]["record"],
+            [
+                "BASE-COMPILER",
+                "BASE-MPI",
+                "BASE-COMPILER",
+                "BASE-BLAS",
+                "BASE-COMPILER",
+                "BASE-BLAS",
+                "BASE-COMPILER",
+                "BASE-MPI"
+            ]
+        )
+        self.assertDictEqual(parser_serial.parse_section_last_result, parser_jobs.parse_section_last_result)
+        self.assertSetEqual(
+            parser_serial.configparserenhanceddata._sections_checked,
+            parser_jobs.configparserenhanceddata._sections_checked
+        )
+
+        # Already parsed sections are not sent to the workers again.
+        with patch("concurrent.futures.ProcessPoolExecutor", side_effect=RuntimeError):
+            parser_jobs.parse_all_sections(jobs=3)
+
+        # Workers don't get the parsed state, or the parser through its bound handlers,
+        # and a debug_sink that can't be pickled stays in this process.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "debug.log"), "w") as debug_sink:
+                parser_jobs = ConfigParserEnhancedRecordFinalize(filename_ini)
+                parser_jobs.exception_control_level = 0
+                parser_jobs.debug_sink = debug_sink
+                parser_jobs.parse_section("ENV-A")
+                self.assertTrue(hasattr(parser_jobs, "_bound_dispatch_table_data"))
+
+                # Take a pickled copy of the parser sent to the first worker, the way a
+                # process pool would, before any of the workers run.
+                worker_parsers = []
+
+                class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+
+                    def submit(self, fn, parser, *args):
+                        if len(worker_parsers) == 0:
+                            worker_parsers.append(pickle.loads(pickle.dumps(parser)))
+                        return super().submit(fn, parser, *args)
+
+                with patch("concurrent.futures.ProcessPoolExecutor", RecordingExecutor):
+                    parser_jobs.parse_all_sections(jobs=2)
+
+                worker_parser = worker_parsers[0]
+                self.assertFalse(hasattr(worker_parser, "_bound_dispatch_table_data"))
+                self.assertFalse(hasattr(worker_parser, "_configparserenhanceddata"))
+                self.assertIsNone(worker_parser.debug_sink)
+                self.assertIs(debug_sink, parser_jobs.debug_sink)
+
+                parser_jobs = ConfigParserEnhancedRecordFinalize(filename_ini)
+                parser_jobs.exception_control_level = 0
+                parser_jobs.debug_sink = debug_sink
+                parser_jobs.parse_all_sections(jobs=2)
+                self.assertDictEqual(parser_serial.finalized, parser_jobs.finalized)
+
+        with self.assertRaises(ValueError):
+            parser_jobs.parse_all_sections(jobs=0)
+
+        with self.assertRaises(TypeError):
+            parser_jobs.parse_all_sections(jobs="2")
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_lazy_load(self):
+        """
+        Test that ``lazy_load`` mode gives the same results as loading the whole
+        file and that only the sections that are needed get loaded.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        for mmap_threshold in [1024 * 1024, 0]:
+            print(f"LAZY_LOAD_MMAP_THRESHOLD: {mmap_threshold}")
+            module_globals = sys.modules[ConfigParserEnhanced.__module__].__dict__
+            with patch.dict(module_globals, {"LAZY_LOAD_MMAP_THRESHOLD": mmap_threshold}):
+                parser = ConfigParserEnhanced(filename_ini)
+                parser.exception_control_level = 0
+
+                parser_lazy = ConfigParserEnhanced(filename_ini)
+                parser_lazy.exception_control_level = 0
+                parser_lazy.lazy_load = True
+                self.assertTrue(parser_lazy.lazy_load)
+
+                # Parsing one section only loads it and its `use` closure.
+                parser_lazy.parse_section("ENV-A")
+                self.assertSetEqual(
+                    {"ENV-B", "ENV-C", "CYCLE-A", "CYCLE-B"},
+                    parser_lazy.configparserdata._lazy_pending
+                )
+                if mmap_threshold == 0:
+                    self.assertIsNone(parser_lazy.configparserdata._lazy_sources[0][1])
+
+                self.assertListEqual(parser.configparserdata.sections(), parser_lazy.configparserdata.sections())
+                for section in parser.configparserenhanceddata.sections():
+                    self.assertDictEqual(
+                        parser.configparserenhanceddata[section], parser_lazy.configparserenhanceddata[section]
+                    )
+                    self.assertListEqual(
+                        parser.configparserdata.items(section, raw=True),
+                        parser_lazy.configparserdata.items(section, raw=True)
+                    )
+
+        # Loading a section only parses its own lines, not the lines before it.
+        import tempfile
+
+        lines_read = []
+        read_file = configparser.ConfigParser.read_file
+
+        def read_file_counted(self, f, source=None):
+            lines = list(f)
+            lines_read.append(len(lines))
+            return read_file(self, lines, source=source)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_many = os.path.join(tmpdir, "many_sections.ini")
+            with open(filename_many, "w") as ofp:
+                for i in range(200):
+                    ofp.write(f"[SEC-{i}]\nkey-{i}: value {i}\n\n")
+
+            parser_many = ConfigParserEnhanced(filename_many)
+            parser_many.lazy_load = True
+            with patch.object(configparser.ConfigParser, "read_file", read_file_counted):
+                self.assertEqual("value 199", parser_many.configparserdata["SEC-199"]["key-199"])
+                parser_many.configparserdata.items("SEC-100", raw=True)
+            self.assertListEqual([3, 3], lines_read)
+
+        # Changing the mode resets the loaded data.
+        parser_lazy.lazy_load = False
+        self.assertFalse(hasattr(parser_lazy, "_configparserdata"))
+
+        with self.assertRaises(TypeError):
+            parser_lazy.lazy_load = "yes"
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_lazy_load_errors(self):
+        """
+        Test that ``lazy_load`` mode raises duplicate option and duplicate section
+        errors when the affected section is loaded.
+        """
+        import tempfile
+
+        filename_bad = find_config_ini(filename="config_test_configparserenhanced_badkeys.ini")
+
+        parser = ConfigParserEnhanced(filename_bad)
+        parser.exception_control_level = 0
+        parser.lazy_load = True
+
+        # Loading the file doesn't load the bad sections.
+        self.assertIn("SECTION-A", parser.configparserdata.sections())
+
+        with self.assertRaises(configparser.DuplicateOptionError):
+            parser.parse_section("SECTION-A")
+
+        # SECTION-B is fine and can be loaded on its own.
+        self.assertEqual("value 2", parser.configparserenhanceddata["SECTION-B"]["key2"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_ini = os.path.join(tmpdir, "duplicate_section.ini")
+            with open(filename_ini, "w") as ofp:
+                ofp.write("[SEC-A]\nkey: value\n\n[SEC-B]\nkey: value\n\n[SEC-A]\nkey2: value\n")
+
+            parser = ConfigParserEnhanced(filename_ini)
+            parser.exception_control_level = 0
+            parser.lazy_load = True
+
+            self.assertDictEqual({"key": "value"}, parser.configparserenhanceddata["SEC-B"])
+
+            with self.assertRaises(configparser.DuplicateSectionError) as context:
+                parser.parse_section("SEC-A")
+            self.assertEqual(7, context.exception.lineno)
+
+            # Errors in a section give the same line numbers as loading the whole file.
+            filename_ini = os.path.join(tmpdir, "errors.ini")
+            for bad_option, exception_type in [("key: 1\nkey: 2", configparser.DuplicateOptionError),
+                                               ("= value", configparser.ParsingError)]:
+                with open(filename_ini, "w") as ofp:
+                    ofp.write(f"[SEC-A]\nkey: value\n\n[SEC-B]\n{bad_option}\n\n[SEC-C]\nkey: value\n")
+
+                with self.assertRaises(exception_type) as context_eager:
+                    ConfigParserEnhanced(filename_ini).configparserdata
+
+                parser = ConfigParserEnhanced(filename_ini)
+                parser.lazy_load = True
+                with self.assertRaises(exception_type) as context:
+                    parser.configparserdata["SEC-B"]
+                self.assertEqual(str(context_eager.exception), str(context.exception))
+
+            # Reporting a `use` cycle doesn't load the rest of the file. The `use` graph
+            # grows as sections load and a cycle that gains a section (CYC-C is loaded
+            # after the first hit) is still only reported once.
+            filename_ini = os.path.join(tmpdir, "cycle.ini")
+            with open(filename_ini, "w") as ofp:
+                ofp.write("[CYC-A]\nuse CYC-B\n[CYC-B]\nuse CYC-A\nuse CYC-C\n[CYC-C]\nuse CYC-A\n")
+                ofp.write("[BAD]\nkey: 1\nkey: 2\n")
+
+            parser = ConfigParserEnhanced(filename_ini)
+            parser.exception_control_level = 0
+            parser.lazy_load = True
+            event_wrapped = parser.exception_control_event
+            with patch.object(parser, "exception_control_event", wraps=event_wrapped) as event:
+                with patch.object(parser, "_new_use_graph", wraps=parser._new_use_graph) as new_use_graph:
+                    parser.parse_section("CYC-A")
+            self.assertEqual(["WARNING", "SILENT"], [x[0][0] for x in event.call_args_list])
+            self.assertIn("- sections in the cycle: [CYC-A], [CYC-B]", event.call_args_list[0][0][2])
+            self.assertIn("- sections in the cycle: [CYC-A], [CYC-B], [CYC-C]", event.call_args_list[1][0][2])
+            self.assertIn("BAD", parser.configparserdata._lazy_pending)
+            self.assertEqual(0, new_use_graph.call_count)
+            self.assertEqual(("CYC-A", "CYC-B", "CYC-C"), parser._use_graph.sections)
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_debug_level_0_skips_formatting(self):
+        """
+        Test that the shared data isn't formatted for debugging messages when
+        ``debug_level`` is 0, since doing so on every handler call is expensive.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        repr_calls = []
+
+        class ReprCounter(object):
+
+            def __repr__(self):
+                repr_calls.append(1)
+                return "ReprCounter"
+
+        class ConfigParserEnhancedTest(ConfigParserEnhanced):
+
+            def handler_initialize(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared["counter"] = ReprCounter()
+                return 0
+
+        parser = ConfigParserEnhancedTest(filename_ini)
+        parser.exception_control_level = 0
+        parser.parse_section("ENV-C")
+        self.assertEqual(0, len(repr_calls))
+
+        # With a high enough debug level the shared data is printed.
+        parser.debug_level = 3
+        with patch('sys.stdout', new=StringIO()):
+            parser.parse_section("ENV-C")
+        self.assertGreater(len(repr_calls), 0)
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_loginfo(self):
+        """
+        Test the bounded ``_loginfo`` trace and its iterator and export methods.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 0
+
+        # Nothing is recorded when debug_level is 0.
+        parser.parse_section("ENV-C")
+        self.assertListEqual([], list(parser.loginfo_iter()))
+
+        parser.debug_level = 1
+        with patch('sys.stdout', new=StringIO()):
+            parser.parse_section("ENV-C")
+
+        loginfo_all = list(parser.loginfo_iter())
+        self.assertGreater(len(loginfo_all), 0)
+
+        section_entry_list = [d['name'] for d in parser.loginfo_iter("section-entry")]
+        self.assertEqual("DEFAULT", section_entry_list[0])
+        self.assertEqual("ENV-C", section_entry_list[1])
+
+        # Handler records hold a snapshot of the parameters, not the live object.
+        for entry in parser.loginfo_iter("handler-entry"):
+            self.assertIsInstance(entry['parameters'], dict)
+            self.assertEqual("ENV-C", entry['parameters']['section_root'])
+            self.assertIsInstance(entry['parameters']['data_shared_id'], int)
+
+        # Export as JSON Lines.
+        ofp = StringIO()
+        self.assertEqual(len(loginfo_all), parser.loginfo_export(ofp))
+        lines = ofp.getvalue().splitlines()
+        self.assertEqual(len(loginfo_all), len(lines))
+        self.assertEqual(loginfo_all[0]['type'], json.loads(lines[0])['type'])
+
+        ofp = StringIO()
+        self.assertEqual(len(section_entry_list), parser.loginfo_export(ofp, "section-entry"))
+
+        # The trace only keeps the most recent records.
+        parser.loginfo_capacity = 5
+        with patch('sys.stdout', new=StringIO()):
+            parser.parse_section("ENV-C")
+        loginfo_bounded = list(parser.loginfo_iter())
+        self.assertEqual(5, len(loginfo_bounded))
+        self.assertListEqual([d['type'] for d in loginfo_all[-5 :]], [d['type'] for d in loginfo_bounded])
+
+        with self.assertRaises(ValueError):
+            parser.loginfo_capacity = 0
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_profile(self):
+        """
+        Test the opt-in section and handler profiler.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 0
+
+        # Nothing is recorded unless the profiler is enabled.
+        parser.parse_section("ENV-A")
+        self.assertDictEqual({"root-section": {}, "section": {}, "handler": {}}, parser.profile_data())
+
+        parser.profile_enabled = True
+        parser.parse_section("ENV-A")
+        parser.parse_section("ENV-B")
+
+        data = parser.profile_data()
+        pprint(data, width=120)
+
+        self.assertSetEqual({"ENV-A", "ENV-B"}, set(data["root-section"].keys()))
+        self.assertEqual(1, data["root-section"]["ENV-A"]["calls"])
+
+        # ENV-A and ENV-B each use BASE-COMPILER twice, through BASE-MPI and BASE-BLAS.
+        self.assertEqual(4, data["section"]["BASE-COMPILER"]["calls"])
+        self.assertEqual(2, data["section"]["DEFAULT"]["calls"])
+        self.assertEqual(8, data["handler"]["_handler_use"]["calls"])
+        self.assertEqual(2, data["handler"]["handler_finalize"]["calls"])
+
+        for category in data.values():
+            for stats in category.values():
+                self.assertGreaterEqual(stats["total_ms"], stats["self_ms"])
+                self.assertGreaterEqual(stats["self_ms"], 0.0)
+
+        # The root section encloses all the work done for it.
+        self.assertGreaterEqual(
+            data["root-section"]["ENV-A"]["total_ms"], data["section"]["ENV-A"]["total_ms"]
+        )
+
+        report = parser.profile_report(limit=2)
+        print(report)
+        self.assertIn("root-section", report)
+        self.assertIn("_handler_use", report)
+
+        with self.assertRaises(ValueError):
+            parser.profile_report(sort_by="name")
+
+        # Sections slower than the threshold are logged.
+        parser.profile_threshold_ms = 0
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            parser.parse_section("ENV-A")
+            self.assertIn("Profile: root-section `ENV-A` took", fake_out.getvalue())
+            self.assertIn("Profile: section `BASE-COMPILER` took", fake_out.getvalue())
+
+        parser.profile_reset()
+        self.assertDictEqual({"root-section": {}, "section": {}, "handler": {}}, parser.profile_data())
+
+        print("OK")
+        return 0
+
+
+    def test_ConfigParserEnhanced_handler_parameters_reuse(self):
+        """
+        Test that the parser reuses ``HandlerParameters`` objects between
+        levels of recursion without changing the results.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        class ConfigParserEnhancedTrackFrames(ConfigParserEnhancedRecordFinalize):
+
+            def _new_handler_parameters(self, handler_parameters=None):
+                output = super()._new_handler_parameters(handler_parameters)
+                # Keep a reference to every object so ids can't be recycled.
+                self.frames.append(output)
+                return output
+
+        def parse(pool_size):
+            module_globals = sys.modules[ConfigParserEnhanced.__module__].__dict__
+            with patch.dict(module_globals, {"HANDLER_PARAMETERS_POOL_SIZE": pool_size}):
+                parser = ConfigParserEnhancedTrackFrames(filename_ini)
+                parser.exception_control_level = 0
+                parser.reuse_handler_parameters = True
+                parser.frames = []
+                parser.parse_all_sections()
+            return parser
+
+        parser_reuse = parse(64)
+        parser_noreuse = parse(0)
+
+        frames_distinct_reuse = len({id(x) for x in parser_reuse.frames})
+        frames_distinct_noreuse = len({id(x) for x in parser_noreuse.frames})
+        print(f"Requested   : {len(parser_reuse.frames)}")
+        print(f"Reuse       : {frames_distinct_reuse}")
+        print(f"No reuse    : {frames_distinct_noreuse}")
+
+        self.assertEqual(len(parser_reuse.frames), len(parser_noreuse.frames))
+        self.assertEqual(len(parser_noreuse.frames), frames_distinct_noreuse)
+        self.assertLess(frames_distinct_reuse, frames_distinct_noreuse)
+
+        # The results must not change.
+        for section in parser_noreuse.configparserdata.sections():
+            self.assertDictEqual(
+                dict(parser_noreuse.configparserenhanceddata.items(section)),
+                dict(parser_reuse.configparserenhanceddata.items(section))
+            )
+        self.assertDictEqual(parser_noreuse.finalized, parser_reuse.finalized)
+
+        # Handlers can keep their `handler_parameters` unless reuse is enabled.
+        class ConfigParserEnhancedKeep(ConfigParserEnhanced):
+
+            def handler_initialize(self, section_name, handler_parameters) -> int:
+                self.kept.append(handler_parameters)
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_keep(self, section_name, handler_parameters) -> int:
+                self.kept.append(handler_parameters)
+                return 0
+
+        def kept_fields(parser):
+            return [(x.handler_name, x.section_root, x.op, x.value) for x in parser.kept]
+
+        expected = [
+            ("handler_initialize", "B", "", ""),
+            ("handler_keep", "B", "keep", "value A"),
+            ("handler_keep", "B", "keep", "value B"),
+        ]
+
+        source = InMemorySource("[A]\nkeep A: value A\n[B]\nuse A\nkeep B: value B\n")
+        for reuse_handler_parameters in [None, False, True]:
+            parser = ConfigParserEnhancedKeep(source)
+            if reuse_handler_parameters is not None:
+                parser.reuse_handler_parameters = reuse_handler_parameters
+            parser.kept = []
+            parser.parse_section("B")
+            if reuse_handler_parameters:
+                self.assertNotEqual(expected, kept_fields(parser))
+            else:
+                self.assertFalse(parser.reuse_handler_parameters)
+                self.assertListEqual(expected, kept_fields(parser))
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_trusted_mode(self):
+        """
+        Test that ``trusted_mode`` skips the internal parameter checks but
+        keeps the checks at the public API and gives the same results.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        def parse(trusted_mode):
+            parser = ConfigParserEnhancedRecordFinalize(filename_ini)
+            parser.exception_control_level = 0
+            parser.trusted_mode = trusted_mode
+            with patch.object(
+                ConfigParserEnhanced,
+                "_validate_parameter",
+                autospec=True,
+                side_effect=ConfigParserEnhanced._validate_parameter
+            ) as mock_validate:
+                parser.parse_all_sections()
+            return parser, mock_validate.call_count
+
+        parser_strict, calls_strict = parse(False)
+        parser_trusted, calls_trusted = parse(True)
+        print(f"_validate_parameter calls: strict={calls_strict}, trusted={calls_trusted}")
+
+        self.assertFalse(parser_strict.trusted_mode)
+        self.assertLess(calls_trusted, calls_strict)
+        self.assertDictEqual(parser_strict.finalized, parser_trusted.finalized)
+        for section in parser_strict.configparserdata.sections():
+            self.assertDictEqual(
+                dict(parser_strict.configparserenhanceddata.items(section)),
+                dict(parser_trusted.configparserenhanceddata.items(section))
+            )
+
+        # The public API and the property setters are still checked.
+        parser_trusted.exception_control_level = 4
+        with self.assertRaises(TypeError):
+            parser_trusted.parse_section(None)
+        with self.assertRaises(TypeError):
+            parser_trusted.trusted_mode = 1
+
+        # Internal calls are only checked in the default (strict) mode.
+        parser_strict.exception_control_level = 4
+        with self.assertRaises(TypeError):
+            parser_strict._locate_handler_method(None)
+
+        # `None` in a type restriction means `type(None)`.
+        self.assertEqual(0, parser_strict._validate_parameter(None, (str, None)))
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_debug_categories(self):
+        """
+        Test that the parser's debug messages can be enabled per category and
+        sent to a sink instead of ``stdout``.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 0
+        parser.debug_categories = {"section": 2}
+
+        sink = StringIO()
+        parser.debug_sink = sink
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            parser.parse_section("ENV-A")
+            self.assertEqual("", fake_out.getvalue())
+
+        output = sink.getvalue()
+        print(output)
+        self.assertIn("[D-1] >>> Enter section    : `ENV-A`", output)
+        self.assertIn("[D-2] ==> Entry        : `use BASE-MPI`", output)
+        self.assertNotIn("Enter handler", output)
+        self.assertNotIn("Parse section", output)
+
+        # Handler messages only.
+        parser.debug_categories = {"handler": 1}
+        sink = StringIO()
+        parser.debug_sink = sink
+        parser.parse_section("ENV-A")
+
+        output = sink.getvalue()
+        self.assertIn("[D-1] Enter handler    : _handler_use", output)
+        self.assertNotIn("Enter section", output)
+        self.assertNotIn("-> op", output)
+
+        # The categories only filter the messages, `_loginfo` still records everything.
+        parser.debug_level = 1
+        parser.debug_categories = {}
+        parser.debug_sink = StringIO()
+        parser.parse_section("ENV-A")
+        loginfo_expected = [x["type"] for x in parser._loginfo]
+        self.assertIn("handler-entry", loginfo_expected)
+        self.assertIn("handler-exit", loginfo_expected)
+        self.assertIn("section-entry", loginfo_expected)
+
+        parser.debug_categories = {"handler": 0, "section": 0}
+        sink = StringIO()
+        parser.debug_sink = sink
+        parser.parse_section("ENV-A")
+        self.assertNotIn("Enter handler", sink.getvalue())
+        self.assertNotIn("Enter section", sink.getvalue())
+        self.assertListEqual(loginfo_expected, [x["type"] for x in parser._loginfo])
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_unroll_base_class_parser_cached(self):
+        """
+        Check that the base-class parser used by ``unroll_to_str()`` and ``write()``
+        is reused between calls and is reset or refreshed when the inputs change.
+        """
+        import io
+        import shutil
+        import tempfile
+
+        filename_src = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_ini = os.path.join(tmpdir, "unroll.ini")
+            shutil.copyfile(filename_src, filename_ini)
+
+            parser = ConfigParserEnhanced(filename_ini)
+            parser.exception_control_level = 0
+
+            text = parser.unroll_to_str()
+            base_parser = parser._get_unroll_base_class_parser()
+            self.assertIs(base_parser, parser._get_unroll_base_class_parser())
+
+            # `write()` streams the same text, one section at a time.
+            with patch.object(ConfigParserEnhanced, "__init__", side_effect=AssertionError):
+                ofp = io.StringIO()
+                ofp.write = Mock(wraps=ofp.write)
+                parser.write(ofp)
+            self.assertEqual(text, ofp.getvalue())
+            self.assertEqual(len(parser.configparserdata.sections()), ofp.write.call_count)
+
+            # Refreshing the parser refreshes the cached parser.
+            stat = os.stat(filename_ini)
+            with open(filename_ini, "r") as ifp:
+                text_ini = ifp.read()
+            with open(filename_ini, "w") as ofp:
+                ofp.write(text_ini.replace("blas: openblas", "blas: mkl"))
+            os.utime(filename_ini, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+            self.assertEqual(text, parser.unroll_to_str())
+            parser.refresh()
+            text_refreshed = parser.unroll_to_str()
+            self.assertIs(base_parser, parser._get_unroll_base_class_parser())
+            self.assertIn("blas : mkl", text_refreshed)
+            self.assertNotIn("blas : openblas", text_refreshed)
+
+            # Changing the delimiters or the file resets it.
+            parser.configparser_delimiters = ("=", ":")
+            self.assertIsNot(base_parser, parser._get_unroll_base_class_parser())
+
+            base_parser = parser._get_unroll_base_class_parser()
+            parser.inifilepath = filename_src
+            self.assertIsNot(base_parser, parser._get_unroll_base_class_parser())
+            self.assertEqual(text, parser.unroll_to_str())
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_concurrent_load(self):
+        """
+        Check that ``concurrent_load`` reads multiple files on a thread pool with
+        the same result and errors as a serial load.
+        """
+        import tempfile
+
+        filename_ini = [
+            find_config_ini(filename="config_test_configparserenhanced_validation_03a.ini"),
+            find_config_ini(filename="config_test_configparserenhanced_validation_03b.ini"),
+            find_config_ini(filename="config_test_configparserenhanced_use_graph.ini"),
+        ]
+
+        def load(filenames, concurrent_load):
+            parser = ConfigParserEnhanced(filenames)
+            parser.exception_control_level = 0
+            parser.concurrent_load = concurrent_load
+            parser.configparserdata
+            return parser
+
+        parser_serial = load(filename_ini, False)
+
+        # Files are checked when they are opened, not with `exists()` and `is_file()`.
+        with patch.object(Path, "exists", side_effect=AssertionError):
+            with patch.object(Path, "is_file", side_effect=AssertionError):
+                parser_concurrent = load(filename_ini, True)
+
+        self.assertListEqual(
+            parser_serial.configparserdata.sections(), parser_concurrent.configparserdata.sections()
+        )
+        for section in parser_serial.configparserdata.sections():
+            self.assertListEqual(
+                parser_serial.configparserdata.items(section, raw=True),
+                parser_concurrent.configparserdata.items(section, raw=True)
+            )
+        self.assertListEqual(parser_serial._inifile_states, parser_concurrent._inifile_states)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_missing_1 = os.path.join(tmpdir, "missing-1.ini")
+            filename_missing_2 = os.path.join(tmpdir, "missing-2.ini")
+
+            # The error is for the first file in the list that can't be loaded.
+            for filenames in [
+                [filename_ini[0], filename_missing_1, filename_missing_2],
+                [filename_ini[0], tmpdir, filename_missing_2],
+            ]:
+                with self.assertRaises(IOError) as context:
+                    load(filenames, True)
+                self.assertIn(f"Requested file: `{filenames[1]}`", str(context.exception))
+
+        # Duplicate options are still detected.
+        filename_bad = find_config_ini(filename="config_test_configparserenhanced_badkeys.ini")
+        with self.assertRaises(configparser.DuplicateOptionError):
+            load([filename_ini[0], filename_bad], True)
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_encoding(self):
+        """
+        Check that the ``.ini`` files are decoded as UTF-8 by default and with the
+        ``encoding`` that is set otherwise.
+        """
+        import subprocess
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename_default = os.path.join(tmpdir, "default.ini")
+            with open(filename_default, "w") as ofp:
+                ofp.write("[A]\nkey: value A\n")
+
+            filename_latin1 = os.path.join(tmpdir, "latin1.ini")
+            with open(filename_latin1, "wb") as ofp:
+                ofp.write("[SECTION \u00c9]\nkey: caf\u00e9\n".encode("latin-1"))
+
+            filename_utf8 = os.path.join(tmpdir, "utf8.ini")
+            with open(filename_utf8, "wb") as ofp:
+                ofp.write("[A]\nkey: caf\u00e9\n".encode("utf-8"))
+
+            # By default the files are read as UTF-8.
+            parser = ConfigParserEnhanced(filename_default)
+            self.assertEqual("utf-8", parser.encoding)
+            self.assertEqual("value A", parser.configparserdata["A"]["key"])
+
+            # ... whatever the locale is.
+            script = textwrap.dedent(
+                """\
+                import sys
+                from configparserenhanced import ConfigParserEnhanced
+                for lazy_load in [False, True]:
+                    parser = ConfigParserEnhanced(sys.argv[1])
+                    parser.lazy_load = lazy_load
+                    assert parser.configparserdata["A"]["key"] == "caf\\u00e9"
+                """
+            )
+            # Run it with the same ``configparserenhanced`` package as this test.
+            package_dir = Path(sys.modules["configparserenhanced"].__file__).parents[1]
+            env = dict(os.environ, LC_ALL="C", PYTHONUTF8="0", PYTHONPATH=str(package_dir))
+            result = subprocess.run([sys.executable, "-c", script, filename_utf8], env=env, capture_output=True)
+            self.assertEqual(0, result.returncode, result.stderr.decode())
+
+            # None uses the locale's preferred encoding.
+            parser = ConfigParserEnhanced(filename_default)
+            parser.encoding = None
+            self.assertEqual("value A", parser.configparserdata["A"]["key"])
+
+            for lazy_load in [False, True]:
+                parser = ConfigParserEnhanced(filename_latin1)
+                parser.lazy_load = lazy_load
+                parser.encoding = "latin-1"
+                self.assertDictEqual({"key": "caf\u00e9"}, parser.configparserenhanceddata["SECTION \u00c9"])
+
+                # Changing the encoding resets the data.
+                parser.encoding = "utf-8"
+                self.assertFalse(hasattr(parser, "_configparserdata"))
+                with self.assertRaises(UnicodeDecodeError):
+                    parser.configparserdata["SECTION \u00c9"]["key"]
+
+            with self.assertRaises(TypeError):
+                parser.encoding = 8
+
+        # In-memory sources given as text are always UTF-8.
+        parser = ConfigParserEnhanced(InMemorySource("[A]\nkey: caf\u00e9\n"))
+        parser.encoding = "latin-1"
+        self.assertDictEqual({"key": "caf\u00e9"}, parser.configparserenhanceddata["A"])
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_in_memory_sources(self):
+        """
+        Check loading ``.ini`` contents from strings, bytes and streams, on their
+        own and mixed with files.
+        """
+        import io
+        import tempfile
+
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+        with open(filename_ini, "rb") as ifp:
+            content = ifp.read()
+
+        parser_file = ConfigParserEnhanced(filename_ini)
+        parser_file.exception_control_level = 0
+        expected = parser_file.unroll_to_str()
+
+        text = content.decode("utf-8")
+        for source in [
+            InMemorySource(content),
+            InMemorySource(text),
+            InMemorySource(io.BytesIO(content)),
+            content,
+            text,
+            io.StringIO(text),
+            [io.BytesIO(content)],
+        ]:
+            parser = ConfigParserEnhanced(source)
+            parser.exception_control_level = 0
+            self.assertIsInstance(parser.inifilepath[0], InMemorySource)
+            self.assertEqual(expected, parser.unroll_to_str())
+
+            # In-memory sources never change.
+            self.assertListEqual([], parser.refresh())
+
+        # A stable name is derived from the contents.
+        source = InMemorySource(content)
+        self.assertEqual(source, InMemorySource(text))
+        self.assertEqual(hash(source), hash(InMemorySource(io.StringIO(text))))
+        self.assertRegex(source.name, r"^<in-memory:[0-9a-f]{16}>$")
+        self.assertEqual(source.name, str(source))
+        self.assertNotEqual(source, InMemorySource(content, name="generated"))
+        self.assertNotEqual(source.name, InMemorySource(b"[SECTION]\n").name)
+
+        with self.assertRaises(TypeError):
+            InMemorySource(5)
+        with self.assertRaises(TypeError):
+            InMemorySource(content, name=5)
+
+        # A `str` without a newline is still a path.
+        parser = ConfigParserEnhanced("[SECTION]")
+        self.assertIsInstance(parser.inifilepath[0], Path)
+
+        # Mixed with files, later sources override earlier ones.
+        override = InMemorySource("[BASE-MPI]\nmpi: mpich\n", name="override")
+        parser = ConfigParserEnhanced([filename_ini, override])
+        parser.exception_control_level = 0
+        self.assertListEqual([Path(filename_ini), override], parser.inifilepath)
+        self.assertEqual("mpich", parser.configparserdata["BASE-MPI"]["mpi"])
+
+        # Errors name the source.
+        bad = InMemorySource("[SECTION]\nkey: 1\nkey: 2\n", name="generated-bad")
+        with self.assertRaises(configparser.DuplicateOptionError) as context:
+            ConfigParserEnhanced(bad).configparserdata
+        self.assertIn("generated-bad", str(context.exception))
+
+        # The lazy loader, concurrent loader and the parse cache work with in-memory sources.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for lazy_load, concurrent_load in [(True, False), (False, True)]:
+                parser = ConfigParserEnhanced([filename_ini, InMemorySource(content, name="copy")])
+                parser.exception_control_level = 0
+                parser.lazy_load = lazy_load
+                parser.concurrent_load = concurrent_load
+                parser.cache_dir = tmpdir
+                self.assertEqual(expected, parser.unroll_to_str())
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_use_graph(self):
+        """
+        Check the ``use`` graph index and that each ``use`` cycle is reported once per root section.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 4
+        parser.exception_control_collect = True
+
+        # The graph is built when the file is loaded.
+        parser.configparserdata
+        self.assertTrue(hasattr(parser, "_use_graph"))
+        graph = parser.use_graph
+        self.assertIs(graph, parser.use_graph)
+        self.assertListEqual(parser.configparserdata.sections(), list(graph.sections))
+        self.assertListEqual(["ENV-A", "ENV-B"], graph.dependencies("ENV-C"))
+        self.assertListEqual(["BASE-MPI", "BASE-BLAS"], graph.dependencies("ENV-A"))
+        self.assertListEqual(
+            ["BASE-MPI", "BASE-BLAS", "ENV-A", "ENV-B", "CYCLE-B", "ENV-C", "CYCLE-A"],
+            graph.dependents("BASE-COMPILER", transitive=True)
+        )
+        self.assertListEqual([("CYCLE-A", "CYCLE-B")], graph.cycles)
+
+        order = graph.topological_order()
+        self.assertLess(order.index("BASE-COMPILER"), order.index("BASE-MPI"))
+        self.assertLess(order.index("ENV-A"), order.index("ENV-C"))
+
+        # Each root section that hits the cycle reports it, also when it is parsed again.
+        with patch.object(parser, "exception_control_event", wraps=parser.exception_control_event) as event:
+            parser.parse_section("CYCLE-A")
+            parser.parse_section("CYCLE-B")
+            parser.parse_section("CYCLE-A")
+        self.assertListEqual(["WARNING", "WARNING", "WARNING"], [x[0][0] for x in event.call_args_list])
+
+        events = parser.exception_control_summary()
+        pprint(events)
+        self.assertEqual(2, len(events))
+        self.assertEqual(3, sum(x["count"] for x in events))
+        for event in events:
+            self.assertIn("sections in the cycle: [CYCLE-A], [CYCLE-B]", event["message"])
+
+        # The graph is rebuilt when the file changes.
+        parser.inifilepath = InMemorySource("[A]\nuse B\n[B]\nuse A\n")
+        self.assertListEqual([("A", "B")], parser.use_graph.cycles)
+        parser.exception_control_clear()
+        parser.parse_section("A")
+        self.assertEqual(1, len(parser.exception_control_summary()))
+
+        # In lazy_load mode the graph grows as sections load and `use_graph` loads the rest.
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.lazy_load = True
+        parser.parse_section("ENV-A")
+        self.assertFalse(hasattr(parser, "_use_graph"))
+        parser.parse_section("CYCLE-A")
+        graph_lazy = parser._use_graph
+        self.assertNotIn("ENV-C", graph_lazy)
+        self.assertIs(graph_lazy, parser.use_graph)
+        self.assertListEqual(sorted(graph.sections), sorted(graph_lazy.sections))
+        self.assertListEqual([("CYCLE-A", "CYCLE-B")], graph_lazy.cycles)
+        for section in graph.sections:
+            self.assertListEqual(
+                sorted(graph.dependencies(section)), sorted(graph_lazy.dependencies(section))
+            )
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_parse_engine_equivalence(self):
+        """
+        Check that the ``iterative`` engine calls the handlers in the same order, with
+        the same ``processed_sections``, and gives the same results as the
+        ``recursive`` engine, also for subclasses that override ``_handler_use``.
+        """
+
+        class RecordingParser(ConfigParserEnhanced):
+
+            def __init__(self, filename):
+                super().__init__(filename)
+                self.calls = []
+
+            def _record(self, event, handler_parameters):
+                self.calls.append(
+                    (
+                        event,
+                        handler_parameters.handler_name,
+                        handler_parameters.raw_option,
+                        sorted(handler_parameters.data_internal['processed_sections']),
+                    )
+                )
+
+            def enter_handler(self, handler_parameters):
+                self._record("enter", handler_parameters)
+                super().enter_handler(handler_parameters)
+
+            def exit_handler(self, handler_parameters):
+                self._record("exit", handler_parameters)
+                super().exit_handler(handler_parameters)
+
+            def handler_initialize(self, section_name, handler_parameters) -> int:
+                self._record("initialize", handler_parameters)
+                return super().handler_initialize(section_name, handler_parameters)
+
+            def handler_finalize(self, section_name, handler_parameters) -> int:
+                self._record("finalize", handler_parameters)
+                return super().handler_finalize(section_name, handler_parameters)
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_record(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared.setdefault("record", []).append(section_name)
+                return 0
+
+        class UseOverrideParser(RecordingParser):
+
+            @ConfigParserEnhanced.operation_handler
+            def _handler_use(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared.setdefault("used", []).append(handler_parameters.params[0])
+                return super()._handler_use(section_name, handler_parameters)
+
+        def parse_all(filename, parse_engine, parser_class=RecordingParser):
+            parser = parser_class(filename)
+            parser.exception_control_level = 0
+            parser.parse_engine = parse_engine
+            parser.debug_level = 1
+            parser.debug_sink = StringIO()
+            parser.profile_enabled = True
+            results = {}
+            for section in parser.configparserdata.sections():
+                try:
+                    results[section] = ("OK", parser.parse_section(section))
+                except Exception as ex:
+                    results[section] = (type(ex).__name__, str(ex))
+            loginfo_types = [x['type'] for x in parser._loginfo]
+            profile_calls = {
+                kind: {name: x["calls"] for name, x in entries.items()}
+                for kind, entries in parser.profile_data().items()
+            }
+            return parser, results, (loginfo_types, parser.debug_sink.getvalue(), profile_calls)
+
+        for filename, parser_class in [
+            (self._filename, RecordingParser),
+            (find_config_ini(filename="config_test_configparserenhanced_use_graph.ini"), RecordingParser),
+            (find_config_ini(filename="config_test_configparserenhanced_use_graph.ini"), UseOverrideParser),
+        ]:
+            parser_r, results_r, loginfo_r = parse_all(filename, "recursive", parser_class)
+            parser_i, results_i, loginfo_i = parse_all(filename, "iterative", parser_class)
+
+            self.assertGreater(len(parser_r.calls), 0)
+            self.assertListEqual(parser_r.calls, parser_i.calls)
+            self.assertDictEqual(results_r, results_i)
+            self.assertGreater(len(loginfo_r[0]), 0)
+            self.assertEqual(loginfo_r, loginfo_i)
+            self.assertDictEqual(parser_r.configparserenhanceddata.data, parser_i.configparserenhanceddata.data)
+            self.assertDictEqual(
+                parser_r.configparserenhanceddata._section_closures,
+                parser_i.configparserenhanceddata._section_closures
+            )
+
+        # Both engines call the handlers in this order.
+        source = InMemorySource(
+            "[DEFAULT]\nrecord D: d\n[A]\nkey A: a\nrecord A: a\n[B]\nuse A\nrecord B: b\n"
+            "[C]\nuse B\nuse C\nkey C: c\n"
+        )
+        calls_golden = [
+            ("initialize", "handler_initialize", (None, None), []),
+            ("enter", "handler_initialize", (None, None), []),
+            ("exit", "handler_initialize", (None, None), []),
+            ("enter", "handler_record", ("record D", "d"), ["DEFAULT"]),
+            ("exit", "handler_record", ("record D", "d"), ["DEFAULT"]),
+            ("enter", "_handler_use", ("use B", None), ["C"]),
+            ("enter", "_handler_use", ("use A", None), ["B", "C"]),
+            ("enter", "_generic_option_handler", ("key A", "a"), ["A", "B", "C"]),
+            ("exit", "_generic_option_handler", ("key A", "a"), ["A", "B", "C"]),
+            ("enter", "handler_record", ("record A", "a"), ["A", "B", "C"]),
+            ("exit", "handler_record", ("record A", "a"), ["A", "B", "C"]),
+            ("exit", "_handler_use", ("use A", None), ["B", "C"]),
+            ("enter", "handler_record", ("record B", "b"), ["B", "C"]),
+            ("exit", "handler_record", ("record B", "b"), ["B", "C"]),
+            ("exit", "_handler_use", ("use B", None), ["C"]),
+            ("enter", "_handler_use", ("use C", None), ["C"]),
+            ("exit", "_handler_use", ("use C", None), ["C"]),
+            ("enter", "_generic_option_handler", ("key C", "c"), ["C"]),
+            ("exit", "_generic_option_handler", ("key C", "c"), ["C"]),
+            ("finalize", "handler_finalize", (None, None), ["C"]),
+            ("enter", "handler_finalize", (None, None), ["C"]),
+            ("exit", "handler_finalize", (None, None), ["C"]),
+        ]
+        for parse_engine in ["recursive", "iterative"]:
+            parser = RecordingParser(source)
+            parser.exception_control_level = 0
+            parser.parse_engine = parse_engine
+            data_shared = parser.parse_section("C")
+            self.assertListEqual(calls_golden, parser.calls)
+            self.assertDictEqual({"record": ["DEFAULT", "A", "B"]}, data_shared)
+            self.assertDictEqual({"key A": "a", "key C": "c"}, parser.configparserenhanceddata["C"])
+
+        # Errors in `use`-d sections propagate the same way.
+        source = InMemorySource("[A]\nuse B\n[B]\nuse MISSING\n")
+        for parse_engine in ["recursive", "iterative"]:
+            parser = ConfigParserEnhanced(source)
+            parser.parse_engine = parse_engine
+            with self.assertRaises(KeyError):
+                parser.parse_section("A")
+
+        # The parser's own helpers are not operations.
+        self.assertListEqual(["use"], parser.get_known_operations())
+
+        # Overrides of `_handler_use` are called by both engines and can
+        # return 0 after calling the base handler or return its result.
+        class UseOverrideParser(ConfigParserEnhanced):
+
+            def _handler_use(self, section_name, handler_parameters) -> int:
+                self.used.append(handler_parameters.params[0])
+                super()._handler_use(section_name, handler_parameters)
+                return 0
+
+        class UseOverrideWrappedParser(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.operation_handler
+            def _handler_use(self, section_name, handler_parameters) -> int:
+                self.used.append(handler_parameters.params[0])
+                return super()._handler_use(section_name, handler_parameters)
+
+        source = InMemorySource("[A]\nuse B\n[B]\nkey: B\n")
+        for parser_class in [UseOverrideParser, UseOverrideWrappedParser]:
+            for parse_engine in ["recursive", "iterative"]:
+                parser = parser_class(source)
+                parser.parse_engine = parse_engine
+                parser.used = []
+                parser.parse_section("A")
+                self.assertListEqual(["B"], parser.used)
+                self.assertDictEqual({"key": "B"}, parser.configparserenhanceddata["A"])
+
+        with self.assertRaises(ValueError):
+            parser.parse_engine = "other"
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_parse_engine_deep_chain(self):
+        """
+        Check that the ``iterative`` engine handles ``use`` chains deeper than the
+        recursion limit.
+        """
+        depth = sys.getrecursionlimit() * 2
+        lines = []
+        for i in range(depth):
+            lines.append(f"[S{i}]")
+            if i > 0:
+                lines.append(f"use S{i - 1}")
+            lines.append(f"key{i}: value{i}")
+        source = InMemorySource("\n".join(lines) + "\n")
+
+        parser = ConfigParserEnhanced(source)
+        with self.assertRaises(RecursionError):
+            parser.parse_section(f"S{depth - 1}")
+
+        parser = ConfigParserEnhanced(source)
+        parser.parse_engine = "iterative"
+        parser.parse_section(f"S{depth - 1}")
+        data = parser.configparserenhanceddata[f"S{depth - 1}"]
+        self.assertEqual(depth, len(data))
+        self.assertEqual("value0", data["key0"])
+
+        print("OK")
+        return 0
+
+    def test_ConfigParserEnhanced_section_plans(self):
+        """
+        Check that sections are compiled into plans once, that replaying the plans
+        gives the same results, and that plans are discarded when the data changes.
+        """
+        import tempfile
+
+        parser = ConfigParserEnhanced(self._filename)
+        parser.exception_control_level = 0
+
+        with patch.object(
+            parser, "_tokenize_and_classify_option_key", wraps=parser._tokenize_and_classify_option_key
+        ) as tokenize:
+            parser.configparserenhanceddata.sections(parse=True)
+            num_compiled = tokenize.call_count
+            self.assertGreater(num_compiled, 0)
+            data_compiled = copy.deepcopy(parser.configparserenhanceddata.data)
+
+            # Replaying the plans doesn't tokenize anything.
+            parser.configparserenhanceddata.sections(parse="force")
+            for section in parser.configparserdata.sections():
+                parser.parse_section(section)
+            self.assertEqual(num_compiled, tokenize.call_count)
+            self.assertDictEqual(data_compiled, parser.configparserenhanceddata.data)
+
+        section_plans = parser.configparserenhanceddata._section_plans
+        self.assertSetEqual(set(parser.configparserdata.sections()), set(section_plans.keys()))
+
+        # Changing the delimiters or the file discards the plans.
+        parser.configparser_delimiters = ("=", ":")
+        self.assertDictEqual({}, parser.configparserenhanceddata._section_plans)
+        parser.parse_section("SECTION-A")
+        self.assertIn("SECTION-A", parser.configparserenhanceddata._section_plans)
+        parser.inifilepath = self._filename
+        self.assertDictEqual({}, parser.configparserenhanceddata._section_plans)
+
+        # `refresh()` only discards the plans of the sections that changed.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "plans.ini")
+            with open(filename, "w") as ofp:
+                ofp.write("[A]\nkey: A1\n[B]\nuse A\nkey: B1\n")
+
+            parser = ConfigParserEnhanced(filename)
+            self.assertDictEqual({"key": "B1"}, parser.configparserenhanceddata["B"])
+            plan_b = parser.configparserenhanceddata._section_plans["B"]
+
+            with open(filename, "w") as ofp:
+                ofp.write("[A]\nkey: A2\nother: A2\n[B]\nuse A\nkey: B1\n")
+            os.utime(filename, ns=(0, 0))
+
+            self.assertListEqual(["B"], parser.refresh())
+            self.assertNotIn("A", parser.configparserenhanceddata._section_plans)
+            self.assertIs(plan_b, parser.configparserenhanceddata._section_plans["B"])
+            self.assertDictEqual({"key": "B1", "other": "A2"}, parser.configparserenhanceddata["B"])
+
+        # Overrides of `_locate_handler_method` are called on every visit.
+        class LocateOverrideParser(ConfigParserEnhanced):
+
+            def _locate_handler_method(self, operation) -> tuple:
+                self.located.append(operation)
+                if operation == "record":
+                    return ("handler_record", self.handler_record)
+                return super()._locate_handler_method(operation)
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_record(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared.setdefault("record", []).append(section_name)
+                return 0
+
+        parser = LocateOverrideParser(InMemorySource("[A]\nrecord A: A\n[B]\nuse A\nrecord B: B\n"))
+        parser.located = []
+        self.assertDictEqual({"record": ["A", "B"]}, parser.parse_section("B"))
+        self.assertDictEqual({"record": ["A", "B"]}, parser.parse_section("B"))
+        self.assertListEqual(["use", "record", "record"] * 2, parser.located)
+
         print("OK")
         return 0
 
+    def test_ConfigParserEnhanced_parse_sections(self):
+        """
+        Check that ``parse_sections()`` gives the same results as calling
+        ``parse_section()`` on each section while processing the ``DEFAULT``
+        section only once when it can be shared, and that it calls the handlers
+        with the same ``section_root`` when it can't.
+        """
+
+        class RecordingParser(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_record(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared.setdefault("record", []).append(section_name)
+                return 0
+
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+        with open(filename_ini, "r") as ifp:
+            content = ifp.read().replace("[DEFAULT]\n", "[DEFAULT]\nrecord DEFAULT:\n")
+        source = InMemorySource(content)
+
+        for parse_engine in ["recursive", "iterative"]:
+            parser_single = RecordingParser(source)
+            parser_single.parse_engine = parse_engine
+            sections = parser_single.configparserdata.sections()
+            results_single = {x: parser_single.parse_section(x) for x in sections}
+
+            parser_batch = RecordingParser(source)
+            parser_batch.parse_engine = parse_engine
+            parser_batch.profile_enabled = True
+            results_batch = parser_batch.parse_sections(sections)
+            self.assertListEqual(sections, list(results_batch.keys()))
+
+            # The DEFAULT section is processed once for the whole batch (plus once
+            # more because it is also one of the sections in the batch).
+            self.assertIn("DEFAULT", sections)
+            self.assertEqual(2, parser_batch.profile_data()["section"]["DEFAULT"]["calls"])
+
+            self.assertDictEqual(results_single, results_batch)
+            self.assertEqual("DEFAULT", results_batch["ENV-C"]["record"][0])
+            self.assertDictEqual(results_batch[sections[-1]], parser_batch.parse_section_last_result)
+            self.assertDictEqual(
+                parser_single.configparserenhanceddata.data, parser_batch.configparserenhanceddata.data
+            )
+            self.assertDictEqual(
+                parser_single.configparserenhanceddata._section_closures,
+                parser_batch.configparserenhanceddata._section_closures
+            )
+            self.assertNotIn(
+                parser_batch._internal_default_section_name, parser_batch.configparserenhanceddata.data
+            )
+
+        # Each section gets its own results.
+        results_batch["BASE-MPI"]["record"].append("changed")
+        self.assertNotIn("changed", results_batch["BASE-BLAS"]["record"])
+
+        parser = RecordingParser(source)
+        with self.assertRaises(TypeError):
+            parser.parse_sections("ENV-A")
+        with self.assertRaises(ValueError):
+            parser.parse_sections(["ENV-A", ""])
+        with self.assertRaises(KeyError):
+            parser.parse_sections(["ENV-A", "MISSING"])
+
+        # Handlers see the same `section_root` in a batch as with parse_section(), and
+        # assert_file_all_sections_handled parses the unparsed sections in one batch.
+        class RootRecordingParser(ConfigParserEnhanced):
+
+            def handler_initialize(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared["init"] = [handler_parameters.section_root]
+                handler_parameters.data_shared["ops"] = []
+                return 0
+
+            @ConfigParserEnhanced.operation_handler
+            def handler_record(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared["ops"].append(
+                    (handler_parameters.section_root, handler_parameters.params[0])
+                )
+                return 0
+
+        source = InMemorySource("[DEFAULT]\nrecord d:\n[A]\nrecord a:\n[B]\nrecord b:\n")
+
+        parser = RootRecordingParser(source)
+        result_single = parser.parse_section("A")
+        self.assertDictEqual({"init": ["A"], "ops": [("A", "d"), ("A", "a")]}, result_single)
+
+        parser = RootRecordingParser(source)
+        results_batch = parser.parse_sections(["A", "B"])
+        self.assertDictEqual(result_single, results_batch["A"])
+        self.assertDictEqual({"init": ["B"], "ops": [("B", "d"), ("B", "b")]}, results_batch["B"])
+
+        # Handlers that opt out of the section cache keep the DEFAULT section per root.
+        class OptoutRecordingParser(ConfigParserEnhanced):
+
+            @ConfigParserEnhanced.section_cache_optout
+            @ConfigParserEnhanced.operation_handler
+            def handler_record(self, section_name, handler_parameters) -> int:
+                handler_parameters.data_shared.setdefault("ops", []).append(
+                    (handler_parameters.section_root, handler_parameters.params[0])
+                )
+                return 0
+
+        parser = OptoutRecordingParser(source)
+        self.assertFalse(parser._parse_sections_can_share_default())
+        self.assertDictEqual(
+            {
+                "A": {"ops": [("A", "d"), ("A", "a")]},
+                "B": {"ops": [("B", "d"), ("B", "b")]},
+            },
+            parser.parse_sections(["A", "B"]),
+        )
+        self.assertFalse(RootRecordingParser(source)._parse_sections_can_share_default())
+        self.assertTrue(RecordingParser(source)._parse_sections_can_share_default())
+        parser = RecordingParser(InMemorySource("[DEFAULT]\nuse A\n[A]\n"))
+        self.assertFalse(parser._parse_sections_can_share_default())
+
+        parser = RootRecordingParser(source)
+        parser.parse_section("A")
+        with patch.object(parser, "parse_sections", wraps=parser.parse_sections) as parse_sections:
+            self.assertEqual(0, parser.assert_file_all_sections_handled())
+            parse_sections.assert_called_once_with(["DEFAULT", "B"])
+        self.assertDictEqual(results_batch["B"], parser.parse_section_last_result)
+
+        # Unhandled options are found the same way as when each section is parsed on its own.
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+        parser_single = ConfigParserEnhanced(filename_ini)
+        parser_single.exception_control_level = 0
+        for section in parser_single.configparserdata.sections():
+            parser_single.parse_section(section)
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            num_unhandled = parser_single.assert_file_all_sections_handled()
+            output_single = fake_out.getvalue()
+        self.assertGreater(num_unhandled, 0)
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 0
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            self.assertEqual(num_unhandled, parser.assert_file_all_sections_handled())
+            self.assertEqual(output_single, fake_out.getvalue())
+
+        print("OK")
+        return 0
 
 
 # ===========================================================
@@ -2513,6 +4295,82 @@ class ConfigParserEnhancedDataTest(TestCase):
         print("OK")
         return
 
+    def test_ConfigParserDataEnhanced_affected_sections(self):
+        """
+        Test `affected_sections()` against the `use` closures found by parsing the sections.
+        """
+        filename_ini = find_config_ini(filename="config_test_configparserenhanced_use_graph.ini")
+
+        parser = ConfigParserEnhanced(filename_ini)
+        parser.exception_control_level = 0
+        data = parser.configparserenhanceddata
+
+        self.assertListEqual(["BASE-MPI", "ENV-A", "ENV-B", "ENV-C"], data.affected_sections("BASE-MPI"))
+        self.assertListEqual(["CYCLE-A", "CYCLE-B"], data.affected_sections("CYCLE-B"))
+        self.assertListEqual(["ENV-B", "ENV-C"], data.affected_sections("ENV-B", "cc"))
+        self.assertListEqual([], data.affected_sections("ENV-A", "cc"))
+        self.assertListEqual([], data.affected_sections(option="no such option"))
+        self.assertListEqual(
+            ["BASE-MPI", "ENV-A", "ENV-B", "ENV-C"], data.affected_sections(option="record BASE-MPI")
+        )
+
+        # No sections are parsed to answer the queries.
+        self.assertEqual(0, len(data._sections_checked))
+
+        # The closures recorded by parsing every section give the same answers.
+        data.sections(parse=True)
+        closures = data._section_closures
+        for section in data.sections():
+            expected = [x for x in data.sections() if section in closures[x]]
+            self.assertListEqual(expected, data.affected_sections(section), section)
+
+        # Everything depends on the DEFAULT section.
+        self.assertListEqual(list(data.sections()), data.affected_sections("DEFAULT"))
+
+        with self.assertRaises(KeyError):
+            data.affected_sections("NO SUCH SECTION")
+        with self.assertRaises(ValueError):
+            data.affected_sections()
+
+        print("OK")
+        return
+
+    def test_ConfigParserEnhancedData_owner_options(self):
+        """
+        Test that the data object uses the owner's collect mode and debug sink settings.
+        """
+        messages = []
+
+        parser = ConfigParserEnhanced(self._filename)
+        parser.exception_control_level = 3
+        parser.exception_control_collect = True
+        parser.exception_control_collect_capacity = 5
+        parser.debug_sink = messages.append
+        parser.debug_categories = {"data": 2}
+
+        data = parser.configparserenhanceddata
+
+        self.assertTrue(data.exception_control_collect)
+        self.assertEqual(5, data.exception_control_collect_capacity)
+        self.assertEqual(messages.append, data.debug_sink)
+        self.assertDictEqual({"data": 2}, data.debug_categories)
+
+        # Events raised from the data object are recorded by the owner.
+        for _ in range(2):
+            data.exception_control_event("WARNING", ValueError, "warning from the data object")
+        summary = parser.exception_control_summary()
+        self.assertEqual(1, len(summary))
+        self.assertEqual("warning from the data object", summary[0]["message"])
+        self.assertEqual(2, summary[0]["count"])
+        self.assertListEqual([], data.exception_control_summary())
+
+        # Messages from the data object go to the owner's sink.
+        data.debug_message(2, "message from the data object", useprefix=False, category="data")
+        self.assertListEqual(["message from the data object\n"], messages)
+
+        print("OK")
+        return 0
+
 
 
 # EOF
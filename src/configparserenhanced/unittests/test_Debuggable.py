@@ -44,6 +44,7 @@
 """
 from __future__ import print_function
 
+import logging
 import sys
 
 
@@ -175,6 +176,197 @@ class DebuggableTest(TestCase):
         print("OK")
         return 0
 
+    def test_Debuggable_method_debug_message_callable(self):
+        """
+        Test that ``lazy`` messages are only evaluated if they will be printed.
+        """
+
+        class testme(Debuggable):
+
+            def __init__(self):
+                pass
+                return
+
+        inst_testme = testme()
+
+        message_f = Mock(return_value="This is a test message!")
+
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            inst_testme.debug_message(1, message_f, lazy=True)
+            self.assertEqual(fake_out.getvalue(), "")
+        message_f.assert_not_called()
+
+        inst_testme.debug_level = 1
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            inst_testme.debug_message(1, message_f, lazy=True)
+            self.assertEqual(fake_out.getvalue(), "[D-1] This is a test message!\n")
+        message_f.assert_called_once()
+
+        print("OK")
+        return 0
+
+    def test_Debuggable_method_debug_message_callable_not_lazy(self):
+        """
+        Test that callable messages are printed, not called, unless ``lazy`` is enabled.
+        """
+
+        class testme(Debuggable):
+
+            def __init__(self):
+                pass
+                return
+
+        class message_t(object):
+
+            def __init__(self):
+                self.calls = 0
+
+            def __call__(self):
+                self.calls += 1
+                return "called"
+
+            def __str__(self):
+                return "This is a test message!"
+
+        inst_testme = testme()
+        inst_testme.debug_level = 1
+
+        message = message_t()
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            inst_testme.debug_message(1, message)
+            self.assertEqual(fake_out.getvalue(), "[D-1] This is a test message!\n")
+        self.assertEqual(message.calls, 0)
+
+        print("OK")
+        return 0
+
+    def test_Debuggable_method_debug_enabled(self):
+
+        class testme(Debuggable):
+
+            def __init__(self):
+                pass
+                return
+
+        inst_testme = testme()
+
+        self.assertTrue(inst_testme.debug_enabled(0))
+        self.assertFalse(inst_testme.debug_enabled(1))
+
+        inst_testme.debug_level = 2
+        self.assertTrue(inst_testme.debug_enabled(1))
+        self.assertTrue(inst_testme.debug_enabled(2))
+        self.assertFalse(inst_testme.debug_enabled(3))
+
+        print("OK")
+        return 0
+
+    def test_Debuggable_property_debug_categories(self):
+        """
+        Test that ``debug_categories`` sets the level of categories of messages.
+        """
+
+        class testme(Debuggable):
+
+            def __init__(self):
+                pass
+                return
+
+        inst_testme = testme()
+        self.assertDictEqual({}, inst_testme.debug_categories)
+
+        with self.assertRaises(TypeError):
+            inst_testme.debug_categories = ["section"]
+
+        inst_testme.debug_level = 1
+        inst_testme.debug_categories = {"section": 3, "handler": 0}
+
+        self.assertTrue(inst_testme.debug_enabled(3, "section"))
+        self.assertFalse(inst_testme.debug_enabled(1, "handler"))
+        self.assertTrue(inst_testme.debug_enabled(1, "other"))
+        self.assertFalse(inst_testme.debug_enabled(2, "other"))
+
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            inst_testme.debug_message(3, "A", category="section")
+            inst_testme.debug_message(1, "B", category="handler")
+            inst_testme.debug_message(1, "C", category="other")
+            inst_testme.debug_message(1, "D")
+            inst_testme.debug_message(2, "E")
+            self.assertEqual(fake_out.getvalue(), "[D-3] A\n[D-1] C\n[D-1] D\n")
+
+        print("OK")
+        return 0
+
+    def test_Debuggable_property_debug_sink(self):
+        """
+        Test sending messages to a file object, a callable or a ``logging.Logger``.
+        """
+
+        class testme(Debuggable):
+
+            def __init__(self):
+                pass
+                return
+
+        inst_testme = testme()
+        inst_testme.debug_level = 2
+        self.assertIsNone(inst_testme.debug_sink)
+
+        with self.assertRaises(TypeError):
+            inst_testme.debug_sink = 5
+
+        # File objects are written to and are not flushed.
+        sink = StringIO()
+        sink.flush = Mock()
+        inst_testme.debug_sink = sink
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            inst_testme.debug_message(0, "A")
+            inst_testme.debug_message(1, "B", end="")
+            inst_testme.debug_message(3, "C")
+            self.assertEqual(fake_out.getvalue(), "")
+        self.assertEqual(sink.getvalue(), "A\n[D-1] B")
+        sink.flush.assert_not_called()
+
+        # Callables are called with the text of each message.
+        messages = []
+        inst_testme.debug_sink = messages.append
+        inst_testme.debug_message(2, "D")
+        self.assertListEqual(messages, ["[D-2] D\n"])
+
+        # Loggers get messages at DEBUG (INFO for level 0) and callable
+        # messages are not called if the logger drops them.
+        class ListHandler(logging.Handler):
+
+            def __init__(self):
+                super().__init__()
+                self.records = []
+
+            def emit(self, record):
+                self.records.append((record.levelname, record.getMessage()))
+
+        logger = logging.getLogger("test_Debuggable_property_debug_sink")
+        logger.propagate = False
+        handler = ListHandler()
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        inst_testme.debug_sink = logger
+
+        message_f = Mock(return_value="E")
+        inst_testme.debug_message(0, "F")
+        inst_testme.debug_message(1, message_f, lazy=True)
+        message_f.assert_not_called()
+        self.assertListEqual(handler.records, [("INFO", "F")])
+
+        logger.setLevel(logging.DEBUG)
+        inst_testme.debug_message(1, message_f, lazy=True)
+        message_f.assert_called_once()
+        self.assertListEqual(handler.records, [("INFO", "F"), ("DEBUG", "[D-1] E")])
+
+        logger.removeHandler(handler)
+
+        print("OK")
+        return 0
+
 
 
 # EOF
@@ -54,6 +54,7 @@ import os
 
 sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from pprint import pprint
 import unittest
 from unittest import TestCase
 
@@ -497,6 +498,140 @@ class ExceptionControlTest(TestCase):
         print("OK")
         return
 
+    def test_ExceptionControl_method_exception_control_event_fast_path(self):
+        """
+        Test that events that are not raised don't create exception objects and
+        that the check that the exception type can be raised is only done once.
+        """
+
+        class CountingError(Exception):
+            instances = 0
+
+            def __init__(self, *args):
+                CountingError.instances += 1
+                super().__init__(*args)
+
+        class testme(ExceptionControl):
+
+            def __init__(self):
+                pass
+                return
+
+        inst_testme = testme()
+        inst_testme.exception_control_silent_warnings = True
+
+        # The level table is shared rather than rebuilt for every event.
+        self.assertIs(
+            inst_testme._exception_control_map_event_to_level_req,
+            testme._EXCEPTION_CONTROL_MAP_EVENT_TO_LEVEL_REQ
+        )
+
+        for level in range(2):
+            inst_testme.exception_control_level = level
+            for i in range(10):
+                inst_testme.exception_control_event("WARNING", CountingError, message="message text")
+                inst_testme.exception_control_event("SILENT", CountingError, message="message text")
+
+        # One instance is created by the (cached) check that `CountingError` can be raised.
+        self.assertEqual(1, CountingError.instances)
+
+        inst_testme.exception_control_level = 5
+        with self.assertRaises(CountingError):
+            inst_testme.exception_control_event("WARNING", CountingError, message="message text")
+        self.assertEqual(2, CountingError.instances)
+
+        print("OK")
+        return
+
+    def test_ExceptionControl_collect(self):
+        """
+        Test *collect mode* records and deduplicates the events that are not raised.
+        """
+
+        class testme(ExceptionControl):
+
+            def __init__(self):
+                pass
+                return
+
+            def event_warning(self, message="message text"):
+                self.exception_control_event("WARNING", ValueError, message=message)
+
+            def event_minor(self):
+                self.exception_control_event("MINOR", TypeError, message="minor text")
+
+        inst_testme = testme()
+        self.assertFalse(inst_testme.exception_control_collect)
+        with self.assertRaises(TypeError):
+            inst_testme.exception_control_collect = 1
+
+        inst_testme.exception_control_level = 3
+        inst_testme.exception_control_collect = True
+
+        with patch('sys.stdout', new=StringIO()) as fake_out:
+            with patch("traceback.format_stack") as mock_format_stack:
+                for i in range(3):
+                    inst_testme.event_warning()
+                inst_testme.event_warning(message="other text")
+                inst_testme.event_minor()
+                inst_testme.exception_control_event("SILENT", ValueError, message="silent text")
+            mock_format_stack.assert_not_called()
+            self.assertEqual("", fake_out.getvalue())
+
+        summary = inst_testme.exception_control_summary()
+        pprint(summary)
+        self.assertEqual(3, len(summary))
+        self.assertEqual("WARNING", summary[0]["event_type"])
+        self.assertEqual("ValueError", summary[0]["exception"])
+        self.assertEqual("message text", summary[0]["message"])
+        self.assertEqual("event_warning", summary[0]["function"])
+        self.assertEqual(3, summary[0]["count"])
+        self.assertEqual("other text", summary[1]["message"])
+        self.assertEqual(1, summary[1]["count"])
+        self.assertEqual("MINOR", summary[2]["event_type"])
+
+        report = inst_testme.exception_control_report()
+        print(report)
+        self.assertEqual(3, report.count("!! EXCEPTION SKIPPED"))
+        self.assertIn("!! EXCEPTION SKIPPED (x3)", report)
+        self.assertIn("!! Message    : message text", report)
+        self.assertIn("!! Call Stack:", report)
+        self.assertIn("in event_warning", report)
+        self.assertIn("!! Increase `exception_control_level` to 5 to raise this exception.", report)
+        self.assertNotIn("!! Call Stack:", inst_testme.exception_control_report(stack=False))
+
+        inst_testme.exception_control_compact_warnings = True
+        report = inst_testme.exception_control_report()
+        print(report)
+        self.assertRegex(
+            report, r"!! EXCEPTION SKIPPED \(WARNING : ValueError\) @ File .*, in event_warning \(x3\)"
+        )
+
+        # Events that are raised are not recorded.
+        with self.assertRaises(ValueError):
+            inst_testme.exception_control_event("SERIOUS", ValueError, message="serious text")
+        self.assertEqual(3, len(inst_testme.exception_control_summary()))
+
+        # The store is bounded, repeats of recorded events are still counted.
+        inst_testme.exception_control_clear()
+        self.assertListEqual([], inst_testme.exception_control_summary())
+        self.assertEqual("", inst_testme.exception_control_report())
+
+        with self.assertRaises(ValueError):
+            inst_testme.exception_control_collect_capacity = 0
+        inst_testme.exception_control_collect_capacity = 2
+        for i in range(5):
+            inst_testme.event_warning(message=f"message {i}")
+            inst_testme.event_warning(message="message 0")
+
+        summary = inst_testme.exception_control_summary()
+        self.assertEqual(2, len(summary))
+        self.assertEqual(6, summary[0]["count"])
+        self.assertIn("3 event(s) not recorded", inst_testme.exception_control_report())
+
+        print("OK")
+        return
+
     def test_ExceptionControl_method_exception_control_event_silent_warnings(self):
 
         class testme(ExceptionControl):
@@ -291,6 +291,64 @@ class HandlerParametersTest(TestCase):
 
         return 0
 
+    def test_HandlerParameters_slots(self):
+        """
+        Validate that ``HandlerParameters`` uses ``__slots__`` and can be reset.
+        """
+        hp = HandlerParameters()
+
+        # Slots mean there's no per-object ``__dict__``.
+        self.assertFalse(hasattr(hp, "__dict__"))
+        with self.assertRaises(AttributeError):
+            hp.not_a_field = 1
+
+        hp.section_root = "SECTION"
+        hp.raw_option = ("key", "value")
+        hp.params = ["A", "B"]
+        hp.data_shared["foo"] = "bar"
+        data_shared = hp.data_shared
+
+        # Calling ``__init__()`` again resets the object to its defaults.
+        hp.__init__()
+        self.assertIsNone(hp.section_root)
+        self.assertTupleEqual(hp.raw_option, (None, None))
+        self.assertListEqual(hp.params, [])
+        self.assertDictEqual(hp.data_shared, {})
+
+        # The old data is not modified by the reset.
+        self.assertIsNot(hp.data_shared, data_shared)
+        self.assertDictEqual(data_shared, {"foo": "bar"})
+
+        return 0
+
+    def test_HandlerParameters_defaults_from_typed_property(self):
+        """
+        Validate that the slots and the values set by ``__init__()`` come from the
+        ``typed_property`` declarations, including those added by subclasses.
+        """
+        from ..TypedProperty import TypedProperty
+        from ..TypedProperty import typed_property
+
+        class HandlerParametersTest(HandlerParameters):
+            extra = typed_property("extra", list, default=["x"])
+
+        typed_props = {k: v for k, v in vars(HandlerParameters).items() if isinstance(v, TypedProperty)}
+        self.assertEqual(2 * len(typed_props), len(HandlerParameters.__slots__))
+
+        hp = HandlerParametersTest()
+        for name, typed_prop in typed_props.items():
+            self.assertEqual(typed_prop.default, getattr(hp, name))
+            self.assertFalse(getattr(hp, f"_{name}_is_set"))
+
+        hp.extra.append("y")
+        hp.extra = ["z"]
+        self.assertTrue(hp._extra_is_set)
+        hp.__init__()
+        self.assertListEqual(["x"], hp.extra)
+        self.assertFalse(hp._extra_is_set)
+
+        return 0
+
 
 
 # EOF
@@ -74,6 +74,7 @@ except ImportError:
     from io import StringIO
 
 from configparserenhanced.TypedProperty import typed_property
+from configparserenhanced.TypedProperty import TypedProperty
 
 from .common import *
 
@@ -366,6 +367,61 @@ class TypedPropertyTest(TestCase):
 
         return 0
 
+    def test_TypedProperty_default_is_copied(self):
+        """
+        Test that mutable defaults are copied for each object.
+        """
+
+        class TestClass(object):
+            data = typed_property("data", expected_type=list, default=[1, 2])
+
+        obj1 = TestClass()
+        obj2 = TestClass()
+
+        obj1.data.append(3)
+        self.assertListEqual([1, 2, 3], obj1.data)
+        self.assertListEqual([1, 2], obj2.data)
+        self.assertListEqual([1, 2], TestClass.data.default)
+
+        print("OK")
+        return 0
+
+    def test_TypedProperty_descriptor(self):
+        """
+        Test the ``TypedProperty`` descriptor that implements ``typed_property``.
+        """
+
+        class TestClass(object):
+            data = typed_property("data", expected_type=int, default=None, req_assign_before_use=True)
+            other = TypedProperty(expected_type=(int, float), default=1.5)
+
+        # Reading the property from the class gives the descriptor.
+        self.assertIsInstance(TestClass.data, TypedProperty)
+        self.assertEqual(int, TestClass.data.expected_type[0])
+
+        # The name comes from the class attribute if it isn't given.
+        self.assertEqual("other", TestClass.other.name)
+
+        obj = TestClass()
+        self.assertEqual(1.5, obj.other)
+        self.assertFalse(obj._other_is_set)
+        obj.other = 2
+        self.assertEqual(2, obj._other)
+        self.assertTrue(obj._other_is_set)
+
+        with self.assertRaises(TypeError):
+            obj.other = "2"
+
+        # A value stored without assignment through the property is not *assigned*.
+        obj._data = 5
+        with self.assertRaises(UnboundLocalError):
+            obj.data
+        obj.data = 6
+        self.assertEqual(6, obj.data)
+
+        print("OK")
+        return 0
+
 
 
 # EOF
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; mode: python; py-indent-offset: 4; py-continuation-offset: 4 -*-
+#===============================================================================
+# Copyright Notice
+# ----------------
+# Copyright 2021 National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS,
+# the U.S. Government retains certain rights in this software.
+#
+# License (3-Clause BSD)
+# ----------------------
+# Copyright 2021 National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS,
+# the U.S. Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above
+#    copyright notice, this list of conditions and the following
+#    disclaimer in the documentation and/or other materials provided
+#    with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON
+# ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#===============================================================================
+"""
+"""
+from __future__ import print_function
+import sys
+
+
+sys.dont_write_bytecode = True
+
+import os
+
+
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pprint import pprint
+
+import unittest
+from unittest import TestCase
+
+from configparserenhanced import UseGraph
+
+from .common import *
+
+#===============================================================================
+#
+# General Utility Functions
+#
+#===============================================================================
+
+#===============================================================================
+#
+# Mock Helpers
+#
+#===============================================================================
+
+#===============================================================================
+#
+# Tests
+#
+#===============================================================================
+
+
+
+class UseGraphTest(TestCase):
+    """
+    Main test driver for the UseGraph class
+    """
+
+    def setUp(self):
+        print("")
+        return
+
+    def test_UseGraph_dependencies_dependents(self):
+        """
+        Test direct and transitive ``dependencies()`` and ``dependents()`` on a diamond.
+        """
+        sections = ["BASE", "MPI", "BLAS", "ENV"]
+        edges = {
+            "MPI": ["BASE"],
+            "BLAS": ["BASE", "MISSING"],
+            "ENV": ["MPI", "BLAS", "MPI"],
+        }
+        graph = UseGraph(sections, edges)
+
+        self.assertEqual(("BASE", "MPI", "BLAS", "ENV"), graph.sections)
+        self.assertEqual(2, graph.section_id("BLAS"))
+        self.assertEqual(((), (0, ), (0, ), (1, 2)), graph.adjacency)
+
+        self.assertListEqual(["MPI", "BLAS"], graph.dependencies("ENV"))
+        self.assertListEqual(["MPI", "BLAS", "BASE"], graph.dependencies("ENV", transitive=True))
+        self.assertListEqual([], graph.dependencies("BASE", transitive=True))
+
+        self.assertListEqual(["MPI", "BLAS"], graph.dependents("BASE"))
+        self.assertListEqual(["MPI", "BLAS", "ENV"], graph.dependents("BASE", transitive=True))
+        self.assertListEqual([], graph.dependents("ENV"))
+
+        self.assertListEqual([], graph.cycles)
+        self.assertIsNone(graph.cycle("ENV"))
+        self.assertListEqual(["BASE", "MPI", "BLAS", "ENV"], graph.topological_order())
+
+        with self.assertRaises(KeyError):
+            graph.dependencies("MISSING")
+
+        print("OK")
+        return 0
+
+    def test_UseGraph_cycles(self):
+        """
+        Test that strongly connected components are found and ordered.
+        """
+        sections = ["A", "B", "C", "D", "E", "SELF"]
+        edges = {
+            "A": ["B"],
+            "B": ["C", "E"],
+            "C": ["A"],
+            "D": ["A"],
+            "SELF": ["SELF"],
+        }
+        graph = UseGraph(sections, edges)
+
+        pprint(graph.components)
+        self.assertListEqual([("E", ), ("A", "B", "C"), ("D", ), ("SELF", )], graph.components)
+        self.assertListEqual([("A", "B", "C"), ("SELF", )], graph.cycles)
+        self.assertEqual(("A", "B", "C"), graph.cycle("B"))
+        self.assertEqual(("SELF", ), graph.cycle("SELF"))
+        self.assertIsNone(graph.cycle("D"))
+
+        # Every section comes after the sections it uses (outside of its own cycle).
+        order = graph.topological_order()
+        self.assertListEqual(["E", "A", "B", "C", "D", "SELF"], order)
+
+        self.assertListEqual(["B", "C", "E", "A"], graph.dependencies("A", transitive=True))
+        self.assertListEqual(["SELF"], graph.dependencies("SELF", transitive=True))
+
+        print("OK")
+        return 0
+
+    def test_UseGraph_bitsets(self):
+        """
+        Test the closure, dependents and option bitsets.
+        """
+        sections = ["BASE", "MPI", "BLAS", "ENV", "A", "B"]
+        edges = {
+            "MPI": ["BASE"],
+            "BLAS": ["BASE"],
+            "ENV": ["MPI", "BLAS"],
+            "A": ["B"],
+            "B": ["A", "BLAS"],
+        }
+        options = {
+            "BASE": ["cc", "cflags"],
+            "MPI": ["cflags"],
+            "A": ["cc"],
+        }
+        graph = UseGraph(sections, edges, options)
+
+        self.assertEqual(0b001111, graph.closure_bitset("ENV"))
+        self.assertEqual(0b110101, graph.closure_bitset("A"))
+        self.assertEqual(graph.closure_bitset("A"), graph.closure_bitset("B"))
+        self.assertEqual(0b111111, graph.dependents_bitset("BASE"))
+        self.assertEqual(0b001010, graph.dependents_bitset("MPI"))
+        self.assertEqual(0b110000, graph.dependents_bitset("A"))
+
+        self.assertEqual(0b010001, graph.option_bitset("cc"))
+        self.assertEqual(0b000011, graph.option_bitset("cflags"))
+        self.assertEqual(0, graph.option_bitset("missing"))
+
+        self.assertListEqual(["BASE", "BLAS", "A", "B"], graph.sections_from_bitset(graph.closure_bitset("A")))
+        self.assertListEqual([], graph.sections_from_bitset(0))
+
+        # The bitsets agree with the transitive queries.
+        for section in sections:
+            self.assertSetEqual(
+                set(graph.dependencies(section, transitive=True)) | {section},
+                set(graph.sections_from_bitset(graph.closure_bitset(section)))
+            )
+            self.assertSetEqual(
+                set(graph.dependents(section, transitive=True)) | {section},
+                set(graph.sections_from_bitset(graph.dependents_bitset(section)))
+            )
+
+        print("OK")
+        return 0
+
+    def test_UseGraph_add_sections(self):
+        """
+        Test that a graph grown with ``add_sections()`` matches one built in one go.
+        """
+        sections = ["BASE", "MPI", "BLAS", "ENV", "A", "B"]
+        edges = {
+            "MPI": ["BASE"],
+            "BLAS": ["BASE"],
+            "ENV": ["MPI", "BLAS"],
+            "A": ["B"],
+            "B": ["A", "BLAS"],
+        }
+        options = {
+            "BASE": ["cc"],
+            "A": ["cc"],
+        }
+        graph_full = UseGraph(sections, edges, options)
+
+        graph = UseGraph()
+        self.assertEqual((), graph.sections)
+        self.assertListEqual([], graph.cycles)
+
+        # Links to sections that are not in the graph yet are added with the section.
+        graph.add_sections(["ENV", "A"], edges, options)
+        self.assertListEqual([], graph.dependencies("ENV"))
+        self.assertListEqual([], graph.cycles)
+        self.assertEqual(0b10, graph.closure_bitset("A"))
+
+        graph.add_sections(["B", "A"], edges, options)
+        self.assertEqual(("ENV", "A", "B"), graph.sections)
+        self.assertListEqual([("A", "B")], graph.cycles)
+        self.assertEqual(0b110, graph.closure_bitset("A"))
+        self.assertNotIn("MPI", graph)
+
+        graph.add_sections(["MPI", "BLAS", "BASE"], edges, options)
+        self.assertIn("MPI", graph)
+        self.assertListEqual(graph_full.cycles, graph.cycles)
+        for section in sections:
+            self.assertListEqual(graph_full.dependencies(section), graph.dependencies(section))
+            self.assertListEqual(sorted(graph_full.dependents(section)), sorted(graph.dependents(section)))
+            self.assertListEqual(
+                graph_full.sections_from_bitset(graph_full.closure_bitset(section)),
+                sorted(graph.sections_from_bitset(graph.closure_bitset(section)), key=sections.index)
+            )
+        self.assertListEqual(["A", "BASE"], sorted(graph.sections_from_bitset(graph.option_bitset("cc"))))
+
+        print("OK")
+        return 0
+
+    def test_UseGraph_deep_chain(self):
+        """
+        Test that a very deep ``use`` chain doesn't hit the recursion limit.
+        """
+        depth = sys.getrecursionlimit() * 2
+        sections = [f"S{i}" for i in range(depth)]
+        edges = {f"S{i}": [f"S{i - 1}"] for i in range(1, depth)}
+        edges["S0"] = [f"S{depth - 1}"]
+
+        graph = UseGraph(sections, edges)
+        self.assertEqual(1, len(graph.cycles))
+        self.assertEqual(depth, len(graph.cycles[0]))
+
+        del edges["S0"]
+        graph = UseGraph(sections, edges)
+        self.assertListEqual([], graph.cycles)
+        self.assertListEqual(sections, graph.topological_order())
+
+        print("OK")
+        return 0
+
+
+
+# EOF